@@ -24,7 +24,7 @@ def get_nn_backend():
     Returns
     -------
     str
-        Either ``theano`` or ``tensorflow``
+        Either ``theano``, ``tensorflow`` or ``numpy``
     """
     return _NN_BACKEND
 
@@ -55,15 +55,20 @@ def get_nn_dtype():
 def set_nn_backend(backend):
     """Set NN module backend
 
-    .. note:: Backend must be set before ``luchador.nn module`` is imported.
+    .. note::
+        Backend must be set before it is loaded, that is, before the
+        components of ``luchador.nn`` such as ``Session`` are accessed.
+        ``luchador.nn`` module itself can be imported beforehand.
 
     Parameters
     ----------
     backend : str
-        Either ``theano`` or ``tensorflow``
+        Either ``theano``, ``tensorflow`` or ``numpy``.
+        ``numpy`` backend only supports inference.
     """
-    if backend not in ('theano', 'tensorflow'):
-        raise ValueError('NN Backend must be either "theano" or "tensorflow"')
+    if backend not in ('theano', 'tensorflow', 'numpy'):
+        raise ValueError(
+            'NN Backend must be either "theano", "tensorflow" or "numpy"')
 
     global _NN_BACKEND
     _NN_BACKEND = backend
@@ -83,7 +88,7 @@ def set_nn_conv_format(format_):
     if format_ not in ('NCHW', 'NHWC'):
         raise ValueError('Convolution format must b either "NCHW" or "NHWC"')
 
-    if _NN_BACKEND == 'theano':
+    if _NN_BACKEND in ('theano', 'numpy'):
         warnings.warn('Convolution format only affects "tensorflow" backend')
 
     global _NN_CONV_FORMAT
@@ -91,10 +96,10 @@ def set_nn_conv_format(format_):
 
 
 def set_nn_dtype(dtype):
-    """Set default dtype for creating variables in Tensorflow backend
+    """Set default dtype for creating variables in Tensorflow/NumPy backend
 
     .. note::
-        This dtype has affect only in Tensorflow backend.
+        This dtype has affect only in Tensorflow and NumPy backend.
         To set default dtype of Theano backend, use ``floatX``.
 
     Parameters
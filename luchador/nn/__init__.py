@@ -1,16 +1,64 @@
-"""Initialize Neural Network module and load backend"""
+"""Initialize Neural Network module and load backend
+
+Submodules are imported on the first access to their attributes, so that
+``import luchador.nn`` does not import backend, h5py nor Tensorflow until
+they are needed. Backend is loaded when the attributes of ``core``, such as
+``Session`` or ``layer``, are accessed.
+"""
 from __future__ import absolute_import
 
+import sys
 import logging
 
-# pylint: disable=wildcard-import
 import luchador
-from .core import *  # noqa
-from .util import *  # noqa
-from .saver import Saver  # noqa
-from .summary import SummaryWriter  # noqa
-from .model import get_model, fetch_model  # noqa
+from luchador.util import LazyModule
 
 _LG = logging.getLogger(__name__)
 _LG.info('Luchador Version: %s', luchador.__version__)
 _LG.info('Luchador NN backend: %s', luchador.get_nn_backend())
+
+_SUBMODULES = [
+    'core', 'util', 'saver', 'dataset', 'pipeline', 'summary', 'monitor',
+    'event', 'model', 'estimator',
+]
+
+_ATTRIBUTES = {
+    '.core': [
+        'VariableScope', 'variable_scope', 'get_variable_scope', 'name_scope',
+        'fetch_node', 'fetch_layer', 'fetch_initializer', 'fetch_optimizer',
+        'fetch_cost',
+        'get_input', 'get_variable', 'get_tensor', 'get_operation', 'get_grad',
+        'namespace', 'get_namespace', 'reset_namespace', 'release',
+        'ops',
+        'Input', 'Variable', 'Tensor', 'Operation', 'make_variable',
+        'NormalRandom', 'UniformRandom',
+        'Session', 'get_session',
+        'initializer', 'optimizer', 'layer', 'cost',
+    ],
+    '.util': [
+        'get_model_config', 'make_io_node', 'make_node', 'make_model',
+    ],
+    '.saver': ['Saver'],
+    '.dataset': ['ResidentDataset'],
+    '.pipeline': ['InputPipeline'],
+    '.summary': ['SummaryWriter'],
+    '.monitor': ['HistogramMonitor'],
+    '.model': ['get_model', 'fetch_model'],
+    '.estimator': ['estimate_model'],
+}
+
+
+def _get_lazy_attributes():
+    attributes = {
+        name: ('.{}'.format(name), None) for name in _SUBMODULES}
+    for module, names in _ATTRIBUTES.items():
+        for name in names:
+            attributes[name] = (module, name)
+    return attributes
+
+
+__all__ = sorted(
+    name for names in _ATTRIBUTES.values() for name in names)
+
+sys.modules[__name__] = LazyModule(
+    sys.modules[__name__], _get_lazy_attributes())
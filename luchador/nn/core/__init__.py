@@ -4,6 +4,7 @@ from .base import (  # noqa
     VariableScope, variable_scope, get_variable_scope, name_scope,
     fetch_node, fetch_layer, fetch_initializer, fetch_optimizer, fetch_cost,
     get_input, get_variable, get_tensor, get_operation, get_grad,
+    namespace, get_namespace, reset_namespace, release,
 )
 from .impl import ops  # noqa
 from .impl.wrapper import (  # noqa
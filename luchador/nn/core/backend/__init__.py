@@ -7,6 +7,9 @@ import luchador
 if luchador.get_nn_backend() == 'tensorflow':
     from . import tensorflow as backend  # noqa
     from .tensorflow import *  # noqa
+elif luchador.get_nn_backend() == 'numpy':
+    from . import numpy as backend  # noqa
+    from .numpy import *  # noqa
 else:
     from . import theano as backend  # noqa
     from .theano import *  # noqa
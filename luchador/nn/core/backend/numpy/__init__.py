@@ -0,0 +1,17 @@
+"""Implement NN components in NumPy backend
+
+NumPy backend supports only inference, that is, computing the output of
+models with trained parameters. Gradient computation and optimizers are
+not available.
+"""
+from __future__ import absolute_import
+from . import (  # noqa
+    random,
+    wrapper,
+    session,
+    initializer,
+    cost,
+    layer,
+    optimizer,
+    ops,
+)
@@ -0,0 +1,81 @@
+"""Implement Cost classes in NumPy backend"""
+from __future__ import absolute_import
+
+import numbers
+
+import numpy as np
+
+from . import wrapper, graph
+
+__all__ = ['SSE', 'SigmoidCrossEntropy', 'SoftmaxCrossEntropy']
+# pylint: disable=too-few-public-methods
+
+
+def _unwrap(tensor):
+    if isinstance(tensor, (numbers.Number, np.ndarray)):
+        return tensor
+    return tensor.unwrap()
+
+
+def _mean_sum(x):
+    return x.mean(axis=0).sum()
+
+
+def _sse(target, prediction, elementwise):
+    error = np.square(target - prediction)
+    return error if elementwise else _mean_sum(error)
+
+
+def _sigmoid_cross_entropy(target, logit, elementwise):
+    x, z = logit, target
+    ce = np.maximum(x, 0) - x * z + np.log1p(np.exp(-np.abs(x)))
+    return ce if elementwise else _mean_sum(ce)
+
+
+def _softmax_cross_entropy(target, logit, elementwise):
+    xdev = logit - logit.max(axis=1, keepdims=True)
+    log_sm = xdev - np.log(np.sum(np.exp(xdev), axis=1, keepdims=True))
+    ce = (- target * log_sm).sum(axis=1)
+    return ce if elementwise else _mean_sum(ce)
+
+
+class SSE(object):
+    """Implement SSE in NumPy backend.
+
+    See :any:`BaseSSE` for detail.
+    """
+    def _build(self, target, prediction):
+        elementwise = self.args['elementwise']
+        output = graph.apply(
+            _sse, _unwrap(target), prediction.unwrap(), elementwise,
+            dtype=prediction.dtype)
+        shape = prediction.shape if elementwise else tuple()
+        return wrapper.Tensor(output, shape=shape, name='output')
+
+
+class SigmoidCrossEntropy(object):
+    """Implement SigmoidCrossEntropy in NumPy backend.
+
+    See :any:`BaseSigmoidCrossEntropy` for detail.
+    """
+    def _build(self, target, logit):
+        elementwise = self.args['elementwise']
+        output = graph.apply(
+            _sigmoid_cross_entropy, _unwrap(target), logit.unwrap(),
+            elementwise, dtype=logit.dtype)
+        shape = logit.shape if elementwise else tuple()
+        return wrapper.Tensor(output, shape=shape, name='output')
+
+
+class SoftmaxCrossEntropy(object):
+    """Implement SoftmaxCrossEntropy in NumPy backend.
+
+    See :any:`BaseSoftmaxCrossEntropy` for detail.
+    """
+    def _build(self, target, logit):
+        elementwise = self.args['elementwise']
+        output = graph.apply(
+            _softmax_cross_entropy, _unwrap(target), logit.unwrap(),
+            elementwise, dtype=logit.dtype)
+        shape = (logit.shape[0],) if elementwise else tuple()
+        return wrapper.Tensor(output, shape=shape, name='output')
@@ -0,0 +1,325 @@
+"""Implement deferred computation evaluated with NumPy
+
+Layers and ops in NumPy backend do not compute values when they are built,
+because ``Input`` values are not known until ``Session.run``. Instead, they
+build graph of ``Expression`` in the same way as Theano builds symbolic
+graph, and ``Function`` evaluates the graph with the given input values.
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numbers
+import logging
+
+import numpy as np
+
+__all__ = [
+    'Expression', 'Placeholder', 'SharedVariable', 'Constant',
+    'apply', 'as_expression', 'Function',
+]
+_LG = logging.getLogger(__name__)
+
+
+def _get_dtype(obj):
+    if isinstance(obj, Expression):
+        return obj.dtype
+    if isinstance(obj, bool):
+        return None
+    if isinstance(obj, (numbers.Number, np.ndarray, np.generic)):
+        return obj
+    return None
+
+
+class Expression(object):
+    """Computation of which value is given by ``func(*args, **kwargs)``
+
+    Parameters
+    ----------
+    func : callable
+        Function which computes the value. Expressions in ``args`` and
+        ``kwargs`` are replaced with their values at evaluation.
+
+    args : tuple
+        Positional arguments for ``func``
+
+    kwargs : dict
+        Keyword arguments for ``func``
+
+    dtype : str or None
+        Data type of the resulting value. If not given, it is inferred
+        from arguments.
+
+    name : str or None
+        Name for debugging
+    """
+    # Let NumPy array defer binary operations to Expression
+    __array_priority__ = 100
+    __array_ufunc__ = None
+
+    def __init__(self, func=None, args=(), kwargs=None, dtype=None,
+                 name=None):
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+        self.name = name
+        self._dtype = None if dtype is None else np.dtype(dtype)
+
+    @property
+    def dtype(self):
+        """Data type of the value"""
+        if self._dtype is None:
+            dtypes = [
+                _get_dtype(arg)
+                for arg in self.args + tuple(self.kwargs.values())]
+            dtypes = [dtype for dtype in dtypes if dtype is not None]
+            self._dtype = np.result_type(*dtypes) if dtypes else np.dtype(
+                'float64')
+        return self._dtype
+
+    @property
+    def inputs(self):
+        """Expressions which this Expression depends on"""
+        return [
+            arg for arg in self.args + tuple(self.kwargs.values())
+            if isinstance(arg, Expression)]
+
+    def evaluate(self, values):
+        """Compute value, using the values of input Expressions
+
+        Parameters
+        ----------
+        values : dict
+            Values of Expressions which this Expression depends on
+        """
+        args = [
+            values[arg] if isinstance(arg, Expression) else arg
+            for arg in self.args]
+        kwargs = {
+            key: values[val] if isinstance(val, Expression) else val
+            for key, val in self.kwargs.items()}
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return '<{}: {}, {}>'.format(
+            self.__class__.__name__, self.name or 'No Name', self.dtype)
+
+    ###########################################################################
+    def __neg__(self):
+        return apply(np.negative, self)
+
+    def __abs__(self):
+        return apply(np.abs, self)
+
+    def __add__(self, other):
+        return apply(np.add, self, other)
+
+    def __radd__(self, other):
+        return apply(np.add, other, self)
+
+    def __sub__(self, other):
+        return apply(np.subtract, self, other)
+
+    def __rsub__(self, other):
+        return apply(np.subtract, other, self)
+
+    def __mul__(self, other):
+        return apply(np.multiply, self, other)
+
+    def __rmul__(self, other):
+        return apply(np.multiply, other, self)
+
+    def __truediv__(self, other):
+        return apply(np.true_divide, self, other)
+
+    def __rtruediv__(self, other):
+        return apply(np.true_divide, other, self)
+
+    __div__, __rdiv__ = __truediv__, __rtruediv__
+
+    def __floordiv__(self, other):
+        return apply(np.floor_divide, self, other)
+
+    def __rfloordiv__(self, other):
+        return apply(np.floor_divide, other, self)
+
+    def __pow__(self, other):
+        return apply(np.power, self, other)
+
+    def __getitem__(self, key):
+        return apply(_getitem, self, key, dtype=self.dtype)
+
+    def transpose(self, axes=None):
+        """Permute axes"""
+        return apply(np.transpose, self, axes, dtype=self.dtype)
+
+    def reshape(self, shape):
+        """Reshape value"""
+        return apply(np.reshape, self, shape, dtype=self.dtype)
+
+
+def _getitem(value, key):
+    return value[key]
+
+
+class Placeholder(Expression):
+    """Expression of which value is fed at evaluation"""
+    def __init__(self, dtype, name=None):
+        super(Placeholder, self).__init__(dtype=dtype, name=name)
+
+    def evaluate(self, values):
+        raise ValueError(
+            'Value for input `{}` is not given.'.format(self.name))
+
+
+class SharedVariable(Expression):
+    """Expression which holds value persistent across evaluations
+
+    Parameters
+    ----------
+    value : NumPy NDArray
+        Initial value
+
+    name : str
+        Name of the variable
+    """
+    def __init__(self, value, name=None):
+        value = np.asarray(value)
+        super(SharedVariable, self).__init__(dtype=value.dtype, name=name)
+        self._value = value
+
+    def get_value(self, borrow=False):
+        """Get the current value. Copy is returned unless ``borrow``"""
+        return self._value if borrow else self._value.copy()
+
+    def set_value(self, value, borrow=False):
+        """Set value. Value is copied unless ``borrow``"""
+        value = np.asarray(value, dtype=self.dtype)
+        if not value.shape == self._value.shape:
+            raise ValueError(
+                'Inconsistent shape for `{}`: {} and {}'.format(
+                    self.name, self._value.shape, value.shape))
+        self._value = value if borrow else value.copy()
+
+    def evaluate(self, values):
+        return self._value
+
+
+class Constant(Expression):
+    """Expression of constant value"""
+    def __init__(self, value, name=None):
+        value = np.asarray(value)
+        super(Constant, self).__init__(dtype=value.dtype, name=name)
+        self.value = value
+
+    def evaluate(self, values):
+        return self.value
+
+
+def apply(func, *args, **kwargs):
+    """Create Expression which applies function to the given arguments
+
+    Parameters
+    ----------
+    func : callable
+        Function to apply
+
+    args, kwargs
+        Arguments to the function. They may contain Expressions.
+        ``dtype`` and ``name`` are used for the resulting Expression and
+        not passed to the function.
+
+    Returns
+    -------
+    Expression
+    """
+    dtype, name = kwargs.pop('dtype', None), kwargs.pop('name', None)
+    return Expression(func, args, kwargs, dtype=dtype, name=name)
+
+
+def as_expression(value):
+    """Wrap value with Constant unless it is Expression"""
+    if isinstance(value, Expression):
+        return value
+    return Constant(value)
+
+
+###############################################################################
+def _sort(outputs, givens):
+    """Sort Expressions so that each comes after its inputs"""
+    order, visited = [], set()
+    for output in outputs:
+        stack = [(output, False)]
+        while stack:
+            expression, expanded = stack.pop()
+            if expanded:
+                order.append(expression)
+                continue
+            if expression in visited:
+                continue
+            visited.add(expression)
+            stack.append((expression, True))
+            if expression in givens:
+                continue
+            for input_ in expression.inputs:
+                if input_ not in visited:
+                    stack.append((input_, False))
+    return order
+
+
+class Function(object):
+    """Evaluate Expressions with the given input values
+
+    Parameters
+    ----------
+    inputs : list of Placeholder
+        Placeholders to which positional arguments are fed
+
+    outputs : list of Expression
+        Expressions to evaluate
+
+    updates : dict
+        Keys are SharedVariables and values are Expressions of new values.
+        Variables are updated after outputs are computed.
+
+    givens : dict
+        Keys are Expressions to substitute, values are the value or
+        Expression to substitute with.
+    """
+    def __init__(self, inputs, outputs, updates=None, givens=None):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.updates = list((updates or {}).items())
+        self._givens = givens or {}
+
+        replaced = {
+            key: value for key, value in self._givens.items()
+            if isinstance(value, Expression)}
+        targets = self.outputs + [value for _, value in self.updates]
+        self._order = _sort(targets + list(replaced.values()), self._givens)
+        self._replaced = replaced
+        self._constants = {
+            key: value for key, value in self._givens.items()
+            if key not in replaced}
+
+    def __call__(self, *values):
+        if not len(values) == len(self.inputs):
+            raise ValueError(
+                'Expected {} input values, got {}.'.format(
+                    len(self.inputs), len(values)))
+        memo = dict(self._constants)
+        for input_, value in zip(self.inputs, values):
+            memo[input_] = np.asarray(value, dtype=input_.dtype)
+        for expression in self._order:
+            if expression in memo:
+                continue
+            if expression in self._replaced:
+                memo[expression] = memo[self._replaced[expression]]
+                continue
+            memo[expression] = expression.evaluate(memo)
+
+        ret = [
+            memo[output].copy() if isinstance(output, SharedVariable) else
+            np.asarray(memo[output]) for output in self.outputs]
+        for variable, expression in self.updates:
+            variable.set_value(memo[expression], borrow=True)
+        return ret
@@ -0,0 +1,10 @@
+"""Unstructure Layer classes for export"""
+from __future__ import absolute_import
+# pylint: disable=wildcard-import
+from .linear import *  # noqa
+from .math import *  # noqa
+from .transform import *  # noqa
+from .activation import *  # noqa
+from .convolution import *  # noqa
+from .normalization import *  # noqa
+from .misc import *  # noqa
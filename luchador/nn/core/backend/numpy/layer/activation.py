@@ -0,0 +1,103 @@
+"""Implement Activation Layers in NumPy backend"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numpy as np
+
+from luchador.nn.core.base import fetch_initializer
+from ..wrapper import Tensor, make_variable
+from .. import graph
+
+__all__ = ['ReLU', 'LeakyReLU', 'Softplus', 'Sigmoid', 'Tanh', 'Softmax']
+# pylint: disable=too-few-public-methods, no-self-use
+
+
+def _relu(x):
+    return np.maximum(x, 0)
+
+
+def _leaky_relu(x, alpha):
+    return np.where(x > 0, x, alpha * x)
+
+
+def _softplus(x):
+    return np.logaddexp(0, x)
+
+
+def _sigmoid(x):
+    return np.exp(-np.logaddexp(0, -x))
+
+
+def _softmax(x):
+    exp = np.exp(x - x.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _apply(func, input_tensor, *args):
+    output_tensor = graph.apply(
+        func, input_tensor.unwrap(), *args, dtype=input_tensor.dtype)
+    return Tensor(output_tensor, shape=input_tensor.shape, name='output')
+
+
+class ReLU(object):
+    """Implement ReLU layer in NumPy backend.
+
+    See :any:`ReLU` for detail.
+    """
+    def _build(self, input_tensor):
+        """Build rectified linear activation operation on input tensor"""
+        return _apply(_relu, input_tensor)
+
+
+class LeakyReLU(object):
+    """Implement LeakyReLU layer in NumPy backend.
+
+    See :any:`LeakyReLU` for detail.
+    """
+    def _get_alpha(self):
+        _alpha = self.args['alpha']
+        initializer = fetch_initializer('ConstantInitializer')(value=_alpha)
+        alpha = make_variable(name='alpha', shape=[], initializer=initializer)
+        self._create_parameter_slot(
+            'alpha', val=alpha, train=True, serialize=True)
+        return alpha.unwrap()
+
+    def _build(self, input_tensor):
+        alpha = self._get_alpha() if self.args['train'] else self.args['alpha']
+        return _apply(_leaky_relu, input_tensor, alpha)
+
+
+class Softplus(object):
+    """Implement Softplus layer in NumPy backend.
+
+    See :any:`Softplus` for detail.
+    """
+    def _build(self, input_tensor):
+        return _apply(_softplus, input_tensor)
+
+
+class Sigmoid(object):
+    """Implement Sigmoid layer in NumPy backend.
+
+    See :any:`Sigmoid` for detail.
+    """
+    def _build(self, input_tensor):
+        return _apply(_sigmoid, input_tensor)
+
+
+class Tanh(object):
+    """Implement Tanh layer in NumPy backend.
+
+    See :any:`Tanh` for detail.
+    """
+    def _build(self, input_tensor):
+        return _apply(np.tanh, input_tensor)
+
+
+class Softmax(object):
+    """Implement Softmax layer in NumPy backend.
+
+    See :any:`Softmax` for detail.
+    """
+    def _build(self, input_tensor):
+        return _apply(_softmax, input_tensor)
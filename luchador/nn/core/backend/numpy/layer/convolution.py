@@ -0,0 +1,349 @@
+"""Implement Convolution Layer classes in NumPy backend
+
+Convolution follows the semantics of Theano backend, that is, data format
+is ``NCHW``, filter shape is ``(#out-channel, #in-channel, height, width)``
+and filters are flipped. Therefore parameters trained in Theano backend are
+used as they are.
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numbers
+import logging
+import warnings
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from luchador.nn.core import common
+from luchador.nn.core.base.initializer import fetch_initializer
+from .. import wrapper, graph
+
+__all__ = ['Conv2D', 'Conv2DTranspose']
+
+_LG = logging.getLogger(__name__)
+# pylint: disable=too-few-public-methods
+
+
+def _map_border_mode(padding):
+    if isinstance(padding, str):
+        mode = padding.lower()
+        return 'half' if mode == 'same' else mode
+    return padding
+
+
+def _is_int_list(list_, length=2):
+    return len(list_) == length and all([isinstance(e, int) for e in list_])
+
+
+def _validate_padding(padding):
+    msg = ('`padding` must be either str ("valid", "full", "half" or '
+           '"same"), int or tuple of two int')
+
+    if isinstance(padding, int):
+        return
+
+    if isinstance(padding, str):
+        if padding.lower() in ['full', 'half', 'same', 'valid']:
+            return
+        raise ValueError(msg)
+
+    try:
+        if _is_int_list(padding, length=2):
+            return
+    except TypeError:
+        pass
+
+    raise ValueError(msg)
+
+
+def _validate_strides(strides):
+    if isinstance(strides, int):
+        return
+    try:
+        if _is_int_list(strides, length=2):
+            return
+    except TypeError:
+        pass
+
+    raise ValueError('`strides` must be either int or tuple of two int')
+
+
+def _check_output_shape(input_shape, filter_shape, border_mode, subsample):
+    """Issue warning if a part of image is not covered by filter"""
+    f_row, f_col = filter_shape[2:4]
+    in_row, in_col = input_shape[2:4]
+    sub_row, sub_col = subsample
+    # Process padding
+    if border_mode in ['full', 'valid']:
+        pass
+    elif border_mode == 'half':
+        in_row += 2 * (f_row // 2)
+        in_col += 2 * (f_col // 2)
+    elif isinstance(border_mode, int):
+        in_row += 2 * border_mode
+        in_col += 2 * border_mode
+    else:
+        in_row += 2 * border_mode[0]
+        in_col += 2 * border_mode[1]
+    # Process convolution
+    if border_mode == 'full':
+        warn_row = f_row < sub_row
+        warn_col = f_col < sub_col
+    else:
+        warn_row = bool((in_row - f_row) % sub_row)
+        warn_col = bool((in_col - f_col) % sub_col)
+    if warn_col:
+        warnings.warn(
+            'Convolution op will not cover the right side of the input.'
+            'Check the width configuration of filter and stride.',
+            RuntimeWarning
+        )
+    if warn_row:
+        warnings.warn(
+            'Convolution op will not cover the bottom part of the input.'
+            'Check the height configuration of filter and stride.',
+            RuntimeWarning
+        )
+
+
+def _get_subsample(strides):
+    if isinstance(strides, int):
+        return (strides, strides)
+    return strides
+
+
+def _get_filter_init(config):
+    """Make filter initializer. Default to Xavier"""
+    config = config or {'typename': 'XavierInitializer'}
+    return fetch_initializer(config['typename'])(**config.get('args', {}))
+
+
+def _get_bias_init(config):
+    """Make bias initializer. Default to Constant (0.1)"""
+    config = config or {
+        'typename': 'ConstantInitializer', 'args': {'value': 0.1}}
+    return fetch_initializer(config['typename'])(**config.get('args', {}))
+
+
+###############################################################################
+def _get_padding(border_mode, filter_shape):
+    """Convert border mode to the number of padded pixels of (row, col)"""
+    f_row, f_col = filter_shape[2:4]
+    if border_mode == 'valid':
+        return (0, 0)
+    if border_mode == 'full':
+        return (f_row - 1, f_col - 1)
+    if border_mode == 'half':
+        return (f_row // 2, f_col // 2)
+    if isinstance(border_mode, int):
+        return (border_mode, border_mode)
+    return tuple(border_mode)
+
+
+def _get_conv_output_shape(input_shape, filter_shape, border_mode, subsample):
+    padding = _get_padding(border_mode, filter_shape)
+    output_shape = [input_shape[0], filter_shape[0]]
+    for in_, filter_, pad, stride in zip(
+            input_shape[2:4], filter_shape[2:4], padding, subsample):
+        output_shape.append(
+            None if in_ is None else (in_ + 2 * pad - filter_) // stride + 1)
+    return tuple(output_shape)
+
+
+def _conv2d(input_, filters, padding, subsample):
+    """Compute 2D convolution of NCHW input with flipped filters
+
+    Patches of input are gathered with strided view (im2col) and
+    multiplied with filters in a single ``tensordot``.
+    """
+    (p_row, p_col), (s_row, s_col) = padding, subsample
+    if p_row or p_col:
+        input_ = np.pad(
+            input_, ((0, 0), (0, 0), (p_row, p_row), (p_col, p_col)),
+            mode='constant')
+    n_batch, n_channel, in_row, in_col = input_.shape
+    f_row, f_col = filters.shape[2:4]
+    out_row = (in_row - f_row) // s_row + 1
+    out_col = (in_col - f_col) // s_col + 1
+
+    st_n, st_c, st_r, st_w = input_.strides
+    patches = as_strided(
+        input_,
+        shape=(n_batch, n_channel, out_row, out_col, f_row, f_col),
+        strides=(st_n, st_c, st_r * s_row, st_w * s_col, st_r, st_w),
+        writeable=False)
+    output = np.tensordot(
+        patches, filters[:, :, ::-1, ::-1], axes=([1, 4, 5], [1, 2, 3]))
+    return np.ascontiguousarray(output.transpose((0, 3, 1, 2)))
+
+
+def _conv2d_transpose(input_, filters, output_shape, padding, subsample):
+    """Compute the gradient of ``_conv2d`` with respect to its input
+
+    Each input pixel is multiplied with filters in a single ``tensordot``,
+    then the resulting patches are accumulated to output, looping over
+    filter pixels.
+    """
+    (p_row, p_col), (s_row, s_col) = padding, subsample
+    n_batch, _, in_row, in_col = input_.shape
+    f_row, f_col = filters.shape[2:4]
+    out_row, out_col = output_shape[2:4]
+
+    # (batch, row, col, #out-channel, f_row, f_col)
+    patches = np.tensordot(
+        input_, filters[:, :, ::-1, ::-1], axes=([1], [0]))
+    buf_row = max(out_row + 2 * p_row, (in_row - 1) * s_row + f_row)
+    buf_col = max(out_col + 2 * p_col, (in_col - 1) * s_col + f_col)
+    output = np.zeros(
+        (n_batch, filters.shape[1], buf_row, buf_col), dtype=patches.dtype)
+    for i in range(f_row):
+        for j in range(f_col):
+            output[
+                :, :,
+                i:i + s_row * in_row:s_row,
+                j:j + s_col * in_col:s_col,
+            ] += patches[:, :, :, :, i, j].transpose((0, 3, 1, 2))
+    return output[:, :, p_row:p_row + out_row, p_col:p_col + out_col]
+
+
+class _Conv2DMixin(object):
+    # pylint: disable=no-self-use, too-few-public-methods
+    def _validate_args(self, padding, strides, **_):
+        _validate_padding(padding)
+        _validate_strides(strides)
+
+    def _build_filter(self, shape, dtype):
+        init = _get_filter_init(self.args['initializers'].get('filter'))
+        filter_ = wrapper.make_variable(
+            name='filter', shape=shape, initializer=init, dtype=dtype)
+        self.set_parameter_variables(filter=filter_)
+
+    def _build_bias(self, shape, dtype):
+        init = _get_bias_init(self.args['initializers'].get('bias'))
+        bias = wrapper.make_variable(
+            name='bias', shape=shape, initializer=init, dtype=dtype)
+        self.set_parameter_variables(bias=bias)
+
+    def _build_parameters(self, filter_shape, bias_shape, dtype):
+        if self._parameter_variables['filter'] is None:
+            self._build_filter(shape=filter_shape, dtype=dtype)
+
+        if not self.args['with_bias']:
+            return
+
+        if self._parameter_variables['bias'] is None:
+            self._build_bias(shape=bias_shape, dtype=dtype)
+
+    def _get_filter_shape(self, n_outputs):
+        return (
+            self.args['n_filters'], n_outputs,
+            self.args['filter_height'], self.args['filter_width']
+        )
+
+    def _add_bias(self, tensor):
+        if not self.args['with_bias']:
+            return tensor
+        bias = self.get_parameter_variable('bias').unwrap()
+        return bias.reshape((1, -1, 1, 1)) + tensor
+
+
+class Conv2D(_Conv2DMixin):
+    """Implement Conv2D layer in NumPy backend.
+
+    See :any:`BaseConv2D` for detail.
+    """
+    def _build(self, input_tensor):
+        """Build 2D conolution operation of the input tensor
+
+        Parameters
+        ----------
+        input_tensor : Tensor
+            4D Tensor with shape (batch, #input channel, row, col)
+
+        Returns
+        -------
+        Tensor
+            4D Tensor with shape (batch, #output channel, row, col)
+        """
+        input_shape = input_tensor.shape
+        _LG.debug('    input_shape: %s', input_shape)
+
+        if not len(input_shape) == 4:
+            raise ValueError(
+                'Input tensor must be 4D. ({})'.format(input_tensor))
+
+        border_mode = _map_border_mode(self.args['padding'])
+        subsample = _get_subsample(self.args['strides'])
+        filter_shape = self._get_filter_shape(input_shape[1])
+        bias_shape = (filter_shape[0],)
+        output_shape = _get_conv_output_shape(
+            input_shape, filter_shape, border_mode, subsample)
+        _check_output_shape(input_shape, filter_shape, border_mode, subsample)
+
+        _LG.debug('    border_mode: %s', border_mode)
+        _LG.debug('    subsample: %s', subsample)
+        _LG.debug('    filter_shape: %s', filter_shape)
+        _LG.debug('    output_shape: %s', output_shape)
+
+        self._build_parameters(filter_shape, bias_shape, input_tensor.dtype)
+
+        filters = self.get_parameter_variable('filter')
+        output_tensor = graph.apply(
+            _conv2d, input_tensor.unwrap(), filters.unwrap(),
+            _get_padding(border_mode, filter_shape), subsample)
+        output_tensor = self._add_bias(output_tensor)
+        return wrapper.Tensor(output_tensor, shape=output_shape, name='output')
+
+
+class Conv2DTranspose(_Conv2DMixin):
+    """Implement Conv2DTranspose layer in NumPy backend.
+
+    See :any:`BaseConv2DTranspose` for detail.
+    """
+    def _get_output_shape_from_arg(self):
+        if self.args.get('output_shape_format') == 'NHWC':
+            _LG.info('  * Converting `output_shape` to NCHW')
+            return common.nhwc2nchw(self.args['output_shape'])
+        return self.args['output_shape']
+
+    def _get_output_shape(self):
+        if self.args['output_shape']:
+            return self._get_output_shape_from_arg()
+        if self._parameter_variables['original_input'] is not None:
+            return self._parameter_variables['original_input'].shape
+        raise RuntimeError(
+            'Output shape is not given. Output shape must be given '
+            'either as constructor `ouptut_shape` parameter or as '
+            'parameter variable named `original_input` given via '
+            '`set_parameter_variables` method.'
+        )
+
+    def _get_filter_shape(self, n_filters):
+        if self.get_parameter_variable('filter') is not None:
+            return self.get_parameter_variable('filter').shape
+        if self.get_parameter_variable('original_filter') is not None:
+            return self.get_parameter_variable('original_filter').shape
+        return super(Conv2DTranspose, self)._get_filter_shape(n_filters)
+
+    def _build(self, input_tensor):
+        output_shape = [
+            int(val) if isinstance(val, numbers.Number) else val
+            for val in self._get_output_shape()]
+        if None in output_shape[2:4]:
+            raise ValueError(
+                'Height and width of output must be known. '
+                'Given: {}'.format(output_shape))
+
+        filter_shape = self._get_filter_shape(output_shape[1])
+        bias_shape = (filter_shape[1],)
+        self._build_parameters(filter_shape, bias_shape, input_tensor.dtype)
+
+        filters = self.get_parameter_variable('filter')
+        border_mode = _map_border_mode(self.args['padding'])
+        subsample = _get_subsample(self.args['strides'])
+        tensor_ = graph.apply(
+            _conv2d_transpose, input_tensor.unwrap(), filters.unwrap(),
+            output_shape, _get_padding(border_mode, filters.shape), subsample)
+        tensor_ = self._add_bias(tensor_)
+        return wrapper.Tensor(tensor_, shape=output_shape, name='output')
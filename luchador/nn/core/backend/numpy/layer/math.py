@@ -0,0 +1,28 @@
+"""Implement simple arithmetic operation layer classes in NumPy backend"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numpy as np
+
+from ..wrapper import Tensor
+from .. import graph
+
+__all__ = ['TrueDiv']
+# pylint: disable=too-few-public-methods,no-self-use,
+# pylint: disable=attribute-defined-outside-init
+
+
+class TrueDiv(object):
+    """Implement TrueDiv layer in NumPy backend.
+
+    See :any:`BaseTrueDiv` for detail.
+    """
+    def _instantiate_denominator(self, dtype):
+        self._denom = graph.Constant(
+            np.asarray(self.args['denom'], dtype=dtype), name='denominator')
+
+    def _build(self, input_tensor):
+        if self._denom is None:
+            self._instantiate_denominator(input_tensor.dtype)
+        output = input_tensor.unwrap() / self._denom
+        return Tensor(output, shape=input_tensor.shape, name='output')
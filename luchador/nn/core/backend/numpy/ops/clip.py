@@ -0,0 +1,34 @@
+"""Implement clipping methods"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from ..wrapper import Tensor
+from .. import graph
+
+__all__ = ['clip_by_value', 'clip_by_norm']
+
+
+def clip_by_value(tensor, max_value, min_value, name=None):
+    """Implement clip_by_value in NumPy backend.
+
+    See :func:`luchador.nn.ops.clip_by_value` for the detail.
+    """
+    _tensor = graph.apply(
+        np.clip, tensor.unwrap(), min_value, max_value, dtype=tensor.dtype)
+    return Tensor(tensor=_tensor, shape=tensor.shape, name=name)
+
+
+def _clip_by_norm(tensor, clip_norm, axes):
+    l2norm = np.sqrt((tensor * tensor).sum(axis=axes, keepdims=True))
+    return tensor * clip_norm / np.maximum(l2norm, clip_norm)
+
+
+def clip_by_norm(tensor, clip_norm, axes=None, name=None):
+    """Implement clip_by_norm in NumPy backend.
+
+    See :func:`luchador.nn.ops.clip_by_norm` for the detail.
+    """
+    _tensor = graph.apply(
+        _clip_by_norm, tensor.unwrap(), clip_norm, axes, dtype=tensor.dtype)
+    return Tensor(tensor=_tensor, shape=tensor.shape, name=name)
@@ -0,0 +1,15 @@
+"""Define gradient-related operations"""
+from __future__ import absolute_import
+
+__all__ = ['compute_gradient']
+
+
+def compute_gradient(loss, wrt, **_):
+    """Gradient computation is not supported in NumPy backend.
+
+    See :func:`luchador.nn.ops.compute_gradient` for detail
+    """
+    raise NotImplementedError(
+        'NumPy backend does not compute gradient. (loss: {}, wrt: {}) '
+        'Use "theano" or "tensorflow" backend for training.'
+        .format(loss, wrt))
@@ -0,0 +1,14 @@
+"""Defines math-related operations"""
+from __future__ import absolute_import
+# pylint: disable=redefined-builtin
+from .linear import dot
+from .reduction import reduce_mean, reduce_sum, reduce_max
+from .elementwise_single import abs, square, sqrt, exp, log, sin, cos
+from .elementwise_multi import add, multiply, maximum, minimum
+
+__all__ = [
+    'dot',
+    'add', 'multiply', 'maximum', 'minimum',
+    'reduce_mean', 'reduce_sum', 'reduce_max',
+    'abs', 'square', 'sqrt', 'exp', 'log', 'sin', 'cos',
+]
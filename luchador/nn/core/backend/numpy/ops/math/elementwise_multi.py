@@ -0,0 +1,56 @@
+"""Implement elementwise ops work on multiple tensors"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from ...wrapper import Tensor
+from ... import graph
+
+__all__ = ['add', 'multiply', 'maximum', 'minimum']
+
+
+def _compute_shape(shape1, shape2):
+    dim1, dim2 = len(shape1), len(shape2)
+    if dim1 < dim2:
+        return _compute_shape(shape2, shape1)
+
+    diff = dim1 - dim2
+    shape = list(shape1[:diff])
+    for i1 in range(diff, dim1):
+        i2 = i1 - diff
+        if shape1[i1] == shape2[i2]:
+            shape.append(shape1[i1])
+        elif shape1[i1] == 1 or shape2[i2] is None:
+            shape.append(shape2[i2])
+        elif shape2[i2] == 1 or shape1[i1] is None:
+            shape.append(shape1[i1])
+        else:
+            raise ValueError('Incompatible shape')
+    return tuple(shape)
+
+
+def _apply(func, var1, var2, name):
+    """Apply binary function, broadcasting trailing dimensions"""
+    shape = _compute_shape(var1.shape, var2.shape)
+    _tensor = graph.apply(func, var1.unwrap(), var2.unwrap())
+    return Tensor(tensor=_tensor, shape=shape, name=name)
+
+
+def add(var1, var2, name=None):
+    """Implement add"""
+    return _apply(np.add, var1, var2, name)
+
+
+def multiply(var1, var2, name=None):
+    """Implement multiply"""
+    return _apply(np.multiply, var1, var2, name)
+
+
+def maximum(var1, var2, name=None):
+    """Implement maximum"""
+    return _apply(np.maximum, var1, var2, name)
+
+
+def minimum(var1, var2, name=None):
+    """Implement minimum"""
+    return _apply(np.minimum, var1, var2, name)
@@ -0,0 +1,52 @@
+"""Implement elementwise math ops which work on single tensor"""
+from __future__ import absolute_import
+
+import numpy as np
+
+from ...wrapper import Tensor
+from ... import graph
+
+__all__ = [
+    'abs', 'square', 'sqrt', 'exp', 'log', 'sin', 'cos',
+]
+# pylint: disable=redefined-builtin
+
+
+def _apply(func, var, name):
+    _tensor = graph.apply(func, var.unwrap(), dtype=var.dtype)
+    return Tensor(tensor=_tensor, shape=var.shape, name=name)
+
+
+def abs(var, name=None):
+    """Implement element-wise abs"""
+    return var.__abs__(name=name)
+
+
+def square(var, name=None):
+    """Implement element-wise square"""
+    return _apply(np.square, var, name)
+
+
+def sqrt(var, name=None):
+    """Implement element-wise sqrt"""
+    return _apply(np.sqrt, var, name)
+
+
+def exp(var, name=None):
+    """Implement element-wise exp"""
+    return _apply(np.exp, var, name)
+
+
+def log(var, name=None):
+    """Implement element-wise log"""
+    return _apply(np.log, var, name)
+
+
+def sin(var, name=None):
+    """Implement element-wise sin"""
+    return _apply(np.sin, var, name)
+
+
+def cos(var, name=None):
+    """Implement element-wise cos"""
+    return _apply(np.cos, var, name)
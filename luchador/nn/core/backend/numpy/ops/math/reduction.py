@@ -0,0 +1,60 @@
+"""Implement reduction math ops"""
+from __future__ import absolute_import
+
+import numpy as np
+
+import luchador.util
+from ...wrapper import Tensor
+from ... import graph
+
+__all__ = ['reduce_mean', 'reduce_sum', 'reduce_max']
+
+
+def _compute_reduced_shape(axis, shape, keep_dims):
+    if axis is None:
+        if keep_dims:
+            return [1] * len(shape)
+        return []
+
+    if not luchador.util.is_iteratable(axis):
+        axis = [axis]
+    if keep_dims:
+        return [
+            (1 if i in axis else dim)
+            for i, dim in enumerate(shape)]
+    return [
+        dim for i, dim in enumerate(shape)
+        if i not in axis]
+
+
+def _reduce(func, var, axis, keep_dims, dtype=None):
+    if luchador.util.is_iteratable(axis):
+        axis = tuple(axis)
+    kwargs = {'dtype': dtype} if dtype else {}
+    return func(var, axis=axis, keepdims=keep_dims, **kwargs)
+
+
+def reduce_mean(var, axis=None, keep_dims=False, dtype=None, name=None):
+    """Implement reduce_mean"""
+    _tensor = graph.apply(
+        _reduce, np.mean, var.unwrap(), axis, keep_dims, dtype,
+        dtype=dtype or var.dtype)
+    _shape = _compute_reduced_shape(axis, var.shape, keep_dims)
+    return Tensor(tensor=_tensor, shape=_shape, name=name)
+
+
+def reduce_sum(var, axis=None, keep_dims=False, dtype=None, name=None):
+    """Implement reduce_sum"""
+    _tensor = graph.apply(
+        _reduce, np.sum, var.unwrap(), axis, keep_dims, dtype,
+        dtype=dtype or var.dtype)
+    _shape = _compute_reduced_shape(axis, var.shape, keep_dims)
+    return Tensor(tensor=_tensor, shape=_shape, name=name)
+
+
+def reduce_max(var, axis=None, keep_dims=False, name=None):
+    """Implement reduce_max"""
+    _tensor = graph.apply(
+        _reduce, np.max, var.unwrap(), axis, keep_dims, dtype=var.dtype)
+    _shape = _compute_reduced_shape(axis, var.shape, keep_dims)
+    return Tensor(tensor=_tensor, shape=_shape, name=name)
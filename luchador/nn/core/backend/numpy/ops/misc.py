@@ -0,0 +1,66 @@
+"""Define miscellaneous operations"""
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+import numpy as np
+
+import luchador
+from ..wrapper import Operation, Tensor, Variable
+from .. import graph
+
+__all__ = ['build_sync_op', 'one_hot', 'histogram']
+
+
+def build_sync_op(source_vars, target_vars, tau=None, name='sync'):
+    """Implement ``build_sync_op`` in NumPy backend.
+
+    See :func:`luchador.nn.ops.build_sync_op` for the detail.
+    """
+    _operations = OrderedDict()
+    for source, target in zip(source_vars, target_vars):
+        if not isinstance(target, Variable):
+            continue
+
+        src, tgt = source.unwrap(), target.unwrap()
+        if tau:
+            src = (1 - tau) * tgt + tau * src
+        _operations[tgt] = src
+    return Operation(op=_operations, name=name)
+
+
+def _one_hot(indices, n_classes, dtype):
+    ret = np.zeros((indices.shape[0], n_classes), dtype=dtype)
+    ret[np.arange(indices.shape[0]), indices] = 1
+    return ret
+
+
+def one_hot(var, n_classes, dtype=None, name=None):
+    """Implement ``one_hot`` in NumPy backend.
+
+    See :func:`luchador.nn.ops.one_hot` for the detail.
+    """
+    dtype = dtype or luchador.get_nn_dtype()
+    _tensor = graph.apply(
+        _one_hot, var.unwrap(), n_classes, dtype, dtype=dtype)
+    shape = [var.shape[0], n_classes]
+    return Tensor(tensor=_tensor, shape=shape, name=name)
+
+
+def _histogram(var, n_bins):
+    var = var.ravel()
+    min_, max_ = var.min(), var.max()
+    scale = n_bins / (max_ - min_) if max_ > min_ else 0
+    indices = np.clip(np.floor((var - min_) * scale), 0, n_bins - 1)
+    counts = np.bincount(indices.astype('int64'), minlength=n_bins)
+    stats = [min_, max_, var.shape[0], var.sum(), np.square(var).sum()]
+    return np.concatenate([stats, counts]).astype(var.dtype)
+
+
+def histogram(var, n_bins, name=None):
+    """Implement ``histogram`` in NumPy backend.
+
+    See :func:`luchador.nn.ops.histogram` for the detail.
+    """
+    _tensor = graph.apply(_histogram, var.unwrap(), n_bins, dtype=var.dtype)
+    return Tensor(tensor=_tensor, shape=[n_bins + 5], name=name)
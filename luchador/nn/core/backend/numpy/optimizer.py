@@ -0,0 +1,74 @@
+"""Define optimizers in NumPy backend
+
+NumPy backend does not compute gradients, so optimizers are defined only
+to keep model configurations written for training loadable for inference.
+Optimization operations do nothing.
+"""
+from __future__ import absolute_import
+
+import logging
+
+from .wrapper import Operation
+
+__all__ = [
+    'SGD', 'RMSProp', 'NeonRMSProp', 'GravesRMSProp', 'Adam', 'Adamax'
+]
+_LG = logging.getLogger(__name__)
+# pylint: disable=too-few-public-methods
+
+
+class OptimizerMixin(object):
+    """Adds NumPy-specific helper methods to base Optimizer"""
+    def _run_backend_specific_init(self):
+        pass
+
+    def _minimize(self, loss, wrt, **_):
+        return self.apply_gradients([])
+
+    def _apply_gradients(self, grads_and_vars, **_):
+        _LG.warning(
+            '%s: Optimization is not supported in NumPy backend. '
+            'Update operation does nothing.', self.__class__.__name__)
+        return Operation(op={})
+
+
+class SGD(OptimizerMixin):
+    """Implement SGD in NumPy backend.
+
+    See :any:`BaseSGD` for detail.
+    """
+
+
+class RMSProp(OptimizerMixin):
+    """Implement RMSProp in NumPy backend.
+
+    See :any:`BaseRMSProp` for detail.
+    """
+
+
+class NeonRMSProp(OptimizerMixin):
+    """Implement NeonRMSProp in NumPy backend.
+
+    See :any:`BaseNeonRMSProp` for detail.
+    """
+
+
+class GravesRMSProp(OptimizerMixin):
+    """Implement GravesRMSProp in NumPy backend.
+
+    See :any:`BaseGravesRMSProp` for detail.
+    """
+
+
+class Adam(OptimizerMixin):
+    """Implement Adam in NumPy backend.
+
+    See :any:`BaseAdam` for detail.
+    """
+
+
+class Adamax(OptimizerMixin):
+    """Implement Adamax in NumPy backend.
+
+    See :any:`BaseAdamax` for detail.
+    """
@@ -0,0 +1,34 @@
+"""Module for implementing random source"""
+from __future__ import absolute_import
+
+from numpy.random import RandomState
+
+from . import graph
+
+__all__ = ['NormalRandom', 'UniformRandom']
+
+
+class NormalRandom(object):
+    """Implements normal random sampling in NumPy"""
+    def __init__(self):
+        self._rng = RandomState(seed=self.seed or 123456)
+
+    def _normal(self, shape, dtype):
+        return self._rng.normal(
+            loc=self.mean, scale=self.std, size=shape).astype(dtype)
+
+    def _sample(self, shape, dtype):
+        return graph.apply(self._normal, shape, dtype, dtype=dtype)
+
+
+class UniformRandom(object):
+    """Implements uniform random sampling in NumPy"""
+    def __init__(self):
+        self._rng = RandomState(seed=self.seed or 123456)
+
+    def _uniform(self, shape, dtype):
+        return self._rng.uniform(
+            low=self.low, high=self.high, size=shape).astype(dtype)
+
+    def _sample(self, shape, dtype):
+        return graph.apply(self._uniform, shape, dtype, dtype=dtype)
@@ -0,0 +1,208 @@
+"""Implement tensorflow.Session-like interface"""
+from __future__ import absolute_import
+
+import time
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+import luchador.util
+from ...base import scope
+from ...base.session import can_borrow
+from ...base.wrapper import BaseWrapper, get_variable
+from . import wrapper, graph
+
+__all__ = ['Session']
+_LG = logging.getLogger(__name__)
+
+
+def _get_full_class(cls):
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+_OP_CLASS_STR = _get_full_class(wrapper.Operation)
+
+
+def _parse_inputs(inputs):
+    inputs_ = []
+    if inputs is None:
+        return inputs_
+
+    if not luchador.util.is_iteratable(inputs):
+        inputs = [inputs]
+
+    try:
+        for key in inputs:
+            inputs_.append(key.unwrap())
+    except Exception:
+        raise ValueError(
+            '`inputs` must be either dict or list of Tensor-value pair. '
+            'Given: {}'.format(type(inputs)))
+    return inputs_
+
+
+def _parse_outputs(outputs):
+    if outputs is None:
+        return []
+    if not luchador.util.is_iteratable(outputs):
+        outputs = [outputs]
+    return [o.unwrap() for o in outputs]
+
+
+def _parse_updates(updates):
+    ret = OrderedDict()
+    if updates is None:
+        return ret
+
+    if not luchador.util.is_iteratable(updates):
+        updates = [updates]
+
+    for update in updates:
+        if not isinstance(update, wrapper.Operation):
+            raise ValueError(
+                '`updates` must be [list of] {}. Given: {}'
+                .format(_OP_CLASS_STR, _get_full_class(type(update))))
+        for shared_variable, new_expression in update.unwrap().items():
+            ret[shared_variable] = new_expression
+    return ret
+
+
+def _parse_givens(givens):
+    if givens is None:
+        return givens
+    return {
+        key.unwrap(): (
+            value.unwrap() if isinstance(value, BaseWrapper) else value)
+        for key, value in givens.items()
+    }
+
+
+def _construct_function(inputs, outputs, updates, givens):
+    return graph.Function(
+        _parse_inputs(inputs), _parse_outputs(outputs),
+        updates=_parse_updates(updates), givens=_parse_givens(givens))
+
+
+class Session(object):
+    """Handles operations and computations in similar way as Tensorflow session
+
+    Functions in NumPy backend are sorted lists of Expressions, and building
+    them does not involve compilation, so un-named ``run`` calls are not
+    cached.
+    """
+    def __init__(self, **_):
+        super(Session, self).__init__()
+        self._cached_functions = {}
+
+    def _get_graph(self):  # pylint: disable=no-self-use
+        return None
+
+    def _get_function(self, key, inputs, outputs, updates, givens):
+        if key is None:
+            return _construct_function(inputs, outputs, updates, givens)
+        if key not in self._cached_functions:
+            self._cached_functions[key] = _construct_function(
+                inputs, outputs, updates, givens)
+        return self._cached_functions[key]
+
+    def _run(self, outputs=None, inputs=None,
+             updates=None, givens=None, name=None):
+        outputs = outputs if outputs else []
+        inputs = inputs if inputs else {}
+        function = self._get_function(name, inputs, outputs, updates, givens)
+        values = function(*inputs.values())
+        if luchador.util.is_iteratable(outputs):
+            return values
+        return values[0]
+
+    def _run_steps(self, n_steps, outputs=None, inputs=None,
+                   updates=None, givens=None, name=None):
+        outputs = outputs if outputs else []
+        inputs = inputs if inputs else {}
+        key = None if name is None else ('run_steps', name)
+        function = self._get_function(key, inputs, outputs, updates, givens)
+
+        values = [np.asarray(value) for value in inputs.values()]
+        results = [
+            function(*[value[i] for value in values]) for i in range(n_steps)]
+        stacked = [
+            np.stack([result[j] for result in results])
+            for j in range(len(function.outputs))]
+        if luchador.util.is_iteratable(outputs):
+            return stacked
+        return stacked[0]
+
+    def _make_callable(self, outputs=None, inputs=None,
+                       updates=None, givens=None):
+        function = _construct_function(inputs, outputs, updates, givens)
+        if outputs is None or luchador.util.is_iteratable(outputs):
+            return function
+
+        def _run_single_output(*args):
+            return function(*args)[0]
+        return _run_single_output
+
+    def _get_cache_stats(self):  # pylint: disable=no-self-use
+        return {}
+
+    def _initialize(self):
+        pass
+
+    def _close(self):
+        pass
+
+    ###########################################################################
+    def _load_dataset(self, dataset, cast=True, strict=True, borrow=False,
+                      backend=None):
+        # Parameters trained in Theano backend share the filter layout
+        convert = backend not in ('theano', 'numpy')
+        total_bytes, total_time = 0, 0.
+        with scope.variable_scope(scope.VariableScope(reuse=True, name='')):
+            for name, value in dataset.items():
+                try:
+                    variable = get_variable(name=name)
+                    _LG.info(
+                        '  Loading %-24s %10s -> %s %s',
+                        value.shape, value.dtype, variable.dtype, name)
+                except ValueError:
+                    if strict:
+                        raise
+                    _LG.info('  Variable `%s` does not exist.', name)
+                    continue
+
+                t_start = time.time()
+                src = value
+                if cast:
+                    value = np.asarray(value, dtype=variable.dtype)
+
+                src_shape, tgt_shape = value.shape, variable.shape
+                if not tgt_shape == src_shape:
+                    # Filter shape in NumPy backend follows Theano;
+                    #  [#out-channel, #in-channel, height, width]
+                    # while, that of Tensorflow is
+                    #  [height, width, #in-channel, #out-channel]
+                    # we reshape the variable only when this condition is met
+                    if (
+                            convert and
+                            len(tgt_shape) == len(src_shape) == 4 and
+                            src_shape[:2] == tgt_shape[2:4] and  # h, w
+                            src_shape[2:4] == tgt_shape[-3::-1]  # channels
+                    ):
+                        _LG.info('    Reshaping variable: %s -> %s',
+                                 src_shape, tgt_shape)
+                        value = value.transpose((3, 2, 0, 1))
+                        value = np.ascontiguousarray(value[:, :, ::-1, ::-1])
+                    else:
+                        raise ValueError(
+                            'Shapes are not compatible. '
+                            'Model shape: {}, Value shape: {}'
+                            .format(src_shape, tgt_shape)
+                        )
+                variable.unwrap().set_value(
+                    value, borrow=can_borrow(value, src, borrow))
+                elapsed = time.time() - t_start
+                _LG.info('    %10d bytes in %.3f [sec]', value.nbytes, elapsed)
+                total_bytes += value.nbytes
+                total_time += elapsed
+        _LG.info('  Loaded %d bytes in %.3f [sec]', total_bytes, total_time)
@@ -0,0 +1,223 @@
+"""Module for defining input variable/tensor/input wrapper"""
+from __future__ import division
+from __future__ import absolute_import
+
+import numbers
+import warnings
+
+import numpy as np
+
+import luchador
+from ...base import wrapper as base_wrapper
+from ...base import scope as scope_module
+from ...base.initializer import fetch_initializer
+from . import graph
+
+__all__ = [
+    'Variable', 'Tensor', 'Input', 'Operation', 'make_variable',
+]
+
+
+###############################################################################
+def _is_same_shape(shape1, shape2):
+    if not len(shape1) == len(shape2):
+        return False
+
+    for dim1, dim2 in zip(shape1, shape2):
+        if dim1 is None or dim2 is None:
+            continue
+        if not dim1 == dim2:
+            return False
+    return True
+
+
+def _get_sample_shape(tensor):
+    """Get the shape of random value. Runtime shape is used if unknown"""
+    if None in tensor.shape:
+        return graph.apply(np.shape, tensor.unwrap())
+    return tensor.shape
+
+
+class TensorMixin(object):  # pylint: disable=too-few-public-methods
+    """Add elementwise operations to Tensor class"""
+    def _extract_operand(self, other):
+        if isinstance(other, numbers.Number):
+            return other
+        if isinstance(other, base_wrapper.BaseRandomSource):
+            return other.sample(
+                shape=_get_sample_shape(self), dtype=self.dtype)
+        if _is_same_shape(self.shape, other.shape):
+            return other.unwrap()
+        if self.size == 1 or other.size == 1:
+            return other.unwrap()
+        raise ValueError(
+            'Inconsistent shape: {} and {}'.format(self.shape, other.shape)
+        )
+
+    def __neg__(self, name=None):
+        return Tensor(tensor=-self._tensor, shape=self.shape, name=name)
+
+    def __abs__(self, name=None):
+        return Tensor(tensor=abs(self.unwrap()), shape=self.shape, name=name)
+
+    def __add__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=self._tensor+_other, shape=self.shape, name=name)
+
+    def __sub__(self, other, name=None):
+        """Scalar subtraction or elementwise subtraction"""
+        _other = self._extract_operand(other)
+        return Tensor(tensor=self._tensor-_other, shape=self.shape, name=name)
+
+    def __rsub__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=_other-self._tensor, shape=self.shape, name=name)
+
+    def __mul__(self, other, name=None):
+        """Scalar multiplication or elementwise multiplication"""
+        _other = self._extract_operand(other)
+        return Tensor(tensor=self._tensor*_other, shape=self.shape, name=name)
+
+    def __truediv__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=self._tensor/_other, shape=self.shape, name=name)
+
+    def __rtruediv__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=_other/self._tensor, shape=self.shape, name=name)
+
+    def __floordiv__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=self._tensor//_other, shape=self.shape, name=name)
+
+    def __rfloordiv__(self, other, name=None):
+        _other = self._extract_operand(other)
+        return Tensor(tensor=_other//self._tensor, shape=self.shape, name=name)
+
+    def transpose(self, axes=None, name=None):
+        """Reorder axes
+
+        Parameters
+        ----------
+        axes : list of ints
+            By default, reverse the dimensions, otherwise permute the axes
+            according to the values given.
+
+        Returns
+        -------
+        Tensor
+            The resulting Tensor
+        """
+        axes = axes or tuple(i for i in range(self.n_dim - 1, -1, -1))
+        _shape = tuple(self.shape[i] for i in axes)
+        _tensor = self._tensor.transpose(tuple(axes))
+        return Tensor(tensor=_tensor, shape=_shape, name=name)
+
+
+def _get_scope():
+    return scope_module.get_variable_scope()
+
+
+def _prefix_with_scope(name):
+    scope = _get_scope().name
+    return '{}/{}'.format(scope, name) if scope else name
+
+
+class Variable(TensorMixin, base_wrapper.BaseVariable):
+    """Wrap SharedVariable object for storing network parameters"""
+    def __init__(self, variable, name=None, trainable=True):
+        """Wrap SharedVariable object.
+
+        Args:
+          variable (SharedVariable): graph.SharedVariable object
+          name (str or None): When given, the name of the resulting wrapper is
+            overwritten with this name, otherwise, name is constructed in the
+            manner as Tensorflow.
+        """
+        name = _prefix_with_scope(name or variable.name)
+        val = variable.get_value(borrow=True)
+        super(Variable, self).__init__(
+            tensor=variable, shape=val.shape, name=name,
+            dtype=val.dtype, trainable=trainable)
+
+
+class Tensor(TensorMixin, base_wrapper.BaseTensor):
+    """Wrap Expression object for storing computation result"""
+    def __init__(self, tensor, shape=None, name=None):
+        """Wrap Expression object.
+
+        Args:
+          tensor (Expression): graph.Expression object
+          shape (list): Shape of the tensor being wrapped.
+          name (str or None): Name of the resulting wrapper for convenience.
+        """
+        if -1 in shape:
+            shape = [None if val < 0 else val for val in shape]
+        name = _prefix_with_scope(name) if name else None
+        tensor = graph.as_expression(tensor)
+        super(Tensor, self).__init__(
+            tensor=tensor, shape=shape, name=name, dtype=tensor.dtype)
+
+
+class Input(TensorMixin, base_wrapper.BaseInput):
+    """Represents network input."""
+    def __init__(self, shape, name=None, dtype=None):
+        """Creates Input object which wraps Placeholder
+
+        Args:
+          shape (list): The shape of the resulting object.
+          name (str): The name of the resulting object.
+          dtype (NumPy dtype or None): If None, default dtype is used
+        """
+        name = _prefix_with_scope(name) if name else None
+        tensor = graph.Placeholder(
+            dtype=dtype or luchador.get_nn_dtype(), name=name)
+        super(Input, self).__init__(
+            tensor=tensor, shape=shape, name=name, dtype=tensor.dtype)
+
+
+class Operation(base_wrapper.BaseOperation):
+    """Represents operation"""
+    def __init__(self, op, name=None):
+        name = _prefix_with_scope(name) if name else None
+        super(Operation, self).__init__(op=op, name=name)
+
+
+def make_variable(
+        name, shape, dtype=None,
+        initializer=None, regularizer=None, trainable=True, **_):
+    """Create Variable with the given configuration
+
+    Parameters
+    ----------
+    name : str
+        Name of Variable to create or retrieve
+
+    shape : list
+        Used to create new Variable. Ignored when retrieving one
+
+    dtype : str
+        Used to create new Variable. Ignored when retrieving one
+
+    initializer : luchador.nn.Initializer
+        Initializer object
+
+    kwargs
+        Other arguments are ignored in NumPy backend.
+    """
+    scope = _get_scope().name
+    name_ = '{}/{}'.format(scope, name) if scope else name
+    dtype = dtype or luchador.get_nn_dtype()
+
+    if not initializer:
+        initializer = fetch_initializer('NormalInitializer')(dtype=dtype)
+
+    if regularizer:
+        warnings.warn('`regularizer` is not implemented in NumPy backend.')
+
+    return Variable(
+        graph.SharedVariable(
+            value=np.array(initializer.sample(shape), dtype=dtype),
+            name=name_,
+        ), name=name, trainable=trainable,
+    )
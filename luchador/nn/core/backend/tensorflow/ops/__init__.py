@@ -9,8 +9,8 @@ from .math import (
     add, multiply, maximum, minimum,
     reduce_mean, reduce_sum, reduce_max,
 )
-from .misc import build_sync_op, one_hot
-from .transform import reshape, tile
+from .misc import build_sync_op, one_hot, histogram
+from .transform import reshape, tile, gather
 
 __all__ = [
     'clip_by_value', 'clip_by_norm',
@@ -20,6 +20,6 @@ __all__ = [
     'abs', 'square', 'sqrt',
     'exp', 'log', 'sin', 'cos',
     'reduce_mean', 'reduce_sum', 'reduce_max',
-    'build_sync_op', 'one_hot',
-    'reshape', 'tile',
+    'build_sync_op', 'one_hot', 'histogram',
+    'reshape', 'tile', 'gather',
 ]
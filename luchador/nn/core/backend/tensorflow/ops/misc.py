@@ -6,7 +6,7 @@ import tensorflow as tf
 import luchador
 from ..wrapper import Variable, Tensor, Operation
 
-__all__ = ['build_sync_op', 'one_hot']
+__all__ = ['build_sync_op', 'one_hot', 'histogram']
 
 
 def build_sync_op(source_vars, target_vars, tau=None, name='sync'):
@@ -35,3 +35,22 @@ def one_hot(var, n_classes, dtype=None, name=None):
     _tensor = tf.one_hot(
         var.unwrap(), depth=n_classes, dtype=_dtype, name=name)
     return Tensor(tensor=_tensor, name=name)
+
+
+def histogram(var, n_bins, name=None):
+    """Implement ``histogram`` in Tensorflow backend.
+
+    See :func:`luchador.nn.ops.histogram` for the detail.
+    """
+    _var = tf.reshape(var.unwrap(), [-1])
+    min_, max_ = tf.reduce_min(_var), tf.reduce_max(_var)
+    # Give non-empty range so that identical values fall in the first bucket
+    value_range = tf.stack([min_, tf.where(max_ > min_, max_, min_ + 1)])
+    counts = tf.histogram_fixed_width(_var, value_range, nbins=n_bins)
+    stats = tf.stack([
+        min_, max_, tf.cast(tf.size(_var), _var.dtype),
+        tf.reduce_sum(_var), tf.reduce_sum(tf.square(_var)),
+    ])
+    _tensor = tf.concat(
+        [stats, tf.cast(counts, _var.dtype)], axis=0, name=name)
+    return Tensor(tensor=_tensor, name=name)
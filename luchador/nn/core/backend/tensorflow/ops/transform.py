@@ -5,7 +5,7 @@ import tensorflow as tf
 
 from ..wrapper import Tensor
 
-__all__ = ['reshape', 'tile']
+__all__ = ['reshape', 'tile', 'gather']
 
 
 def reshape(var, new_shape, name=None):
@@ -30,3 +30,12 @@ def tile(var, pattern, name=None):
         pattern = prepend + pattern
         tensor = var.unwrap()
     return Tensor(tf.tile(tensor, pattern, name), name=name)
+
+
+def gather(var, indices, name=None):
+    """Implement ``gather`` in Tensorflow backend.
+
+    See :func:`luchador.nn.ops.gather` for detail
+    """
+    _tensor = tf.gather(var.unwrap(), indices.unwrap(), name=name)
+    return Tensor(tensor=_tensor, name=name)
@@ -2,12 +2,14 @@
 from __future__ import absolute_import
 
 import logging
+import warnings
 
+import numpy as np
 import tensorflow as tf
 
 import luchador.util
 from ...base import scope
-from ...base.wrapper import get_variable
+from ...base.wrapper import BaseWrapper, get_variable
 from . import wrapper
 
 __all__ = ['Session']
@@ -63,6 +65,14 @@ def _construct_fetches(outputs, updates):
     return _parse_outputs(outputs) + _parse_updates(updates)
 
 
+def _check_given_value(value):
+    if isinstance(value, BaseWrapper):
+        raise ValueError(
+            'Tensorflow backend cannot substitute Tensor with another Tensor '
+            'via `givens`. Build the graph on top of the Tensor instead.')
+    return value
+
+
 def _construct_feed_dict(inputs, givens):
     feed_dict = {}
     if not inputs:
@@ -82,10 +92,10 @@ def _construct_feed_dict(inputs, givens):
         pass
     elif isinstance(givens, dict):
         for key, value in givens.items():
-            feed_dict[key.unwrap()] = value
+            feed_dict[key.unwrap()] = _check_given_value(value)
     elif isinstance(givens, list):
         for key, value in givens:
-            feed_dict[key.unwrap()] = value
+            feed_dict[key.unwrap()] = _check_given_value(value)
     else:
         raise ValueError(
             '`givens` must be either dict or list of Tensor-value pair. '
@@ -95,9 +105,15 @@ def _construct_feed_dict(inputs, givens):
 
 class Session(object):
     """Wrap Tensorflow Session class to work with luchador API"""
-    def __init__(self, graph=None, config=None):
+    def __init__(self, graph=None, config=None,
+                 function_cache_dir=None, function_cache_size=32):
         super(Session, self).__init__()
+        if function_cache_dir is not None or not function_cache_size == 32:
+            warnings.warn(
+                '`function_cache_dir` and `function_cache_size` are '
+                'Theano only, and ignored in Tensorflow backend.')
         self.session = tf.Session('', graph, config)
+        self._assign_ops = {}
 
     def _get_graph(self):
         return self.session.graph
@@ -113,6 +129,57 @@ class Session(object):
             return values[:len(outputs)]
         return values[0]
 
+    def _run_steps(self, n_steps, outputs=None, inputs=None,
+                   updates=None, givens=None, **_):
+        # Existing operations cannot be re-executed in the body of
+        # `tf.while_loop`, so steps are run one by one, re-using the parsed
+        # fetches and feed_dict.
+        outputs = outputs if outputs else []
+        inputs = inputs if inputs else {}
+        if isinstance(inputs, dict):
+            inputs = list(inputs.items())
+        fetches = _construct_fetches(outputs, updates)
+        feed_dict = _construct_feed_dict(None, givens)
+        tensors = [key.unwrap() for key, _ in inputs]
+        n_outputs = len(outputs) if luchador.util.is_iteratable(outputs) else 1
+
+        results = []
+        for step in range(n_steps):
+            for tensor, (_, value) in zip(tensors, inputs):
+                feed_dict[tensor] = value[step]
+            values = self.session.run(fetches, feed_dict=feed_dict)
+            results.append(values[:n_outputs])
+        values = [
+            np.asarray([result[i] for result in results])
+            for i in range(n_outputs)
+        ]
+        if luchador.util.is_iteratable(outputs):
+            return values
+        return values[0]
+
+    def _make_callable(self, outputs=None, inputs=None,
+                       updates=None, givens=None):
+        fetches = _construct_fetches(outputs, updates)
+        feed_list = [input_.unwrap() for input_ in inputs or []]
+        feed_dict = _construct_feed_dict(None, givens)
+        if feed_dict or not hasattr(self.session, 'make_callable'):
+            def _run(*args):
+                feed = dict(feed_dict)
+                feed.update(zip(feed_list, args))
+                return self.session.run(fetches, feed_dict=feed)
+        else:
+            _run = self.session.make_callable(fetches, feed_list=feed_list)
+
+        if outputs is None:
+            return lambda *args: _run(*args)[:0]
+        if luchador.util.is_iteratable(outputs):
+            n_outputs = len(outputs)
+            return lambda *args: _run(*args)[:n_outputs]
+        return lambda *args: _run(*args)[0]
+
+    def _get_cache_stats(self):  # pylint: disable=no-self-use
+        return {}
+
     def _initialize(self):
         self.session.run(tf.global_variables_initializer())
 
@@ -120,8 +187,26 @@ class Session(object):
         return self.session.close()
 
     ###########################################################################
-    def _load_dataset(self, dataset, strict=True, **_):
-        ops = []
+    def _get_assign_op(self, variable):
+        """Get placeholder and assign op for the given tf.Variable
+
+        Ops are created at the first call and reused afterward, so that
+        repeated loading does not add constants to graph.
+        """
+        if variable not in self._assign_ops:
+            with variable.graph.as_default():
+                with tf.name_scope(None):
+                    placeholder = tf.placeholder(
+                        dtype=variable.dtype.base_dtype,
+                        shape=variable.get_shape(),
+                        name='{}_load_value'.format(variable.op.name))
+                    assign = tf.assign(variable, placeholder)
+            self._assign_ops[variable] = (placeholder, assign.op)
+        return self._assign_ops[variable]
+
+    def _load_dataset(self, dataset, strict=True, backend=None, **_):
+        convert = not backend == 'tensorflow'
+        ops, feed_dict = [], {}
         with scope.variable_scope(scope.VariableScope(reuse=True, name='')):
             for name, value in dataset.items():
 
@@ -144,6 +229,7 @@ class Session(object):
                     #  [#out-channel, #in-channel, height, width]
                     # we reshape the variable only when this condition is met
                     if (
+                            convert and
                             len(tgt_shape) == len(src_shape) == 4 and
                             src_shape[2:4] == tgt_shape[:2] and  # h, w
                             src_shape[:2] == tgt_shape[:1:-1]  # channels
@@ -158,6 +244,8 @@ class Session(object):
                             'Model shape: {}, Value shape: {}'
                             .format(src_shape, tgt_shape)
                         )
-                ops.append(variable.unwrap().assign(value))
-            updates = wrapper.Operation(tf.group(*ops, name='load_dataset'))
-        self.run(updates=updates)
+                placeholder, assign = self._get_assign_op(variable.unwrap())
+                feed_dict[placeholder] = value
+                ops.append(assign)
+        if ops:
+            self.session.run(ops, feed_dict=feed_dict)
@@ -0,0 +1,348 @@
+"""Implement on-disk cache of compiled Theano functions"""
+from __future__ import absolute_import
+
+import os
+import sys
+import errno
+import pickle
+import hashlib
+import logging
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+import theano
+from theano.compile import SharedVariable
+
+import luchador
+from ...base.wrapper import BaseWrapper
+
+__all__ = ['PersistentFunctionCache', 'LRUFunctionCache']
+_LG = logging.getLogger(__name__)
+# pylint: disable=no-member
+
+
+def _hash_constants(variables, hasher):
+    for var in theano.gof.graph.inputs(variables):
+        if isinstance(var, theano.gof.Constant):
+            hasher.update(np.ascontiguousarray(var.data).tobytes())
+
+
+def _get_structural_key(inputs, outputs, updates, givens):
+    """Compute hash which identifies compiled function across processes
+
+    The key is computed from the textual representation of the graph,
+    which refers to SharedVariables by name and assigns positional IDs to
+    intermediate nodes, so that the same graph built in a different process
+    yields the same key.
+    """
+    def _dump(variables):
+        return theano.printing.debugprint(
+            variables, file='str', ids='CHAR', print_type=True)
+
+    hasher = hashlib.sha1()
+    for meta in [
+            sys.version_info[:2], theano.__version__, luchador.__version__,
+            theano.config.floatX, theano.config.device, theano.config.mode,
+    ]:
+        hasher.update(str(meta).encode('utf-8'))
+
+    for var in inputs:
+        hasher.update('{}:{}'.format(var.name, var.type).encode('utf-8'))
+
+    variables = list(outputs)
+    for key, value in updates.items():
+        hasher.update('{}:{}'.format(key.name, key.type).encode('utf-8'))
+        variables.append(value)
+    for key, value in (givens or {}).items():
+        hasher.update('{}:{}'.format(key.name, key.type).encode('utf-8'))
+        variables.append(value)
+    if variables:
+        hasher.update(_dump(variables).encode('utf-8'))
+        _hash_constants(variables, hasher)
+    return hasher.hexdigest()
+
+
+def _get_shared_variables(outputs, updates, givens):
+    variables = list(outputs) + list(updates.keys()) + list(updates.values())
+    if givens:
+        variables.extend(givens.values())
+    return [
+        var for var in theano.gof.graph.inputs(variables)
+        if isinstance(var, SharedVariable)
+    ]
+
+
+def _map_by_name(shared_variables):
+    """Map SharedVariables by name. Return None if names are not unique"""
+    ret = {}
+    for var in shared_variables:
+        if var.name is None:
+            return None
+        if var.name in ret and ret[var.name] is not var:
+            return None
+        ret[var.name] = var
+    return ret
+
+
+def _swap_shared_variables(function, mapping):
+    """Copy function so that it uses the SharedVariables in mapping"""
+    swap = {}
+    for input_ in function.maker.inputs:
+        var = input_.variable
+        if not isinstance(var, SharedVariable):
+            continue
+        new_var = mapping.get(var.name)
+        if new_var is None or not new_var.type == var.type:
+            return None
+        swap[var] = new_var
+    return function.copy(swap=swap)
+
+
+def _create_dummy(var):
+    value = np.zeros((0,) * var.ndim, dtype=var.dtype)
+    return theano.shared(
+        value, name=var.name, broadcastable=var.broadcastable)
+
+
+def _strip_shared_values(function):
+    """Replace SharedVariables with empty ones so as not to pickle values"""
+    mapping = {}
+    for input_ in function.maker.inputs:
+        var = input_.variable
+        if isinstance(var, SharedVariable):
+            mapping[var.name] = _create_dummy(var)
+    return _swap_shared_variables(function, mapping)
+
+
+class PersistentFunctionCache(object):
+    """Store compiled Theano functions in directory and share across processes
+
+    Functions are keyed by the structural hash of inputs, outputs, updates,
+    givens and the versions of Python, Theano and luchador, thus a change in
+    graph results in a new entry, rather than reusing a stale function.
+    Values of SharedVariables are not stored. When a function is loaded,
+    SharedVariables are re-bound by name to the ones in the current process.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to store compiled functions.
+    """
+    def __init__(self, cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError as exception:
+            if exception.errno != errno.EEXIST:
+                raise
+        self.cache_dir = cache_dir
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, '{}.pkl'.format(key))
+
+    def get_key(self, inputs, outputs, updates, givens):
+        """Compute cache key. Return None if the function is not cacheable
+
+        Parameters
+        ----------
+        inputs : list of theano.Variable
+        outputs : list of theano.Variable
+        updates : OrderedDict
+        givens : dict or None
+            Arguments passed to ``theano.function``
+
+        Returns
+        -------
+        tuple or None
+            Pair of structural hash and SharedVariables mapped by name.
+        """
+        shared = _map_by_name(_get_shared_variables(outputs, updates, givens))
+        if shared is None:
+            _LG.debug(
+                'Function is not cached on disk, as it contains '
+                'un-named or duplicated SharedVariables.')
+            return None
+        return _get_structural_key(inputs, outputs, updates, givens), shared
+
+    def load(self, key):
+        """Load function from cache directory
+
+        Parameters
+        ----------
+        key : tuple
+            Value returned from :any:`get_key`
+
+        Returns
+        -------
+        theano.compile.Function or None
+            Function bound to the SharedVariables of the current process.
+            None if the function is not found or cannot be loaded.
+        """
+        path = self._get_path(key[0])
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as file_:
+                function = pickle.load(file_)
+            function = _swap_shared_variables(function, key[1])
+        except Exception:  # pylint: disable=broad-except
+            _LG.warning('Failed to load cached function: %s', path)
+            return None
+        if function is not None:
+            _LG.debug('Loaded cached function: %s', path)
+        return function
+
+    def save(self, key, function):
+        """Save function to cache directory
+
+        Parameters
+        ----------
+        key : tuple
+            Value returned from :any:`get_key`
+
+        function : theano.compile.Function
+            Compiled function to store
+        """
+        path = self._get_path(key[0])
+        try:
+            data = pickle.dumps(
+                _strip_shared_values(function),
+                protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-except
+            _LG.warning('Failed to serialize function: %s', path)
+            return
+
+        # Write to temporary file then rename, so that other processes
+        # never see partially written file.
+        fd_, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd_, 'wb') as file_:
+                file_.write(data)
+            os.rename(tmp_path, path)
+        except (IOError, OSError):
+            _LG.exception('Failed to cache function: %s', path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        _LG.debug('Cached function: %s', path)
+
+
+###############################################################################
+def _get_id(obj):
+    return None if obj is None else id(obj)
+
+
+def _get_value_key(obj):
+    """Key givens value by content unless it is wrapper object
+
+    Raw values such as NumPy arrays are compiled into function as constant,
+    so keying them by ID would serve stale function once they are mutated
+    in-place.
+    """
+    if obj is None or isinstance(obj, BaseWrapper):
+        return _get_id(obj)
+    value = np.ascontiguousarray(obj)
+    digest = hashlib.sha1(value.tobytes()).hexdigest()
+    return value.dtype.str, value.shape, digest
+
+
+def _get_identity_key(inputs, outputs, updates, givens):
+    """Build key from identities of the given wrapper objects.
+
+    Raw values in ``givens`` are keyed by their content.
+
+    Returns
+    -------
+    tuple
+        Key and the list of objects which the key refers to. The latter must
+        be kept alive as long as the key is in use, so that the same ID is
+        not re-assigned to a different object.
+    """
+    def _listify(obj):
+        if obj is None:
+            return []
+        if isinstance(obj, (list, tuple)):
+            return list(obj)
+        return [obj]
+
+    inputs = list(inputs.keys()) if isinstance(inputs, dict) else [
+        key for key, _ in inputs]
+    givens = list(givens.items()) if givens else []
+    objs = (
+        _listify(outputs) + inputs + _listify(updates) +
+        [obj for pair in givens for obj in pair]
+    )
+    key = (
+        isinstance(outputs, (list, tuple)),
+        tuple(_get_id(obj) for obj in _listify(outputs)),
+        tuple(_get_id(obj) for obj in inputs),
+        tuple(_get_id(obj) for obj in _listify(updates)),
+        tuple((_get_id(key), _get_value_key(val)) for key, val in givens),
+    )
+    return key, objs
+
+
+class LRUFunctionCache(object):
+    """Bounded cache of compiled functions keyed by object identities
+
+    Used for ``Session.run`` calls without name, so that repeated calls with
+    the same outputs, inputs, updates and givens do not compile functions.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of functions to retain. When exceeded, the least
+        recently used function is evicted.
+    """
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self._functions = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, inputs, outputs, updates, givens):
+        """Get cached function. Return None if not found"""
+        key, _ = _get_identity_key(inputs, outputs, updates, givens)
+        if key not in self._functions:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Move the entry to the end to mark it as the most recently used
+        entry = self._functions.pop(key)
+        self._functions[key] = entry
+        return entry[0]
+
+    def put(self, inputs, outputs, updates, givens, function):
+        """Add compiled function to cache"""
+        if self.max_size <= 0:
+            return
+        key, objs = _get_identity_key(inputs, outputs, updates, givens)
+        self._functions[key] = (function, objs)
+        while len(self._functions) > self.max_size:
+            self._functions.popitem(last=False)
+            self.evictions += 1
+            _LG.debug(
+                'Evicted function from cache. (hits: %s, misses: %s, '
+                'evictions: %s)', self.hits, self.misses, self.evictions)
+
+    def clear(self):
+        """Remove all the cached functions"""
+        self._functions.clear()
+
+    @property
+    def stats(self):
+        """Return cache statistics
+
+        Returns
+        -------
+        dict
+            ``size``, ``max_size``, ``hits``, ``misses`` and ``evictions``.
+        """
+        return {
+            'size': len(self._functions),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
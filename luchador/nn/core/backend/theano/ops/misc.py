@@ -7,7 +7,7 @@ import theano.tensor as T
 
 from ..wrapper import Operation, Tensor, Variable
 
-__all__ = ['build_sync_op', 'one_hot']
+__all__ = ['build_sync_op', 'one_hot', 'histogram']
 
 
 def build_sync_op(source_vars, target_vars, tau=None, name='sync'):
@@ -35,3 +35,22 @@ def one_hot(var, n_classes, dtype=None, name=None):
     _tensor = T.extra_ops.to_one_hot(var.unwrap(), n_classes, dtype=dtype)
     shape = [var.shape[0], n_classes]
     return Tensor(tensor=_tensor, shape=shape, name=name)
+
+
+def histogram(var, n_bins, name=None):
+    """Implement ``histogram`` in Theano backend.
+
+    See :func:`luchador.nn.ops.histogram` for the detail.
+    """
+    _var = var.unwrap().flatten()
+    min_, max_ = _var.min(), _var.max()
+    scale = T.switch(max_ > min_, n_bins / (max_ - min_), 0)
+    indices = T.clip(T.floor((_var - min_) * scale), 0, n_bins - 1)
+    counts = T.extra_ops.bincount(indices.astype('int64'), minlength=n_bins)
+    stats = [
+        min_, max_, _var.shape[0], _var.sum(), T.sqr(_var).sum()]
+    _tensor = T.concatenate([
+        T.stack([stat.astype(_var.dtype) for stat in stats]),
+        counts.astype(_var.dtype),
+    ])
+    return Tensor(tensor=_tensor, shape=[n_bins + 5], name=name)
@@ -4,7 +4,7 @@ import theano.tensor as T
 
 from ..wrapper import Tensor
 
-__all__ = ['reshape', 'tile']
+__all__ = ['reshape', 'tile', 'gather']
 
 
 def _infere_new_shape(original_shape, new_shape):
@@ -52,3 +52,13 @@ def tile(var, pattern, name=None):
     _shape = _compute_tile_shape(pattern, var.shape)
     _tensor = T.tile(var.unwrap(), pattern)
     return Tensor(tensor=_tensor, shape=_shape, name=name)
+
+
+def gather(var, indices, name=None):
+    """Implement ``gather`` in Theano backend.
+
+    See :func:`luchador.nn.ops.gather` for detail
+    """
+    _shape = (indices.shape[0],) + tuple(var.shape[1:])
+    _tensor = var.unwrap()[indices.unwrap()]
+    return Tensor(tensor=_tensor, shape=_shape, name=name)
@@ -1,16 +1,20 @@
 """Implement tensorflow.Session-like interface"""
 from __future__ import absolute_import
 
+import time
 import logging
 from collections import OrderedDict
 
 import theano
+import theano.tensor as T
 import numpy as np
 
 import luchador.util
 from ...base import scope
-from ...base.wrapper import get_variable
+from ...base.session import can_borrow
+from ...base.wrapper import BaseWrapper, get_variable
 from . import wrapper
+from .cache import PersistentFunctionCache, LRUFunctionCache
 
 __all__ = ['Session']
 _LG = logging.getLogger(__name__)
@@ -72,23 +76,97 @@ def _parse_updates(updates):
 def _parse_givens(givens):
     if givens is None:
         return givens
-    return {key.unwrap(): value for key, value in givens.items()}
+    return {
+        key.unwrap(): (
+            value.unwrap() if isinstance(value, BaseWrapper) else value)
+        for key, value in givens.items()
+    }
 
 
-def _construct_function(inputs, outputs, updates, givens):
+def _compile(inputs, outputs, updates, givens, cache):
+    key = cache.get_key(inputs, outputs, updates, givens) if cache else None
+    if key:
+        function = cache.load(key)
+        if function is not None:
+            return function
+
+    function = theano.function(
+        inputs, outputs, updates=updates, givens=givens)
+    if key:
+        cache.save(key, function)
+    return function
+
+
+def _construct_function(inputs, outputs, updates, givens, cache=None):
+    inputs_ = _parse_inputs(inputs)
+    outputs_ = _parse_outputs(outputs)
+    updates_ = _parse_updates(updates)
+    givens_ = _parse_givens(givens)
+    return _compile(inputs_, outputs_, updates_, givens_, cache)
+
+
+def _stack_type(var):
+    """Create variable which has one more leading dimension than var"""
+    type_ = T.TensorType(var.dtype, (False,) + var.broadcastable)
+    name = None if var.name is None else '{}_steps'.format(var.name)
+    return type_(name=name)
+
+
+def _construct_step_function(inputs, outputs, updates, givens, cache=None):
+    """Compile function which repeats computation with ``theano.scan``
+
+    The resulting function takes the number of steps followed by inputs
+    stacked along the first axis, and returns outputs stacked in the same
+    way. Updates are applied at each step, so that the computation in the
+    next step sees the updated values.
+    """
     inputs_ = _parse_inputs(inputs)
     outputs_ = _parse_outputs(outputs)
     updates_ = _parse_updates(updates)
     givens_ = _parse_givens(givens)
-    return theano.function(inputs_, outputs_, updates=updates_, givens=givens_)
+
+    n_steps = T.iscalar(name='n_steps')
+    sequences = [_stack_type(var) for var in inputs_]
+    n_outputs = len(outputs_)
+
+    def _step(*args):
+        replace = dict(zip(inputs_, args))
+        cloned = theano.clone(
+            outputs_ + list(updates_.values()), replace=replace)
+        step_updates = OrderedDict(zip(updates_.keys(), cloned[n_outputs:]))
+        return cloned[:n_outputs], step_updates
+
+    results, scan_updates = theano.scan(
+        _step, sequences=sequences, n_steps=n_steps)
+    if results is None:
+        results = []
+    elif not isinstance(results, (list, tuple)):
+        results = [results]
+    return _compile(
+        [n_steps] + sequences, list(results), scan_updates, givens_, cache)
 
 
 class Session(object):
     """Handles operations and computations in similar way as Tensorflow session
+
+    Parameters
+    ----------
+    function_cache_dir : str or None
+        When given, compiled functions are stored in this directory and
+        reused across processes.
+
+    function_cache_size : int
+        The maximum number of functions compiled for un-named ``run`` calls
+        to retain in memory.
     """
-    def __init__(self, **_):
+    def __init__(self, function_cache_dir=None, function_cache_size=32, **_):
         super(Session, self).__init__()
         self._cached_functions = {}
+        self._anonymous_functions = LRUFunctionCache(function_cache_size)
+        self._anonymous_step_functions = LRUFunctionCache(function_cache_size)
+        self._persistent_cache = (
+            PersistentFunctionCache(function_cache_dir)
+            if function_cache_dir else None)
 
     def _get_graph(self):  # pylint: disable=no-self-use
         return None
@@ -97,19 +175,14 @@ class Session(object):
              updates=None, givens=None, name=None):
         outputs = outputs if outputs else []
         inputs = inputs if inputs else {}
-        if name in self._cached_functions:
+        if name is None:
+            function = self._get_anonymous_function(
+                inputs, outputs, updates, givens)
+        elif name in self._cached_functions:
             function = self._cached_functions[name]
         else:
-            function = _construct_function(inputs, outputs, updates, givens)
-
-        if name is None:
-            _LG.warning(
-                'You are running un-named operation which is not cached. '
-                'If this is repeated operation, provide a name at '
-                '`Session.run` method so that function is not re-compiled '
-                'everytime operation is run.'
-            )
-        elif name not in self._cached_functions:
+            function = _construct_function(
+                inputs, outputs, updates, givens, self._persistent_cache)
             self._cached_functions[name] = function
 
         values = function(*inputs.values())
@@ -117,6 +190,53 @@ class Session(object):
             return values
         return values[0]
 
+    def _run_steps(self, n_steps, outputs=None, inputs=None,
+                   updates=None, givens=None, name=None):
+        outputs = outputs if outputs else []
+        inputs = inputs if inputs else {}
+        key = ('run_steps', name)
+        if name is None:
+            cache = self._anonymous_step_functions
+            function = cache.get(inputs, outputs, updates, givens)
+            if function is None:
+                function = _construct_step_function(
+                    inputs, outputs, updates, givens, self._persistent_cache)
+                cache.put(inputs, outputs, updates, givens, function)
+        elif key in self._cached_functions:
+            function = self._cached_functions[key]
+        else:
+            function = _construct_step_function(
+                inputs, outputs, updates, givens, self._persistent_cache)
+            self._cached_functions[key] = function
+
+        values = function(n_steps, *inputs.values())
+        if luchador.util.is_iteratable(outputs):
+            return values
+        return values[0]
+
+    def _make_callable(self, outputs=None, inputs=None,
+                       updates=None, givens=None):
+        function = _construct_function(
+            inputs, outputs, updates, givens, self._persistent_cache)
+        if outputs is None or luchador.util.is_iteratable(outputs):
+            return function
+
+        def _run_single_output(*args):
+            return function(*args)[0]
+        return _run_single_output
+
+    def _get_anonymous_function(self, inputs, outputs, updates, givens):
+        cache = self._anonymous_functions
+        function = cache.get(inputs, outputs, updates, givens)
+        if function is None:
+            function = _construct_function(
+                inputs, outputs, updates, givens, self._persistent_cache)
+            cache.put(inputs, outputs, updates, givens, function)
+        return function
+
+    def _get_cache_stats(self):
+        return self._anonymous_functions.stats
+
     def _initialize(self):
         pass
 
@@ -124,8 +244,12 @@ class Session(object):
         pass
 
     ###########################################################################
-    def _load_dataset(self, dataset, cast=True, strict=True):
-        ops = OrderedDict()
+    def _load_dataset(self, dataset, cast=True, strict=True, borrow=False,
+                      backend=None):
+        convert = backend not in ('theano', 'numpy')
+        # Values are written directly to SharedVariables instead of compiling
+        # a function which embeds them as constants.
+        total_bytes, total_time = 0, 0.
         with scope.variable_scope(scope.VariableScope(reuse=True, name='')):
             for name, value in dataset.items():
                 try:
@@ -139,8 +263,10 @@ class Session(object):
                     _LG.info('  Variable `%s` does not exist.', name)
                     continue
 
+                t_start = time.time()
+                src = value
                 if cast:
-                    value = np.array(value, dtype=variable.dtype)
+                    value = np.asarray(value, dtype=variable.dtype)
 
                 src_shape, tgt_shape = value.shape, variable.shape
                 if not tgt_shape == src_shape:
@@ -150,6 +276,7 @@ class Session(object):
                     #  [height, width, #in-channel, #out-channel]
                     # we reshape the variable only when this condition is met
                     if (
+                            convert and
                             len(tgt_shape) == len(src_shape) == 4 and
                             src_shape[:2] == tgt_shape[2:4] and  # h, w
                             src_shape[2:4] == tgt_shape[-3::-1]  # channels
@@ -157,12 +284,17 @@ class Session(object):
                         _LG.info('    Reshaping variable: %s -> %s',
                                  src_shape, tgt_shape)
                         value = value.transpose((3, 2, 0, 1))
-                        value = value[:, :, ::-1, ::-1]
+                        value = np.ascontiguousarray(value[:, :, ::-1, ::-1])
                     else:
                         raise ValueError(
                             'Shapes are not compatible. '
                             'Model shape: {}, Value shape: {}'
                             .format(src_shape, tgt_shape)
                         )
-                ops[variable.unwrap()] = value
-        self.run(updates=wrapper.Operation(op=ops))
+                variable.unwrap().set_value(
+                    value, borrow=can_borrow(value, src, borrow))
+                elapsed = time.time() - t_start
+                _LG.info('    %10d bytes in %.3f [sec]', value.nbytes, elapsed)
+                total_bytes += value.nbytes
+                total_time += elapsed
+        _LG.info('  Loaded %d bytes in %.3f [sec]', total_bytes, total_time)
@@ -11,6 +11,7 @@ from .wrapper import (
     BaseVariable, get_variable,
     BaseTensor, get_tensor, get_grad,
     BaseOperation, get_operation,
+    namespace, get_namespace, reset_namespace, release,
 )
 from .cost import BaseCost, fetch_cost
 from .layer import BaseLayer, fetch_layer
@@ -26,6 +27,7 @@ __all__ = [
     'BaseVariable', 'get_variable',
     'BaseTensor', 'get_tensor', 'get_grad',
     'BaseOperation', 'get_operation',
+    'namespace', 'get_namespace', 'reset_namespace', 'release',
     'BaseLayer', 'fetch_layer',
     'BaseInitializer', 'fetch_initializer',
     'BaseOptimizer', 'fetch_optimizer',
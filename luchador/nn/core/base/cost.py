@@ -78,7 +78,7 @@ def fetch_cost(name):
     ValueError
         When ``Cost`` class with the given type is not found
     """
-    for class_ in luchador.util.fetch_subclasses(BaseCost):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown Cost: {}'.format(name))
+    class_ = BaseCost.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown Cost: {}'.format(name))
+    return class_
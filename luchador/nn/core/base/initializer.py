@@ -10,7 +10,8 @@ __all__ = ['BaseInitializer', 'fetch_initializer']
 _LG = logging.getLogger(__name__)
 
 
-class BaseInitializer(luchador.util.StoreMixin, object):
+class BaseInitializer(
+        luchador.util.StoreMixin, luchador.util.RegistryMixin):
     """Define Common interface for Initializer classes"""
     __metaclass__ = abc.ABCMeta
 
@@ -36,7 +37,7 @@ class BaseInitializer(luchador.util.StoreMixin, object):
 
         Returns
         -------
-        [Theano backend] : Numpy Array
+        [Theano, NumPy backend] : Numpy Array
             Sampled value.
         [Tensorflow backend] : None
             In Tensorflow backend, sampling is handled by underlying native
@@ -67,7 +68,7 @@ def fetch_initializer(name):
     ValueError
         When ``Initializer`` class with the given type is not found
     """
-    for class_ in luchador.util.fetch_subclasses(BaseInitializer):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown Initializer: {}'.format(name))
+    class_ = BaseInitializer.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown Initializer: {}'.format(name))
+    return class_
@@ -74,7 +74,7 @@ def fetch_layer(name):
     ValueError
         When ``Layer`` class with the given type is not found
     """
-    for class_ in luchador.util.fetch_subclasses(BaseLayer):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown Layer: {}'.format(name))
+    class_ = BaseLayer.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown Layer: {}'.format(name))
+    return class_
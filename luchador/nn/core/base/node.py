@@ -3,12 +3,12 @@ from __future__ import absolute_import
 
 from collections import OrderedDict
 
-from luchador.util import fetch_subclasses
+from luchador.util import RegistryMixin
 
 __all__ = ['Node', 'fetch_node']
 
 
-class Node(object):  # pylint: disable=too-few-public-methods
+class Node(RegistryMixin):  # pylint: disable=too-few-public-methods
     """Make subclass retrievable with get_node method
 
     This class was introduced to make it possible to incorporate classes such
@@ -133,7 +133,7 @@ def fetch_node(name):
     ValueError
         When ``Node`` class with the given type is not found
     """
-    for class_ in fetch_subclasses(Node):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown Node: {}'.format(name))
+    class_ = Node.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown Node: {}'.format(name))
+    return class_
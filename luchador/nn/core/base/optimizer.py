@@ -114,7 +114,7 @@ def fetch_optimizer(name):
     ValueError
         When ``Optimizer`` class with the given type is not found
     """
-    for class_ in luchador.util.fetch_subclasses(BaseOptimizer):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown Optimizer: {}'.format(name))
+    class_ = BaseOptimizer.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown Optimizer: {}'.format(name))
+    return class_
@@ -4,6 +4,7 @@ from __future__ import absolute_import
 import abc
 import logging
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import h5py
 import numpy as np
@@ -12,6 +13,7 @@ _LG = logging.getLogger(__name__)
 
 
 def _parse_dataset(h5group, prefix=''):
+    """Collect references to datasets in group without reading values"""
     meta_data = ['LUCHADOR_VERSION', 'LUCHADOR_NN_BACKEND',
                  'LUCHADOR_NN_CONV_FORMAT', 'LUCHADOR_NN_DTYPE']
 
@@ -25,7 +27,113 @@ def _parse_dataset(h5group, prefix=''):
         if isinstance(value, h5py.Group):
             ret.update(_parse_dataset(value, prefix=path))
         else:
-            ret[path] = np.asarray(value)
+            ret[path] = value
+    return ret
+
+
+def _get_backend(h5file):
+    """Get backend which the file was created with. None if not recorded"""
+    if 'LUCHADOR_NN_BACKEND' not in h5file:
+        return None
+    backend = np.asarray(h5file['LUCHADOR_NN_BACKEND']).tolist()
+    return backend.decode('utf-8') if isinstance(backend, bytes) else backend
+
+
+def _filter_dataset(datasets, var_names=None, prefix=None):
+    if prefix:
+        prefix = prefix.rstrip('/')
+        datasets = OrderedDict(
+            (key, value) for key, value in datasets.items()
+            if key == prefix or key.startswith(prefix + '/'))
+    if var_names is not None:
+        datasets = OrderedDict((n, datasets[n]) for n in var_names)
+    return datasets
+
+
+def _get_location(dataset):
+    """Get path and offset of dataset stored in contiguous layout
+
+    Returns None if the dataset is scalar, chunked or compressed.
+    """
+    if dataset.ndim and dataset.chunks is None and not dataset.compression:
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            return dataset.file.filename, offset
+    return None
+
+
+def _read_dataset(dataset):
+    """Read dataset value, using memory map if the layout allows it
+
+    Datasets stored in contiguous, uncompressed layout are mapped directly
+    from the file, so that only the pages actually used are read. The
+    resulting array is read-only.
+    """
+    location = _get_location(dataset)
+    if location:
+        return np.memmap(
+            location[0], mode='r', dtype=dataset.dtype,
+            shape=dataset.shape, offset=location[1])
+    return np.asarray(dataset[()])
+
+
+def can_borrow(value, src, borrow):
+    """Check if the value can be handed to the variable without copy
+
+    Used by backends of which variables can take over NumPy arrays. Array
+    created by cast or transpose is owned by nobody else, so it can be
+    borrowed. Read-only array, such as the one returned by
+    :py:func:`_read_dataset`, is always copied, and view of the given array
+    is copied unless ``borrow`` is requested.
+
+    Parameters
+    ----------
+    value : NumPy NDArray
+        Array to hand to the variable
+
+    src : NumPy NDArray
+        Array given by the caller, from which ``value`` was created
+
+    borrow : bool
+        If True, the caller allows the variable to share memory with ``src``
+    """
+    if not value.flags.writeable:
+        return False
+    return borrow or not np.may_share_memory(value, src)
+
+
+def _read_file(args):
+    filepath, offset, dtype, shape = args
+    with open(filepath, 'rb') as file_:
+        file_.seek(offset)
+        value = np.fromfile(file_, dtype=dtype, count=int(np.prod(shape)))
+    return value.reshape(shape)
+
+
+def _read_datasets_parallel(datasets, n_workers):
+    """Read datasets with thread pool
+
+    Contiguous datasets are read directly from file, which releases GIL, so
+    that datasets in different files, such as shards, are read concurrently.
+    Other datasets are read via h5py in the calling thread.
+    """
+    ret, tasks = OrderedDict(), []
+    for key, dataset in datasets.items():
+        location = _get_location(dataset)
+        if location:
+            ret[key] = None
+            tasks.append((key, location + (dataset.dtype, dataset.shape)))
+        else:
+            ret[key] = np.asarray(dataset[()])
+
+    pool = ThreadPool(n_workers)
+    try:
+        values = pool.map(_read_file, [task for _, task in tasks])
+    finally:
+        pool.close()
+        pool.join()
+    for (key, _), value in zip(tasks, values):
+        ret[key] = value
     return ret
 
 
@@ -59,9 +167,13 @@ class BaseSession(object):
         return None
 
     ###########################################################################
-    def load_from_file(self, filepath, var_names=None, cast=True, strict=True):
+    def load_from_file(
+            self, filepath, var_names=None, cast=True, strict=True,
+            prefix=None, n_workers=1):
         """Load variable values from HDF5 file.
 
+        Only the selected variables are read from the file.
+
         Args:
           filepath (str): File path
 
@@ -74,20 +186,35 @@ class BaseSession(object):
           strict (Bool): When True, if dataset contains a value for Variable
             which is not defined, then ValueError exception is raised.
             Otherwise it will be skipped.
+
+          prefix (None or str): When given, only variables under this scope
+            are retrieved.
+
+          n_workers (int): When larger than 1, values are read with this
+            number of threads. Effective for files written by ``Saver`` with
+            ``n_shards`` option.
         """
         file_ = h5py.File(filepath, 'r')
         try:
-            data_set = _parse_dataset(file_)
+            backend = _get_backend(file_)
+            datasets = _filter_dataset(
+                _parse_dataset(file_), var_names=var_names, prefix=prefix)
+            if n_workers > 1:
+                data_set = _read_datasets_parallel(datasets, n_workers)
+            else:
+                data_set = OrderedDict(
+                    (key, _read_dataset(value))
+                    for key, value in datasets.items())
         finally:
             file_.close()
 
-        if var_names is not None:
-            data_set = OrderedDict([(n, data_set[n]) for n in var_names])
-
-        self.load_dataset(data_set, cast=cast, strict=strict)
+        # Arrays read from file are not referenced elsewhere
+        self.load_dataset(
+            data_set, cast=cast, strict=strict, borrow=True, backend=backend)
 
     @abc.abstractmethod
-    def load_dataset(self, dataset, cast=True, strict=True):
+    def load_dataset(self, dataset, cast=True, strict=True, borrow=False,
+                     backend=None):
         """Set the values of Variables with the given dataset values
 
         TODO: Add args
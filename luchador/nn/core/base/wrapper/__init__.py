@@ -7,9 +7,11 @@ from .input import BaseInput, get_input
 from .variable import BaseVariable, get_variable
 from .tensor import BaseTensor, get_tensor, get_grad
 from .operation import BaseOperation, get_operation
+from .store import namespace, get_namespace, reset_namespace, release
 
 __all__ = [
     'BaseRandomSource', 'BaseWrapper', 'BaseTensor', 'BaseVariable',
     'BaseInput', 'BaseOperation',
     'get_input', 'get_variable', 'get_tensor', 'get_operation', 'get_grad',
+    'namespace', 'get_namespace', 'reset_namespace', 'release',
 ]
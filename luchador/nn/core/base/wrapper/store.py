@@ -2,9 +2,13 @@
 from __future__ import absolute_import
 
 import logging
+import contextlib
 from collections import OrderedDict
 
-__all__ = ['register', 'retrieve']
+__all__ = [
+    'register', 'retrieve', 'release',
+    'namespace', 'get_namespace', 'reset_namespace',
+]
 _LG = logging.getLogger(__name__)
 # pylint: disable=redefined-builtin
 
@@ -15,83 +19,115 @@ _LG = logging.getLogger(__name__)
 # 1. Tensorflow's get_variable require dtype and shape for retrieving
 # exisiting varaible, which is inconvenient.
 # 2. It is extendef to Input, Tensor and Operation objects
-_VARIABLES = OrderedDict()
-_TENSORS = OrderedDict()
-_INPUTS = OrderedDict()
-_OPERATIONS = OrderedDict()
+#
+# Objects are stored in namespace, so that objects of a graph can be
+# discarded at once with `reset_namespace`. Named Tensors are held strongly
+# so that they can be fetched after the code which built them returns, thus
+# use `release` or `reset_namespace` to free them.
+_TYPES = ('input', 'variable', 'tensor', 'operation', 'model')
 
 
-def _register_variable(name, var):
-    if name in _VARIABLES:
-        raise ValueError('Variable `{}` already exists.'.format(name))
-    _VARIABLES[name] = var
+class _Namespace(object):  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.objects = {type_: OrderedDict() for type_ in _TYPES}
 
 
-def _register_tensor(name, tensor):
-    if name in _TENSORS:
-        _LG.warning('Tensor `%s` already exists.', name)
-    _TENSORS[name] = tensor
+_NAMESPACES = {}
+_CURRENT_NAMESPACE = ''
 
 
-def _register_input(name, input_):
-    if name in _INPUTS:
-        _LG.warning('Input `%s` already exists.', name)
-    _INPUTS[name] = input_
+def _get_objects(type, action):
+    if type not in _TYPES:
+        raise ValueError('Unknown type to {} {}'.format(action, type))
+    if _CURRENT_NAMESPACE not in _NAMESPACES:
+        _NAMESPACES[_CURRENT_NAMESPACE] = _Namespace()
+    return _NAMESPACES[_CURRENT_NAMESPACE].objects[type]
 
 
-def _register_operation(name, operation):
-    if name in _OPERATIONS:
-        _LG.warning('Operation `%s` already exists.', name)
-    _OPERATIONS[name] = operation
-
-
-def _retrieve_variable(name):
-    if name not in _VARIABLES:
-        raise ValueError('Variable `{}` does not exist.'.format(name))
-    return _VARIABLES.get(name)
-
-
-def _retrieve_tensor(name):
-    if name not in _TENSORS:
-        raise ValueError('Tensor `{}` does not exist.'.format(name))
-    return _TENSORS.get(name)
+def register(type, name, obj):
+    """Register object to the current namespace"""
+    objects = _get_objects(type, 'register')
+    if name in objects:
+        if type == 'variable':
+            raise ValueError('Variable `{}` already exists.'.format(name))
+        _LG.warning('%s `%s` already exists.', type.capitalize(), name)
+    objects[name] = obj
 
 
-def _retrieve_input(name):
-    if name not in _INPUTS:
-        raise ValueError('Input `{}` does not exist.'.format(name))
-    return _INPUTS[name]
+def retrieve(type, name):
+    """Retrieve object from the current namespace"""
+    obj = _get_objects(type, 'retrieve').get(name)
+    if obj is None:
+        raise ValueError(
+            '{} `{}` does not exist.'.format(type.capitalize(), name))
+    return obj
 
 
-def _retrieve_operation(name):
-    if name not in _OPERATIONS:
-        raise ValueError('Operation `{}` does not exist.'.format(name))
-    return _OPERATIONS[name]
+def release(type, name):
+    """Remove object from the current namespace
 
+    Parameters
+    ----------
+    type : str
+        ``input``, ``variable``, ``tensor``, ``operation`` or ``model``
 
-def register(type, name, obj):
-    """Register object"""
-    if type == 'input':
-        _register_input(name, obj)
-    elif type == 'variable':
-        _register_variable(name, obj)
-    elif type == 'tensor':
-        _register_tensor(name, obj)
-    elif type == 'operation':
-        _register_operation(name, obj)
-    else:
-        raise ValueError('Unknown type to register {}'.format(type))
+    name : str
+        Name with which the object was registered
+    """
+    objects = _get_objects(type, 'release')
+    if name not in objects:
+        raise ValueError(
+            '{} `{}` does not exist.'.format(type.capitalize(), name))
+    del objects[name]
 
 
-def retrieve(type, name):
-    """Retrieve object"""
-    if type == 'input':
-        return _retrieve_input(name)
-    elif type == 'variable':
-        return _retrieve_variable(name)
-    elif type == 'tensor':
-        return _retrieve_tensor(name)
-    elif type == 'operation':
-        return _retrieve_operation(name)
-    else:
-        raise ValueError('Unknown type to retrieve {}'.format(type))
+###############################################################################
+@contextlib.contextmanager
+def namespace(name):
+    """Register and retrieve objects in the given namespace
+
+    Objects created in different namespaces do not conflict even if they
+    have the same name, and they are not visible from other namespaces.
+    Entering the same name again gives access to the objects registered
+    before.
+
+    Parameters
+    ----------
+    name : str
+        Name of namespace. ``''`` is the default namespace.
+
+    Examples
+    --------
+    >>> for trial, config in enumerate(configs):
+    >>>     with nn.namespace('trial_{}'.format(trial)):
+    >>>         model = nn.make_model(config)
+    >>>         train(model)
+    >>>     nn.reset_namespace('trial_{}'.format(trial))
+    """
+    # pylint: disable=global-statement
+    global _CURRENT_NAMESPACE
+    previous, _CURRENT_NAMESPACE = _CURRENT_NAMESPACE, name
+    try:
+        yield
+    finally:
+        _CURRENT_NAMESPACE = previous
+
+
+def get_namespace():
+    """Get the name of the current namespace"""
+    return _CURRENT_NAMESPACE
+
+
+def reset_namespace(name=None):
+    """Remove all the objects registered in namespace
+
+    The objects are freed once no other reference to them remains.
+    In Tensorflow backend, the underlying graph is not modified, so the
+    default graph has to be reset separately to free the native objects.
+
+    Parameters
+    ----------
+    name : str or None
+        Name of namespace to reset. Default to the current namespace.
+    """
+    _NAMESPACES.pop(_CURRENT_NAMESPACE if name is None else name, None)
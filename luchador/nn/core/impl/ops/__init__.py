@@ -3,8 +3,8 @@ from __future__ import absolute_import
 # pylint: disable=unused-import,redefined-builtin
 from .clip import clip_by_value, clip_by_norm, clip_grads_by_norm  # noqa
 from .grad import compute_gradient  # noqa
-from .misc import build_sync_op, one_hot  # noqa
-from .transform import reshape, tile  # noqa
+from .misc import build_sync_op, one_hot, histogram  # noqa
+from .transform import reshape, tile, gather  # noqa
 from .math import (
     dot,
     abs, square, sqrt, exp, log, sin, cos,
@@ -20,6 +20,6 @@ __all__ = [
     'abs', 'square', 'sqrt',
     'exp', 'log', 'sin', 'cos',
     'reduce_mean', 'reduce_sum', 'reduce_max',
-    'build_sync_op', 'one_hot',
-    'reshape', 'tile',
+    'build_sync_op', 'one_hot', 'histogram',
+    'reshape', 'tile', 'gather',
 ]
@@ -3,7 +3,7 @@ from __future__ import absolute_import
 
 from ... import backend as be
 
-__all__ = ['build_sync_op', 'one_hot']
+__all__ = ['build_sync_op', 'one_hot', 'histogram']
 
 
 def build_sync_op(source_vars, target_vars, tau=None, name='sync'):
@@ -60,3 +60,34 @@ def one_hot(var, n_classes, dtype=None, name=None):
     if not var.n_dim == 1:
         raise ValueError('Tensor must be 1D.')
     return be.ops.one_hot(var, n_classes, dtype, name)
+
+
+def histogram(var, n_bins=30, name=None):
+    """Compute histogram and moments of tensor values inside graph.
+
+    Values are counted into ``n_bins`` buckets of equal width spanning from
+    the minimum to the maximum value, so that only a small vector has to be
+    fetched to summarize a large tensor.
+
+    Parameters
+    ----------
+    var : Tensor or Variable
+        Tensor of which values are summarized. Flattened internally.
+
+    n_bins : int
+        Number of buckets
+
+    name : str
+        Name of operation
+
+    Returns
+    -------
+    Tensor
+        1D Tensor with shape ``(n_bins + 5,)``, which consists of minimum,
+        maximum, number of values, sum, sum of squares, followed by the
+        count of each bucket. When all the values are same, they are
+        counted in the first bucket.
+    """
+    if n_bins < 1:
+        raise ValueError('`n_bins` must be positive.')
+    return be.ops.histogram(var, n_bins, name)
@@ -4,7 +4,7 @@ from __future__ import absolute_import
 from luchador.util import is_iteratable
 from ... import backend as be
 
-__all__ = ['reshape', 'tile']
+__all__ = ['reshape', 'tile', 'gather']
 
 
 def reshape(var, new_shape, name=None):
@@ -49,3 +49,27 @@ def tile(var, pattern, name=None):
     if not is_iteratable(pattern):
         raise ValueError('`pattern` must be iteratable')
     return be.ops.tile(var, tuple(pattern), name)
+
+
+def gather(var, indices, name=None):
+    """Gather slices along the first axis.
+
+    Parameters
+    ----------
+    var : Tensor or Variable
+        Tensor from which slices are gathered
+
+    indices : Tensor or Input
+        1D integer Tensor
+
+    name : str
+        Name of operation
+
+    Returns
+    -------
+    Tensor
+        Tensor with shape ``(indices.shape[0],) + var.shape[1:]``
+    """
+    if not indices.n_dim == 1:
+        raise ValueError('`indices` must be 1D.')
+    return be.ops.gather(var, indices, name)
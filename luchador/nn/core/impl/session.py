@@ -10,9 +10,34 @@ _SESSIONS = {}
 
 
 class Session(session.Session, BaseSession):
-    """Implement Tensorflow-like Session class which executes computation"""
-    def __init__(self, graph=None, config=None):
-        super(Session, self).__init__(graph=graph, config=config)
+    """Implement Tensorflow-like Session class which executes computation
+
+    Parameters
+    ----------
+    graph : tf.Graph
+        Tensorflow only. Graph to launch.
+
+    config : tf.ConfigProto
+        Tensorflow only. Session configuration.
+
+    function_cache_dir : str or None
+        Theano only. When given, compiled functions are stored in this
+        directory and reused by later sessions, including the ones in other
+        processes, so that they are not compiled again.
+        Functions are identified by graph structure, so changes in graph
+        and library versions invalidate the cache.
+
+    function_cache_size : int
+        Theano only. The number of functions compiled for un-named ``run``
+        calls to retain. Such functions are identified by the objects given
+        to ``run``, and the least recently used one is discarded first.
+    """
+    def __init__(self, graph=None, config=None,
+                 function_cache_dir=None, function_cache_size=32):
+        super(Session, self).__init__(
+            graph=graph, config=config,
+            function_cache_dir=function_cache_dir,
+            function_cache_size=function_cache_size)
 
     def run(self, outputs=None, inputs=None,
             updates=None, givens=None, name=None):
@@ -34,7 +59,9 @@ class Session(session.Session, BaseSession):
             Same as inputs
 
         name : str
-            Not used. Compatibility for theano backend
+            Theano only. Name to cache the compiled function with.
+            When not given, function is cached with the identities of
+            the given arguments in a bounded cache.
 
         Returns
         -------
@@ -45,6 +72,104 @@ class Session(session.Session, BaseSession):
             outputs=outputs, inputs=inputs,
             updates=updates, givens=givens, name=name)
 
+    def run_steps(self, n_steps, outputs=None, inputs=None,
+                  updates=None, givens=None, name=None):
+        """Run computation and update values repeatedly in one call
+
+        This is equivalent to calling ``run`` ``n_steps`` times with the
+        slices of input values. In Theano backend, steps are compiled into
+        a single function with ``theano.scan``, so per-call overhead is paid
+        only once.
+
+        .. note::
+            Tensorflow and NumPy backends give no speedup over calling
+            ``run`` repeatedly. Steps are run in Python loop, which calls
+            ``tf.Session.run`` (or evaluates the graph) ``n_steps`` times,
+            as the operations already in the graph cannot be re-executed in
+            the body of ``tf.while_loop``. Only argument parsing is shared.
+
+        Parameters
+        ----------
+        n_steps : int
+            The number of steps to run
+
+        outputs : list of Tensors
+            Tensors of which values are fetched at each step
+
+        inputs : dict
+            Keys are the input Tensors. Values are the actual values for all
+            the steps, stacked along the first axis, so that ``value[i]`` is
+            fed at the ``i``-th step.
+
+        updates : Operation or list of Operations
+            Updates applied at each step
+
+        givens : dict
+            Same as ``run``. Values are common to all the steps.
+
+        name : str
+            Theano only. Name to cache the compiled function with.
+
+        Returns
+        -------
+        [list of] NumPy ND Arrays
+            The values of `outputs` at each step, stacked along the first
+            axis.
+        """
+        return self._run_steps(
+            n_steps, outputs=outputs, inputs=inputs,
+            updates=updates, givens=givens, name=name)
+
+    def make_callable(self, outputs=None, inputs=None,
+                      updates=None, givens=None):
+        """Build function which runs the given computation repeatedly
+
+        Arguments are parsed and the computation is compiled only once, so
+        calling the resulting function is cheaper than calling ``run``.
+
+        Parameters
+        ----------
+        outputs : [list of] Tensors
+            Tensors of which values are fetched
+
+        inputs : list of Inputs
+            Inputs to which the positional arguments of the resulting
+            function are fed, in the same order.
+
+        updates : Operation or list of Operations
+            Updates variables
+
+        givens : dict
+            Same as ``run``. Values are bound at the time of this call.
+
+        Returns
+        -------
+        function
+            Function which takes NumPy ND Arrays corresponding to ``inputs``
+            as positional arguments and returns the same values as ``run``.
+
+        Examples
+        --------
+        >>> train = session.make_callable(
+        >>>     outputs=loss, inputs=[data, label], updates=update_op)
+        >>> for batch in batches:
+        >>>     loss_value = train(batch.data, batch.label)
+        """
+        return self._make_callable(
+            outputs=outputs, inputs=inputs, updates=updates, givens=givens)
+
+    @property
+    def function_cache_stats(self):
+        """Statistics of the cache for un-named ``run`` calls. Theano only.
+
+        Returns
+        -------
+        dict
+            ``size``, ``max_size``, ``hits``, ``misses`` and ``evictions``.
+            Empty in Tensorflow and NumPy backend.
+        """
+        return self._get_cache_stats()
+
     @property
     def graph(self):
         """Returns Graph object. TF only."""
@@ -52,7 +177,8 @@ class Session(session.Session, BaseSession):
 
     def initialize(self):
         """Initialize variables. TF only.
-        No effect in Theano backend as Variables are already initialized.
+        No effect in Theano and NumPy backend as Variables are already
+        initialized.
         """
         self._initialize()
 
@@ -60,7 +186,8 @@ class Session(session.Session, BaseSession):
         """Finalize session"""
         self._close()
 
-    def load_dataset(self, dataset, cast=True, strict=True):
+    def load_dataset(self, dataset, cast=True, strict=True, borrow=False,
+                     backend=None):
         """Set the value of Variables with the given values
 
         Parameters
@@ -76,8 +203,23 @@ class Session(session.Session, BaseSession):
             When True, if dataset contains a value for Variable which is not
             defined, then ValueError exception is raised. Otherwise it will
             be skipped.
+
+        borrow : Bool
+            Theano and NumPy backend only. When True, Variables may share
+            memory with the given arrays if dtype and shape already match,
+            so the arrays must not be modified afterward. Otherwise values
+            are copied.
+
+        backend : str or None
+            Backend which the values were created with. When it matches the
+            running backend, filter layout conversion is not attempted and
+            values with incompatible shapes are rejected. If None, conversion
+            is inferred from shapes. See ``convert`` command of
+            ``tool/hdf5/inspect_hdf5.py`` to convert file in advance.
         """
-        self._load_dataset(dataset=dataset, cast=cast, strict=strict)
+        self._load_dataset(
+            dataset=dataset, cast=cast, strict=strict, borrow=borrow,
+            backend=backend)
 ###############################################################################
 
 
@@ -0,0 +1,190 @@
+"""Implement dataset which resides in backend memory"""
+from __future__ import absolute_import
+
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+import luchador
+from .core.base.initializer import BaseInitializer
+from .core import (
+    Input, make_variable, variable_scope, initializer, ops,
+)
+
+__all__ = ['ResidentDataset']
+_LG = logging.getLogger(__name__)
+
+
+def _check_batch_size(batch_size, n_data):
+    if batch_size is not None and batch_size > n_data:
+        raise ValueError(
+            '`batch_size` ({}) is larger than the number of samples ({}).'
+            .format(batch_size, n_data))
+
+
+class _ValueInitializer(BaseInitializer):
+    """Give the array as it is, so that Variable is created from data"""
+    def __init__(self, value):
+        self._value = value
+        super(_ValueInitializer, self).__init__()
+
+    def _run_backend_specific_init(self):
+        pass
+
+    def _sample(self, _):
+        return self._value
+
+
+def _make_variable(name, value):
+    dtype = np.asarray(value).dtype.name
+    if luchador.get_nn_backend() == 'tensorflow':
+        # Initializer of Tensorflow backend embeds value in graph, so
+        # Variable is initialized with zero then the value is loaded.
+        return make_variable(
+            name=name, shape=value.shape, dtype=dtype, trainable=False,
+            initializer=initializer.ConstantInitializer(0, dtype=dtype))
+    return make_variable(
+        name=name, shape=value.shape, dtype=dtype, trainable=False,
+        initializer=_ValueInitializer(value), borrow=True)
+
+
+class ResidentDataset(object):
+    """Keep the whole dataset in backend and select mini batch in graph
+
+    The arrays are uploaded to non-trainable Variables once, and mini batch
+    is gathered from them with ``index`` Input. As a result, only indices
+    are transferred at each step, instead of mini batch data.
+
+    Parameters
+    ----------
+    data : dict
+        Key is the name of the array, value is NumPy NDArray. All the arrays
+        must have the same length along the first axis.
+
+    batch_size : int or None
+        Mini batch size. If None, the shape of ``index`` is not fixed.
+
+    shuffle : bool
+        If True, indices returned by :any:`next_index` are shuffled at every
+        epoch.
+
+    name : str
+        Name of variable scope in which Variables and Input are created.
+
+    Attributes
+    ----------
+    index : Input
+        1D int64 Input to feed indices of samples to gather.
+
+    batch : OrderedDict
+        Tensors of gathered mini batch, with the same keys as ``data``.
+
+    variables : OrderedDict
+        Variables holding the whole arrays, with the same keys as ``data``.
+
+    Examples
+    --------
+    >>> dataset = nn.ResidentDataset(
+    >>>     {'data': train_data, 'label': train_label}, batch_size=32)
+    >>> model = nn.make_model(model_config)
+    >>> output = model(dataset.batch['data'])
+    >>> ...
+    >>> session = nn.Session()
+    >>> session.initialize()
+    >>> dataset.upload(session)
+    >>> session.run(
+    >>>     outputs=error, inputs={dataset.index: dataset.next_index()})
+
+    In Theano backend, the existing ``Input`` can be substituted with the
+    gathered mini batch via ``givens``.
+
+    >>> session.run(
+    >>>     outputs=error, inputs={dataset.index: dataset.next_index()},
+    >>>     givens={
+    >>>         model_input: dataset.batch['data'],
+    >>>         label_input: dataset.batch['label'],
+    >>>     })
+    """
+    def __init__(self, data, batch_size=None, shuffle=True,
+                 name='resident_dataset'):
+        lengths = set(len(value) for value in data.values())
+        if not len(lengths) == 1:
+            raise ValueError(
+                'All the arrays must have the same length. '
+                'Found: {}'.format(lengths))
+
+        self.n_data = lengths.pop()
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+
+        self.variables = OrderedDict()
+        self.batch = OrderedDict()
+        with variable_scope(name):
+            self.index = Input(
+                shape=(batch_size,), dtype='int64', name='index')
+            for key, value in data.items():
+                variable = _make_variable(key, value)
+                self.variables[key] = variable
+                self.batch[key] = ops.gather(
+                    variable, self.index, name='{}_batch'.format(key))
+
+        # In Theano and NumPy backends, Variables are created from data
+        self._data = data if luchador.get_nn_backend() == 'tensorflow' else {}
+        self._perm = np.arange(self.n_data)
+        self._pos = self.n_data
+
+    def upload(self, session):
+        """Load the arrays to Variables
+
+        In Tensorflow backend, the arrays are copied to Variables here. In
+        Theano and NumPy backends, Variables are created from copies of the
+        arrays at construction, so this only validates the dataset. The
+        host-side references to the arrays are released after upload.
+
+        Parameters
+        ----------
+        session : Session
+            Session in which Variables are initialized.
+
+        Raises
+        ------
+        ValueError
+            When ``batch_size`` is larger than the number of samples.
+        """
+        if self._data is None:
+            raise RuntimeError('Dataset is already uploaded.')
+        _check_batch_size(self.batch_size, self.n_data)
+        if self._data:
+            _LG.info('Uploading dataset.')
+            session.load_dataset(OrderedDict(
+                (self.variables[key].name, value)
+                for key, value in self._data.items()
+            ))
+        self._data = None
+
+    def next_index(self, batch_size=None):
+        """Get indices of the next mini batch
+
+        Parameters
+        ----------
+        batch_size : int or None
+            The number of indices. Default to ``batch_size`` given to
+            constructor.
+
+        Returns
+        -------
+        NumPy NDArray
+            1D int64 array to feed to ``index`` Input.
+        """
+        batch_size = batch_size or self.batch_size
+        if batch_size is None:
+            raise ValueError('`batch_size` is not given.')
+        _check_batch_size(batch_size, self.n_data)
+        if self._pos + batch_size > self.n_data:
+            if self.shuffle:
+                np.random.shuffle(self._perm)
+            self._pos = 0
+        start, self._pos = self._pos, self._pos + batch_size
+        # Copy, as ``_perm`` is shuffled in-place at the next epoch
+        return self._perm[start:self._pos].copy()
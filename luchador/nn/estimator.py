@@ -0,0 +1,686 @@
+"""Estimate shape, parameter, FLOP and memory of model without backend
+
+Model configuration (the output of :any:`get_model_config`) is analyzed
+statically, so that the cost of a model can be checked before building it,
+without loading Theano or Tensorflow.
+
+For example,
+
+    python -m luchador.nn.estimator model.yml --batch-size 64 \\
+        --param input_shape='[null, 1, 28, 28]' --param n_classes=10
+
+prints the output shape, the number of parameters and the number of
+floating point operations of each layer.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import re
+import json
+import logging
+import argparse
+import collections
+from collections import OrderedDict
+
+import numpy as np
+import ruamel.yaml as yaml
+
+import luchador
+from luchador.util import load_config
+
+__all__ = ['estimate_model', 'ModelEstimate', 'LayerEstimate']
+_LG = logging.getLogger(__name__)
+
+LayerEstimate = collections.namedtuple(
+    'LayerEstimate', (
+        'model', 'scope', 'typename', 'input_shape', 'output_shape',
+        'n_params', 'n_trainable_params', 'forward_flops', 'backward_flops',
+    )
+)
+
+
+###############################################################################
+def _is_config(config):
+    return isinstance(config, dict) and 'typename' in config
+
+
+def _prod(shape):
+    if shape is None or any(dim is None for dim in shape):
+        return None
+    return int(np.prod(shape, dtype='int64'))
+
+
+def _pair(value):
+    if not isinstance(value, (list, tuple)):
+        return value, value
+    return tuple(value)
+
+
+def _get_strides(strides, data_format):
+    strides = _pair(strides)
+    if len(strides) == 4:
+        return strides[2:] if data_format == 'NCHW' else strides[1:3]
+    return strides
+
+
+def _conv_output_size(size, filter_, stride, padding):
+    if size is None:
+        return None
+    if isinstance(padding, int):
+        return (size + 2 * padding - filter_) // stride + 1
+    padding = padding.lower()
+    if padding == 'valid':
+        return (size - filter_) // stride + 1
+    if padding == 'full':
+        return (size + filter_ - 2) // stride + 1
+    if padding in ['same', 'half']:
+        return -(-size // stride)
+    raise ValueError('Unexpected padding: {}'.format(padding))
+
+
+def _to_format(shape, given_format, data_format):
+    if not given_format or given_format == data_format:
+        return tuple(shape)
+    if data_format == 'NCHW':
+        return (shape[0], shape[3], shape[1], shape[2])
+    return (shape[0], shape[2], shape[3], shape[1])
+
+
+def _split_image(shape, data_format):
+    """Get (batch, channel, height, width) from 4D shape"""
+    if shape is None or len(shape) != 4:
+        raise ValueError('4D input is expected. Found: {}'.format(shape))
+    if data_format == 'NCHW':
+        return shape
+    return shape[0], shape[3], shape[1], shape[2]
+
+
+def _join_image(batch, channel, height, width, data_format):
+    if data_format == 'NCHW':
+        return batch, channel, height, width
+    return batch, height, width, channel
+
+
+###############################################################################
+# Each function takes layer arguments, input shape and running format then
+# returns output shape, parameter shapes and forward FLOPs. Multiply-add is
+# counted as two FLOPs.
+def _dense(args, shape, _):
+    n_in, n_out = shape[-1], args['n_nodes']
+    params = OrderedDict([('weight', (n_in, n_out))])
+    if args.get('with_bias', True):
+        params['bias'] = (n_out, )
+    output = tuple(shape[:-1]) + (n_out, )
+    flops = 2 * _prod(shape) * n_out
+    flops += _prod(output) if 'bias' in params else 0
+    return output, params, flops
+
+
+def _conv2d(args, shape, data_format):
+    batch, c_in, height, width = _split_image(shape, data_format)
+    f_h, f_w = args['filter_height'], args['filter_width']
+    c_out = args['n_filters']
+    s_h, s_w = _get_strides(args['strides'], data_format)
+    pad_h, pad_w = _pair(args.get('padding', 'VALID'))
+    height = _conv_output_size(height, f_h, s_h, pad_h)
+    width = _conv_output_size(width, f_w, s_w, pad_w)
+    output = _join_image(batch, c_out, height, width, data_format)
+
+    params = OrderedDict([('filter', (f_h, f_w, c_in, c_out))])
+    if args.get('with_bias', True):
+        params['bias'] = (c_out, )
+    flops = 2 * _prod(output) * c_in * f_h * f_w
+    flops += _prod(output) if 'bias' in params else 0
+    return output, params, flops
+
+
+def _conv2d_transpose(
+        args, shape, data_format, reference=None, original_filter=None):
+    batch, c_in = _split_image(shape, data_format)[:2]
+    f_h, f_w = args['filter_height'], args['filter_width']
+    if args.get('output_shape'):
+        reference = _to_format(
+            args['output_shape'], args.get('output_shape_format'),
+            data_format)
+    if reference is None:
+        raise ValueError(
+            'The number of output channels of Conv2DTranspose is not known. '
+            'Give `output_shape` or `original_input`.')
+    _, c_out, out_h, out_w = _split_image(reference, data_format)
+    output = _join_image(batch, c_out, out_h, out_w, data_format)
+
+    # Filter is created in the shape of ``original_filter`` when it is given
+    filter_shape = original_filter or (f_h, f_w, c_out, c_in)
+    params = OrderedDict([('filter', tuple(filter_shape))])
+    if args.get('with_bias', True):
+        params['bias'] = (c_out, )
+    flops = 2 * _prod(shape) * c_out * f_h * f_w
+    flops += _prod(output) if 'bias' in params else 0
+    return output, params, flops
+
+
+def _elementwise(cost):
+    def _estimate(_, shape, __):
+        return tuple(shape), {}, cost * _prod(shape)
+    return _estimate
+
+
+def _leaky_relu(args, shape, _):
+    params = OrderedDict()
+    if args.get('train'):
+        params['alpha'] = ()
+    return tuple(shape), params, 2 * _prod(shape)
+
+
+def _batch_normalization(_, shape, data_format):
+    axis = 3 if len(shape) == 4 and data_format == 'NHWC' else 1
+    dim = (shape[axis], )
+    params = OrderedDict([
+        ('mean', dim), ('var', dim), ('scale', dim), ('offset', dim)])
+    return tuple(shape), params, 4 * _prod(shape)
+
+
+def _flatten(_, shape, __):
+    return (shape[0], _prod(shape[1:])), {}, 0
+
+
+def _reshape(args, shape, data_format):
+    output = list(_to_format(
+        args['shape'], args.get('shape_format'), data_format))
+    output = [-1 if dim is None else dim for dim in output]
+    if -1 in output:
+        known = _prod([dim for dim in output if dim != -1])
+        total = _prod(shape)
+        output[output.index(-1)] = None if total is None else total // known
+    return tuple(output), {}, 0
+
+
+def _permute(order):
+    def _estimate(_, shape, __):
+        return tuple(shape[i] for i in order), {}, 0
+    return _estimate
+
+
+def _concat(args, shapes, _):
+    axis = args.get('axis', 1)
+    output = list(shapes[0])
+    dims = [shape[axis] for shape in shapes]
+    output[axis] = None if None in dims else sum(dims)
+    return tuple(output), {}, 0
+
+
+def _cost(cost):
+    def _estimate(args, shapes, _):
+        shape = shapes['prediction']
+        output = tuple(shape) if args.get('elementwise') else ()
+        return output, {}, cost * _prod(shape)
+    return _estimate
+
+
+_ELEMENTWISE_FUNCS = set([
+    'NormalRandom', 'UniformRandom', 'clip_by_value', 'abs', 'square',
+    'sqrt', 'exp', 'log', 'sin', 'cos', 'maximum', 'minimum',
+])
+
+
+def _anonymous(args, shape, _):
+    """Estimate Anonymous layer which applies element-wise operations
+
+    Multiple inputs are accepted when they have the same shape.
+    """
+    exp = args['exp']
+    funcs = re.findall(r'([A-Za-z_]\w*)\s*\(', exp)
+    elementwise = _ELEMENTWISE_FUNCS.issuperset(funcs)
+    shapes = set(tuple(shape_) for shape_ in _flatten_shapes(shape))
+    if not len(shapes) == 1 or not elementwise:
+        raise ValueError('Output shape of `{}` is not inferred.'.format(exp))
+    shape = shapes.pop()
+    n_ops = len(funcs) + len(re.findall(r'[-+*/]', exp))
+    return shape, {}, max(n_ops, 1) * _prod(shape)
+
+
+_LAYERS = {
+    'Dense': _dense,
+    'Conv2D': _conv2d,
+    'Conv2DTranspose': _conv2d_transpose,
+    'ReLU': _elementwise(1),
+    'LeakyReLU': _leaky_relu,
+    'Sigmoid': _elementwise(4),
+    'Tanh': _elementwise(4),
+    'Softmax': _elementwise(5),
+    'Softplus': _elementwise(4),
+    'TrueDiv': _elementwise(1),
+    'BatchNormalization': _batch_normalization,
+    'Flatten': _flatten,
+    'Reshape': _reshape,
+    'NHWC2NCHW': _permute((0, 3, 1, 2)),
+    'NCHW2NHWC': _permute((0, 2, 3, 1)),
+    'Concat': _concat,
+    'Anonymous': _anonymous,
+    'SSE': _cost(3),
+    'SigmoidCrossEntropy': _cost(5),
+    'SoftmaxCrossEntropy': _cost(5),
+    'NormalKLDivergence': _cost(6),
+}
+
+_OPTIMIZERS = ['SGD', 'RMSProp', 'NeonRMSProp', 'GravesRMSProp', 'Adam']
+
+
+###############################################################################
+class ModelEstimate(object):
+    """Result of :any:`estimate_model`
+
+    Parameters
+    ----------
+    layers : list of LayerEstimate
+        Estimate of each layer, in the order of construction. ``None`` is
+        used for values which could not be inferred.
+
+    batch_size : int
+        Batch size used for the estimation
+
+    itemsize : int
+        The number of bytes of one element of parameter and activation
+    """
+    def __init__(self, layers, batch_size, itemsize):
+        self.layers = layers
+        self.batch_size = batch_size
+        self.itemsize = itemsize
+
+    def _sum(self, field):
+        return sum(getattr(layer, field) or 0 for layer in self.layers)
+
+    @property
+    def n_params(self):
+        """The total number of parameters"""
+        return self._sum('n_params')
+
+    @property
+    def n_trainable_params(self):
+        """The total number of trainable parameters"""
+        return self._sum('n_trainable_params')
+
+    @property
+    def forward_flops(self):
+        """The total FLOPs of forward computation for one batch"""
+        return self._sum('forward_flops')
+
+    @property
+    def backward_flops(self):
+        """The total FLOPs of gradient computation for one batch"""
+        return self._sum('backward_flops')
+
+    @property
+    def parameter_bytes(self):
+        """Memory occupied by parameters"""
+        return self.n_params * self.itemsize
+
+    @property
+    def activation_bytes(self):
+        """Memory occupied by layer outputs retained for backward pass"""
+        return self.itemsize * sum(
+            _prod(layer.output_shape) or 0 for layer in self.layers)
+
+    @property
+    def peak_activation_bytes(self):
+        """The largest memory of input and output of single layer
+
+        This is the lower bound of activation memory required for inference
+        where intermediate outputs are discarded once consumed.
+        """
+        peak = 0
+        for layer in self.layers:
+            shapes = [layer.output_shape]
+            shapes.extend(_flatten_shapes(layer.input_shape))
+            size = sum(_prod(shape) or 0 for shape in shapes)
+            peak = max(peak, size)
+        return peak * self.itemsize
+
+    def summary(self):
+        """Get the total values as dict"""
+        return OrderedDict([
+            ('batch_size', self.batch_size),
+            ('n_params', self.n_params),
+            ('n_trainable_params', self.n_trainable_params),
+            ('forward_flops', self.forward_flops),
+            ('backward_flops', self.backward_flops),
+            ('parameter_bytes', self.parameter_bytes),
+            ('activation_bytes', self.activation_bytes),
+            ('peak_activation_bytes', self.peak_activation_bytes),
+        ])
+
+    def format(self):
+        """Format the estimate as table"""
+        lines = ['{:48s} {:20s} {:>12s} {:>12s} {:>12s}'.format(
+            'Scope', 'Output shape', 'Params', 'FLOPs (fw)', 'FLOPs (bw)')]
+        lines.append('-' * len(lines[0]))
+        for layer in self.layers:
+            lines.append('{:48s} {:20s} {:>12s} {:>12s} {:>12s}'.format(
+                '{} ({})'.format(layer.scope, layer.typename),
+                str(layer.output_shape), _format_number(layer.n_params),
+                _format_number(layer.forward_flops),
+                _format_number(layer.backward_flops)))
+        lines.append('-' * len(lines[0]))
+        for key, value in self.summary().items():
+            lines.append('{:48s} {:>12s}'.format(key, _format_number(value)))
+        return '\n'.join(lines)
+
+
+def _flatten_shapes(shape):
+    if isinstance(shape, dict):
+        return list(shape.values())
+    if isinstance(shape, list):
+        return shape
+    return [shape]
+
+
+def _format_number(value):
+    if value is None:
+        return '?'
+    for threshold, unit in [(1e12, 'T'), (1e9, 'G'), (1e6, 'M'), (1e3, 'K')]:
+        if value >= threshold:
+            return '{:.2f}{}'.format(value / threshold, unit)
+    return str(value)
+
+
+def _is_known(shapes):
+    return bool(shapes) and all(
+        shape is not None and None not in shape for shape in shapes)
+
+
+def _has_fixed_output(config):
+    """Check if output shape of layer is determined without input shape
+
+    Reshape with fully specified shape, such as the one following the input
+    layer of generator, starts known shapes even when model input is unknown.
+    """
+    if not config['typename'] == 'Reshape':
+        return False
+    shape = config.get('args', {}).get('shape', [])
+    return all(dim is not None and dim >= 0 for dim in shape)
+
+
+###############################################################################
+class _Estimator(object):
+    """Track shapes of Inputs, Tensors, Variables and Models by name"""
+    def __init__(self, batch_size, input_shapes, data_format):
+        self.batch_size = batch_size
+        self.input_shapes = input_shapes or {}
+        self.data_format = data_format
+        self.inputs, self.tensors, self.variables = {}, {}, {}
+        self.models = {}
+        self.layers = []
+        self.scopes = []
+
+    def _get_batch_shape(self, shape):
+        dims = list(shape)
+        if dims and dims[0] in [None, -1]:
+            dims[0] = self.batch_size
+        return tuple(None if dim == -1 else dim for dim in dims)
+
+    def _make_input(self, args):
+        name = args.get('name')
+        if name in self.input_shapes:
+            shape = (self.batch_size, ) + tuple(self.input_shapes[name])
+        else:
+            shape = self._get_batch_shape(args['shape'])
+        self.inputs[name] = shape
+        return shape
+
+    def _resolve_io(self, config):
+        type_, name = config['typename'], config.get('name')
+        if type_ == 'Input':
+            if config.get('reuse'):
+                return self.inputs.get(name)
+            return self._make_input(config['args'])
+        if type_ == 'Tensor':
+            return self.tensors.get(name)
+        if type_ == 'Variable':
+            return self.variables.get(name)
+        if type_ == 'Model':
+            return self.models.get(name, {}).get(config['fetch'])
+        raise ValueError('Unexpected IO type: {}'.format(type_))
+
+    def resolve(self, config):
+        """Get [list or dict of] shape from IO configuration"""
+        if _is_config(config):
+            return self._resolve_io(config)
+        if isinstance(config, list):
+            return [self.resolve(cfg) for cfg in config]
+        if isinstance(config, dict):
+            return OrderedDict(
+                (key, self.resolve(cfg)) for key, cfg in config.items())
+        raise ValueError('Invalid IO config: {}'.format(config))
+
+    def _get_scope(self, scope):
+        return '/'.join(self.scopes + [scope])
+
+    def _estimate(self, config, input_shape):
+        func = _LAYERS[config['typename']]
+        args = config.get('args', {})
+        data_format = args.get('data_format', self.data_format)
+        if config['typename'] == 'Conv2DTranspose':
+            parameters = config.get('parameters', {})
+            original = [
+                self.resolve(parameters[key]) if key in parameters else None
+                for key in ['original_input', 'original_filter']]
+            return func(args, input_shape, data_format, *original)
+        return func(args, input_shape, data_format)
+
+    def estimate_layer(self, config, input_shape, model=None):
+        """Estimate one Layer or Cost, and register its output shape"""
+        type_, args = config['typename'], config.get('args', {})
+        scope = self._get_scope(args.get('scope', type_))
+        shapes = _flatten_shapes(input_shape)
+        if type_ not in _LAYERS:
+            _LG.warning('Cannot estimate %s (%s).', scope, type_)
+            output, params, flops = None, {}, None
+        elif not _is_known(shapes) and not _has_fixed_output(config):
+            _LG.info('Input shape of %s is unknown.', scope)
+            output, params, flops = None, {}, None
+        else:
+            try:
+                output, params, flops = self._estimate(config, input_shape)
+            except ValueError as error:
+                _LG.warning('Cannot estimate %s: %s', scope, error)
+                output, params, flops = None, {}, None
+
+        # Parameters given in ``parameters`` are shared, thus not counted.
+        # ``original_filter`` of Conv2DTranspose only gives the shape of
+        # new ``filter``, so it does not match any parameter here.
+        shared = set(config.get('parameters', {}))
+        n_params = n_trainable = 0
+        for key, shape in params.items():
+            self.variables['{}/{}'.format(scope, key)] = shape
+            if key not in shared:
+                n_params += _prod(shape)
+                n_trainable += 0 if key in ['mean', 'var'] else _prod(shape)
+
+        backward = None
+        if flops is not None:
+            backward = 2 * flops if n_trainable else flops
+        self.tensors['{}/output'.format(scope)] = output
+        self.layers.append(LayerEstimate(
+            model=model, scope=scope, typename=type_,
+            input_shape=input_shape, output_shape=output,
+            n_params=n_params, n_trainable_params=n_trainable,
+            forward_flops=flops, backward_flops=backward))
+        return output
+
+    ###########################################################################
+    def _estimate_sequential(
+            self, name, layer_configs, input_config=None, **_):
+        if input_config:
+            shape = self.resolve(input_config)
+        elif name in self.input_shapes:
+            shape = (self.batch_size, ) + tuple(self.input_shapes[name])
+        else:
+            _LG.warning(
+                'Input of Sequential model `%s` is unknown. '
+                'Give the shape with `input_shapes`.', name)
+            shape = None
+        self.models[name] = {'input': shape}
+        for config in layer_configs:
+            shape = self.estimate_layer(config, shape, model=name)
+        self.models[name]['output'] = shape
+
+    def _estimate_graph(
+            self, name, node_configs, input_config=None, output_config=None,
+            **_):
+        self.models[name] = {}
+        if input_config:
+            self.models[name]['input'] = self.resolve(input_config)
+        for config in node_configs:
+            if config['typename'] in _OPTIMIZERS:
+                continue
+            input_shape = None
+            if 'input_config' in config:
+                input_shape = self.resolve(config['input_config'])
+            self.estimate_layer(config, input_shape, model=name)
+        if output_config:
+            self.models[name]['output'] = self.resolve(output_config)
+
+    def _estimate_container(
+            self, name, model_configs, input_config=None, output_config=None,
+            **_):
+        self.models[name] = {}
+        if input_config:
+            self.models[name]['input'] = self.resolve(input_config)
+        for config in model_configs:
+            self.estimate_model(config)
+        if output_config:
+            self.models[name]['output'] = self.resolve(output_config)
+
+    def estimate_model(self, config):
+        """Estimate model recursively"""
+        if isinstance(config, list):
+            for cfg in config:
+                self.estimate_model(cfg)
+            return
+        if not _is_config(config):
+            for cfg in config.values():
+                self.estimate_model(cfg)
+            return
+
+        funcs = {
+            'Sequential': self._estimate_sequential,
+            'Graph': self._estimate_graph,
+            'Container': self._estimate_container,
+        }
+        type_ = config['typename']
+        if type_ not in funcs:
+            raise ValueError('Unexpected model type: {}'.format(type_))
+        args = dict(config.get('args', {}))
+        args['name'] = args.get('name') or config.get('name')
+        if 'scope' in config:
+            self.scopes.append(config['scope'])
+        funcs[type_](**args)
+        if 'scope' in config:
+            self.scopes.pop()
+
+
+def estimate_model(
+        model_config, batch_size=32, input_shapes=None, dtype=None,
+        conv_format=None):
+    """Estimate output shapes, parameters, FLOPs and memory of model
+
+    The estimation is carried out on model configuration, without building
+    model, so backend is not loaded.
+
+    Parameters
+    ----------
+    model_config : [list or dict of] model configuration
+        Model configuration, which is given to :any:`make_model`.
+
+    batch_size : int
+        Batch size substituted for ``null`` in the first dimension of Input.
+
+    input_shapes : dict
+        Shapes without batch dimension keyed by the name of ``Input`` or
+        the name of ``Sequential`` model which does not have
+        ``input_config``. Given shapes take precedence over configuration.
+
+    dtype : str
+        Data type of parameters and activations.
+        Defaults to :any:`get_nn_dtype`.
+
+    conv_format : str
+        ``NCHW`` or ``NHWC``. Defaults to ``NCHW`` for Theano backend and
+        :any:`get_nn_conv_format` otherwise.
+
+    Returns
+    -------
+    ModelEstimate
+        Estimate of each layer and their total.
+
+    Notes
+    -----
+    FLOPs count multiply-add as two operations, and element-wise operations
+    are weighted roughly. Backward FLOPs are estimated as twice the forward
+    FLOPs for layers with trainable parameters (gradients with respect to
+    input and parameters) and equal to the forward FLOPs otherwise.
+    ``Anonymous`` layers are estimated only when ``exp`` consists of
+    element-wise operations on single input. Optimizers are not estimated.
+    """
+    if conv_format is None:
+        conv_format = (
+            'NCHW' if luchador.get_nn_backend() in ('theano', 'numpy') else
+            luchador.get_nn_conv_format())
+    itemsize = np.dtype(dtype or luchador.get_nn_dtype()).itemsize
+    estimator = _Estimator(batch_size, input_shapes, conv_format)
+    estimator.estimate_model(model_config)
+    return ModelEstimate(estimator.layers, batch_size, itemsize)
+
+
+###############################################################################
+def _parse_command_line_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('model', help='Model configuration YAML file.')
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument(
+        '--param', action='append', default=[], metavar='KEY=VALUE',
+        help='Parameter to fill model configuration. Value is parsed as YAML.')
+    parser.add_argument(
+        '--input-shape', action='append', default=[], metavar='NAME=SHAPE',
+        help='Shape of Input or Sequential model without batch dimension. '
+        'Comma-separated, such as `input_image=1,28,28`.')
+    parser.add_argument('--dtype')
+    parser.add_argument('--conv-format', choices=['NCHW', 'NHWC'])
+    parser.add_argument(
+        '--json', action='store_true', help='Print result in JSON.')
+    return parser.parse_args()
+
+
+def _parse_key_values(items, parse):
+    ret = {}
+    for item in items:
+        key, value = item.split('=', 1)
+        ret[key] = parse(value)
+    return ret
+
+
+def main():
+    """Entry point for command line"""
+    args = _parse_command_line_args()
+    parameters = _parse_key_values(args.param, yaml.safe_load)
+    input_shapes = _parse_key_values(
+        args.input_shape, lambda val: [int(dim) for dim in val.split(',')])
+    config = load_config(args.model, **parameters)
+    estimate = estimate_model(
+        config, batch_size=args.batch_size, input_shapes=input_shapes,
+        dtype=args.dtype, conv_format=args.conv_format)
+    if args.json:
+        print(json.dumps(OrderedDict([
+            ('summary', estimate.summary()),
+            ('layers', [layer._asdict() for layer in estimate.layers]),
+        ]), indent=2))
+    else:
+        print(estimate.format())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,438 @@
+"""Write TensorBoard event files without Tensorflow
+
+Summary protocol buffers are encoded by hand, following the definitions of
+``tensorflow/core/framework/summary.proto`` and
+``tensorflow/core/util/event.proto``. Only the fields used by
+:any:`SummaryWriter` are implemented. CRC32C of records is computed with
+``google_crc32c`` or ``crc32c`` package when installed.
+"""
+from __future__ import division
+from __future__ import absolute_import
+
+import io
+import os
+import time
+import wave
+import zlib
+import struct
+import socket
+import logging
+
+import numpy as np
+
+try:
+    from google_crc32c import value as _crc32c_ext
+except ImportError:
+    try:
+        from crc32c import crc32c as _crc32c_ext
+    except ImportError:
+        _crc32c_ext = None
+
+__all__ = [
+    'EventFileWriter', 'encode_scalar', 'encode_histogram',
+    'encode_histogram_stats', 'encode_image', 'encode_audio',
+]
+_LG = logging.getLogger(__name__)
+
+
+###############################################################################
+# Protocol buffer wire format
+def _varint(value):
+    buf = bytearray()
+    value &= 0xFFFFFFFFFFFFFFFF  # Negative int64 is encoded in 10 bytes
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            buf.append(bits | 0x80)
+        else:
+            buf.append(bits)
+            return bytes(buf)
+
+
+def _key(field, wire_type):
+    return _varint((field << 3) | wire_type)
+
+
+def _int(field, value):
+    return _key(field, 0) + _varint(int(value))
+
+
+def _double(field, value):
+    return _key(field, 1) + struct.pack('<d', value)
+
+
+def _float(field, value):
+    return _key(field, 5) + struct.pack('<f', value)
+
+
+def _bytes(field, value):
+    if not isinstance(value, bytes):
+        value = value.encode('utf-8')
+    return _key(field, 2) + _varint(len(value)) + value
+
+
+def _packed_double(field, values):
+    data = np.asarray(values, dtype='<f8').tobytes()
+    return _key(field, 2) + _varint(len(data)) + data
+
+
+###############################################################################
+# Summary.Value
+def _value(tag, data):
+    return _bytes(1, tag) + data
+
+
+def encode_scalar(tag, value):
+    """Encode scalar into serialized ``Summary.Value``"""
+    return _value(tag, _float(2, float(value)))
+
+
+def _get_default_bucket_limits():
+    # Same as the buckets of Tensorflow's histogram summary
+    limits, value = [], 1e-12
+    while value < 1e20:
+        limits.append(value)
+        value *= 1.1
+    limits = [-v for v in reversed(limits)] + [0] + limits
+    return np.asarray(limits + [np.finfo(np.float64).max])
+
+
+_BUCKET_LIMITS = _get_default_bucket_limits()
+
+
+def _histogram_buckets(values):
+    """Count values into default buckets and drop runs of empty buckets
+
+    Bucket ``i`` counts values in ``[limit[i-1], limit[i])``, as in
+    Tensorflow. An empty bucket is retained just before each non-empty
+    bucket, so that the left edge of the non-empty bucket is preserved.
+    """
+    indices = np.searchsorted(_BUCKET_LIMITS, values, side='right')
+    indices = np.minimum(indices, len(_BUCKET_LIMITS) - 1)
+    counts = np.bincount(indices, minlength=len(_BUCKET_LIMITS))
+    limits, buckets = [], []
+    for index in np.flatnonzero(counts):
+        if index > 0 and not counts[index - 1] and (
+                not limits or limits[-1] < _BUCKET_LIMITS[index - 1]):
+            limits.append(_BUCKET_LIMITS[index - 1])
+            buckets.append(0)
+        limits.append(_BUCKET_LIMITS[index])
+        buckets.append(counts[index])
+    return limits, buckets
+
+
+def _encode_histo(tag, min_, max_, num, sum_, sum_squares, limits, buckets):
+    histo = b''.join([
+        _double(1, min_), _double(2, max_), _double(3, num),
+        _double(4, sum_), _double(5, sum_squares),
+        _packed_double(6, limits), _packed_double(7, buckets),
+    ])
+    return _value(tag, _bytes(5, histo))
+
+
+def encode_histogram(tag, values):
+    """Encode array into serialized ``Summary.Value`` of histogram"""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    values = values[np.isfinite(values)]
+    limits, buckets = _histogram_buckets(values)
+    return _encode_histo(
+        tag, values.min() if values.size else 0.,
+        values.max() if values.size else 0., values.size,
+        values.sum(), np.dot(values, values), limits, buckets)
+
+
+def encode_histogram_stats(tag, stats):
+    """Encode histogram computed in graph into serialized ``Summary.Value``
+
+    Parameters
+    ----------
+    tag : str
+        Name of summary
+
+    stats : NumPy NDArray
+        1D array produced by :func:`luchador.nn.ops.histogram`, that is,
+        minimum, maximum, number of values, sum, sum of squares and the
+        counts of buckets of equal width between minimum and maximum.
+    """
+    stats = np.asarray(stats, dtype=np.float64)
+    min_, max_, num, sum_, sum_squares = stats[:5]
+    buckets = stats[5:]
+    if max_ > min_:
+        width = (max_ - min_) / len(buckets)
+        limits = min_ + width * np.arange(1, len(buckets) + 1)
+        limits[-1] = max_
+    else:
+        limits, buckets = [max_], [num]
+    return _encode_histo(
+        tag, min_, max_, num, sum_, sum_squares, limits, buckets)
+
+
+def _png_chunk(type_, data):
+    chunk = type_ + data
+    crc = zlib.crc32(chunk) & 0xFFFFFFFF
+    return struct.pack('>I', len(data)) + chunk + struct.pack('>I', crc)
+
+
+def _encode_png(image):
+    """Encode uint8 array of shape [height, width, channel] into PNG"""
+    height, width, channels = image.shape
+    color_type = {1: 0, 2: 4, 3: 2, 4: 6}[channels]
+    # Each scan line is prefixed with filter type 0 (None)
+    raw = np.concatenate([
+        np.zeros((height, 1), dtype=np.uint8),
+        image.reshape(height, width * channels),
+    ], axis=1)
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        _png_chunk(b'IHDR', header),
+        _png_chunk(b'IDAT', zlib.compress(raw.tobytes())),
+        _png_chunk(b'IEND', b''),
+    ])
+
+
+def _to_uint8(images):
+    """Scale float images in the same way as Tensorflow's image summary
+
+    Each image is scaled independently. Non-negative images are scaled so
+    that the maximum becomes 255. Otherwise, images are scaled so that 0
+    becomes 128 and the largest absolute value becomes 1 or 255.
+    """
+    if images.dtype == np.uint8:
+        return images
+    return np.stack([_scale_image(image) for image in images])
+
+
+def _scale_image(image):
+    image = image.astype(np.float64)
+    vmin, vmax = image.min(), image.max()
+    if vmin >= 0:
+        scale = 255. / vmax if vmax else 0.
+        offset = 0.
+    else:
+        scale = 127. / max(-vmin, vmax)
+        offset = 128.
+    return np.clip(image * scale + offset, 0, 255).astype(np.uint8)
+
+
+def _get_tags(tag, type_, n_outputs, max_outputs):
+    # As in Tensorflow, the tag depends on the number of requested outputs,
+    # not on the number of produced outputs.
+    if max_outputs == 1:
+        return ['{}/{}'.format(tag, type_)]
+    return ['{}/{}/{}'.format(tag, type_, i) for i in range(n_outputs)]
+
+
+def encode_image(tag, images, max_outputs=3):
+    """Encode images into list of serialized ``Summary.Value``
+
+    Parameters
+    ----------
+    tag : str
+        Name of summary
+
+    images : NumPy NDArray
+        4D array of shape [batch, height, width, channel], where channel is
+        1, 3 or 4.
+
+    max_outputs : int
+        The maximum number of images to encode.
+    """
+    images = _to_uint8(np.asarray(images)[:max_outputs])
+    tags = _get_tags(tag, 'image', len(images), max_outputs)
+    values = []
+    for tag_, image in zip(tags, images):
+        height, width, channels = image.shape
+        data = b''.join([
+            _int(1, height), _int(2, width), _int(3, channels),
+            _bytes(4, _encode_png(image)),
+        ])
+        values.append(_value(tag_, _bytes(4, data)))
+    return values
+
+
+def _encode_wav(audio, sample_rate):
+    """Encode float array of shape [frames, channels] into 16-bit WAV"""
+    pcm = (np.clip(audio, -1, 1) * 32767).astype('<i2')
+    buffer_ = io.BytesIO()
+    writer = wave.open(buffer_, 'wb')
+    writer.setnchannels(audio.shape[1])
+    writer.setsampwidth(2)
+    writer.setframerate(int(sample_rate))
+    writer.writeframes(pcm.tobytes())
+    writer.close()
+    return buffer_.getvalue()
+
+
+def encode_audio(tag, audios, sample_rate, max_outputs=3):
+    """Encode audio into list of serialized ``Summary.Value``
+
+    Parameters
+    ----------
+    tag : str
+        Name of summary
+
+    audios : NumPy NDArray
+        2D array of shape [batch, frames] or 3D array of shape
+        [batch, frames, channels], with values in [-1, 1].
+
+    sample_rate : float
+        Sample rate in Hz.
+
+    max_outputs : int
+        The maximum number of audio clips to encode.
+    """
+    audios = np.asarray(audios, dtype=np.float64)[:max_outputs]
+    if audios.ndim == 2:
+        audios = audios[:, :, None]
+    tags = _get_tags(tag, 'audio', len(audios), max_outputs)
+    values = []
+    for tag_, audio in zip(tags, audios):
+        data = b''.join([
+            _float(1, sample_rate), _int(2, audio.shape[1]),
+            _int(3, audio.shape[0]),
+            _bytes(4, _encode_wav(audio, sample_rate)),
+            _bytes(5, 'audio/wav'),
+        ])
+        values.append(_value(tag_, _bytes(6, data)))
+    return values
+
+
+def encode_summary(values):
+    """Build serialized ``Summary`` from serialized ``Summary.Value``"""
+    return b''.join(_bytes(1, value) for value in values)
+
+
+###############################################################################
+# Record format
+def _make_crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0x82F63B78 if crc & 1 else 0)
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+_CRC32C_CHUNK = 256
+
+
+def _make_crc32c_chunk_table(table, size):
+    """Build table of the contribution of byte at each position in chunk
+
+    CRC without initial and final XOR is linear, so CRC of chunk is XOR of
+    ``chunk_table[i, chunk[i]]``. Contribution of byte is shifted by the
+    zero bytes which follow it.
+    """
+    table = np.asarray(table, dtype='uint32')
+    ret = np.empty((size, 256), dtype='uint32')
+    ret[-1] = table
+    for i in range(size - 2, -1, -1):
+        ret[i] = table[ret[i + 1] & 0xFF] ^ (ret[i + 1] >> 8)
+    return ret
+
+
+_CRC32C_CHUNK_TABLE = _make_crc32c_chunk_table(_CRC32C_TABLE, _CRC32C_CHUNK)
+
+
+def _crc32c_bytewise(data, crc=0xFFFFFFFF):
+    for byte in bytearray(data):
+        crc = _CRC32C_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _crc32c_chunkwise(data):
+    """Compute CRC32C with table lookup vectorized over chunks"""
+    table, size = _CRC32C_CHUNK_TABLE, _CRC32C_CHUNK
+    # Prepend zeros so that data is split into chunks. Zeros do not change
+    # CRC of which initial value is 0, so initial value is XORed into the
+    # first four bytes of data instead.
+    n_pad = -len(data) % size
+    buf = np.zeros(n_pad + len(data), dtype='uint8')
+    buf[n_pad:] = np.frombuffer(data, dtype='uint8')
+    buf[n_pad:n_pad + 4] ^= 0xFF
+    chunks = buf.reshape(-1, size)
+    values = np.bitwise_xor.reduce(
+        table[np.arange(size), chunks], axis=1).tolist()
+
+    crc = 0
+    for value in values:
+        # CRC carried to next chunk is XORed into its first four bytes
+        crc = value ^ int(
+            table[0, crc & 0xFF] ^ table[1, (crc >> 8) & 0xFF] ^
+            table[2, (crc >> 16) & 0xFF] ^ table[3, crc >> 24])
+    return crc ^ 0xFFFFFFFF
+
+
+def _crc32c(data):
+    if _crc32c_ext is not None:
+        return _crc32c_ext(data)
+    if len(data) < _CRC32C_CHUNK:
+        return _crc32c_bytewise(data)
+    return _crc32c_chunkwise(data)
+
+
+def _masked_crc32c(data):
+    crc = _crc32c(data)
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+def _encode_record(data):
+    header = struct.pack('<Q', len(data))
+    return b''.join([
+        header, struct.pack('<I', _masked_crc32c(header)),
+        data, struct.pack('<I', _masked_crc32c(data)),
+    ])
+
+
+def _encode_event(step, summary=None, file_version=None):
+    event = _double(1, time.time()) + _int(2, step)
+    if file_version is not None:
+        event += _bytes(3, file_version)
+    if summary is not None:
+        event += _bytes(5, summary)
+    return event
+
+
+class EventFileWriter(object):
+    """Write serialized summaries to TensorBoard event file
+
+    Compatible with the subset of ``tf.summary.FileWriter`` interface used by
+    :any:`SummaryWriter`.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory to create event file in
+    """
+    def __init__(self, output_dir):
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        filename = 'events.out.tfevents.{:010d}.{}.{}'.format(
+            int(time.time()), socket.gethostname(), os.getpid())
+        self.filepath = os.path.join(output_dir, filename)
+        self._file = open(self.filepath, 'wb')
+        self._write(_encode_event(0, file_version='brain.Event:2'))
+
+    def _write(self, event):
+        self._file.write(_encode_record(event))
+
+    def add_summary(self, summary, global_step=None):
+        """Add serialized ``Summary`` to event file"""
+        self._write(_encode_event(global_step or 0, summary=summary))
+
+    def add_graph(self, *_, **__):  # pylint: disable=no-self-use
+        """Graph is not supported. Ignored with warning"""
+        _LG.warning('Graph summary requires Tensorflow backend.')
+
+    def flush(self):
+        """Flush event file"""
+        self._file.flush()
+
+    def close(self):
+        """Close event file"""
+        if not self._file.closed:
+            self._file.close()
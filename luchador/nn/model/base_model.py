@@ -2,23 +2,16 @@
 from __future__ import absolute_import
 
 import logging
-from collections import OrderedDict
 
-from luchador.util import fetch_subclasses
+from luchador.util import RegistryMixin
 from ..core import get_variable_scope
+from ..core.base.wrapper.store import register, retrieve
 
 __all__ = ['BaseModel', 'fetch_model', 'get_model']
 _LG = logging.getLogger(__name__)
-_MODELS = OrderedDict()
 
 
-def _register(name, model):
-    if name in _MODELS:
-        _LG.warning('Model `%s` already exists.', name)
-    _MODELS[name] = model
-
-
-class BaseModel(object):  # pylint: disable=too-few-public-methods
+class BaseModel(RegistryMixin):  # pylint: disable=too-few-public-methods
     """Base Model class"""
     def __init__(self, name=None):
         super(BaseModel, self).__init__()
@@ -29,7 +22,7 @@ class BaseModel(object):  # pylint: disable=too-few-public-methods
             scope = get_variable_scope().name
             if scope:
                 name = '{}/{}'.format(scope, name)
-            _register(name, self)
+            register('model', name, self)
         self.name = name
 
 
@@ -51,10 +44,10 @@ def fetch_model(name):
     ValueError
         When ``Model`` class with the given name is not found
     """
-    for class_ in fetch_subclasses(BaseModel):
-        if class_.__name__ == name:
-            return class_
-    raise ValueError('Unknown model: {}'.format(name))
+    class_ = BaseModel.fetch_subclass(name)
+    if class_ is None:
+        raise ValueError('Unknown model: {}'.format(name))
+    return class_
 
 
 def get_model(name):
@@ -72,7 +65,7 @@ def get_model(name):
     try:
         scope = get_variable_scope().name
         name_ = '{}/{}'.format(scope, name) if scope else name
-        return _MODELS[name_]
-    except KeyError:
+        return retrieve('model', name_)
+    except ValueError:
         pass
-    return _MODELS[name]
+    return retrieve('model', name)
@@ -0,0 +1,134 @@
+"""Track distributions of variables and gradients during training"""
+from __future__ import absolute_import
+
+import logging
+from collections import OrderedDict
+
+from luchador.util import is_iteratable
+from .core import ops, get_grad
+
+__all__ = ['HistogramMonitor']
+_LG = logging.getLogger(__name__)
+
+
+class HistogramMonitor(object):
+    """Summarize distributions of tensors with histograms computed in graph
+
+    Instead of fetching the whole tensor and summarizing it on host, bucket
+    counts and moments are computed by :func:`luchador.nn.ops.histogram`
+    and fetched in the same ``Session.run`` call as the training step.
+    Only ``n_bins + 5`` values are transferred for each tensor.
+
+    Parameters
+    ----------
+    writer : SummaryWriter
+        Writer to which histograms are written.
+
+    interval : int
+        Histograms are fetched and written every this number of steps.
+        Other steps run without additional outputs.
+
+    n_bins : int
+        Number of buckets in histogram
+
+    Examples
+    --------
+    >>> params = model.get_parameters_to_train()
+    >>> with nn.variable_scope('optimization'):
+    >>>     update = optimizer.minimize(loss, wrt=params)
+    >>>     monitor = nn.HistogramMonitor(writer, interval=100)
+    >>>     monitor.add_variables(params, gradients=True)
+    >>> for step in range(n_steps):
+    >>>     monitor.run(session, step, outputs=loss, updates=update)
+    """
+    def __init__(self, writer, interval=100, n_bins=30):
+        if interval < 1:
+            raise ValueError('`interval` must be positive.')
+        self.writer = writer
+        self.interval = interval
+        self.n_bins = n_bins
+        self._histograms = OrderedDict()
+
+    def add(self, tensors):
+        """Add tensors to monitor
+
+        Parameters
+        ----------
+        tensors : dict
+            Key : str
+                Summary name
+            Value : Tensor or Variable
+                Tensor of which distribution is summarized
+        """
+        for name, tensor in tensors.items():
+            if name in self._histograms:
+                raise ValueError('`{}` is already monitored.'.format(name))
+            self._histograms[name] = ops.histogram(tensor, n_bins=self.n_bins)
+
+    def add_variables(self, variables, gradients=False):
+        """Add Variables, and optionally their gradients, to monitor
+
+        Variables are summarized with their names. Gradients are fetched with
+        :func:`luchador.nn.get_grad` and summarized with ``_grad`` suffix,
+        thus this method must be called in the scope where gradients are
+        defined.
+
+        Parameters
+        ----------
+        variables : list of Variables
+
+        gradients : bool
+            Monitor gradients as well.
+        """
+        tensors = OrderedDict()
+        for variable in variables:
+            tensors[variable.name] = variable
+            if gradients:
+                tensors['{}_grad'.format(variable.name)] = get_grad(variable)
+        self.add(tensors)
+
+    def is_sampling_step(self, global_step):
+        """Return True if histograms are fetched at the given step"""
+        return bool(self._histograms) and global_step % self.interval == 0
+
+    def run(self, session, global_step, outputs=None, inputs=None,
+            updates=None, givens=None, name=None):
+        """Run ``session.run`` and summarize histograms at sampling steps
+
+        Parameters
+        ----------
+        session : Session
+            Session to run the computation
+
+        global_step : int
+            Global step value used to decide sampling and to record with
+            the summary.
+
+        outputs, inputs, updates, givens, name
+            Passed to ``Session.run``. When ``name`` is given, the function
+            with histogram outputs is cached with ``/histogram`` suffix.
+
+        Returns
+        -------
+        [list of] NumPy ND Arrays
+            The values corresponding to the given ``outputs``
+        """
+        if not self.is_sampling_step(global_step):
+            return session.run(
+                outputs=outputs, inputs=inputs, updates=updates,
+                givens=givens, name=name)
+
+        single = outputs is not None and not is_iteratable(outputs)
+        outputs = [outputs] if single else list(outputs or [])
+        values = session.run(
+            outputs=outputs + list(self._histograms.values()),
+            inputs=inputs, updates=updates, givens=givens,
+            name='{}/histogram'.format(name) if name else None)
+
+        n_outputs = len(outputs)
+        dataset = OrderedDict(zip(self._histograms, values[n_outputs:]))
+        self.writer.summarize(
+            summary_type='histogram_stats', global_step=global_step,
+            dataset=dataset)
+        values = list(values[:n_outputs])
+        return values[0] if single else values
@@ -0,0 +1,247 @@
+"""Implement input pipeline which prepares input values in background"""
+from __future__ import absolute_import
+
+import logging
+import itertools
+import threading
+import multiprocessing
+
+import numpy as np
+from six.moves import queue
+
+__all__ = ['InputPipeline']
+_LG = logging.getLogger(__name__)
+
+_TIMEOUT = 0.1
+
+
+class _Error(object):  # pylint: disable=too-few-public-methods
+    """Carry exception raised in worker to the consumer"""
+    def __init__(self, message):
+        self.message = message
+
+
+class _Done(object):  # pylint: disable=too-few-public-methods
+    """Notify that a worker finished, as the generator is exhausted"""
+    pass
+
+
+class _NullLock(object):
+    """Lock which does nothing, for iterator consumed by one process"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+def _put(queue_, stop_event, item):
+    while not stop_event.is_set():
+        try:
+            queue_.put(item, timeout=_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _produce(generator, lock, counter, queue_, stop_event, reseed):
+    """Put pairs of sequence number and values to queue
+
+    Values from iterator are numbered in the order they are fetched, so
+    that consumer can restore the order. Values from callable are not
+    numbered, as calls are independent.
+    """
+    if reseed:
+        # Forked processes inherit the same random state
+        np.random.seed()
+    while not stop_event.is_set():
+        try:
+            if lock is None:
+                item = None, generator()
+            else:
+                with lock:
+                    item = next(counter), next(generator)
+        except StopIteration:
+            _put(queue_, stop_event, _Done())
+            return
+        except Exception as error:  # pylint: disable=broad-except
+            _LG.exception('Input pipeline worker failed.')
+            _put(queue_, stop_event, _Error(repr(error)))
+            return
+        if not _put(queue_, stop_event, item):
+            return
+
+
+class InputPipeline(object):
+    """Prepare input values in background workers and queue them
+
+    Host-side preparation such as shuffling, slicing and sampling of input
+    values is run in background threads or processes, so that it overlaps
+    with computation in ``Session.run``.
+
+    Parameters
+    ----------
+    generator : callable or iterator
+        Source of input values. If callable, it is called without argument
+        and must return the values for one step, either as dict or list.
+        Raising ``StopIteration`` ends the pipeline.
+        If iterator, values are fetched with ``next``. Iterator is accessed
+        by one worker at a time, and values are returned in the order they
+        are fetched, even when multiple workers are used.
+
+    inputs : list of Input or None
+        When given, the list of values returned by ``generator`` is paired
+        with these Inputs to create dict which can be given to
+        ``Session.run`` as ``inputs``.
+
+    n_workers : int
+        The number of workers. When more than one thread worker is used,
+        callable ``generator`` must be thread-safe.
+
+    queue_size : int
+        The maximum number of prepared values to keep. When the queue is
+        full, workers wait for values to be consumed.
+
+    mode : str
+        ``thread`` or ``process``. In ``process`` mode, each worker has its
+        own copy of ``generator`` state and random seed, and values are
+        pickled to be passed to the main process.
+
+    Examples
+    --------
+    >>> def _sample():
+    >>>     batch = dataset.train.next_batch(32)
+    >>>     return [batch.data, batch.label]
+    >>>
+    >>> pipeline = nn.InputPipeline(_sample, inputs=[data, label])
+    >>> for _ in range(n_iterations):
+    >>>     session.run(
+    >>>         outputs=loss, inputs=pipeline.get(), updates=update_op)
+    >>> pipeline.close()
+
+    Without ``inputs``, the values can be given to the function created
+    with ``Session.make_callable``.
+
+    >>> train = session.make_callable(
+    >>>     outputs=loss, inputs=[data, label], updates=update_op)
+    >>> pipeline = nn.InputPipeline(_sample)
+    >>> for _ in range(n_iterations):
+    >>>     train(*pipeline.get())
+    """
+    def __init__(self, generator, inputs=None, n_workers=1,
+                 queue_size=4, mode='thread'):
+        if mode not in ['thread', 'process']:
+            raise ValueError(
+                '`mode` must be either "thread" or "process". '
+                'Found: {}'.format(mode))
+        if n_workers < 1:
+            raise ValueError('`n_workers` must be positive.')
+
+        self.inputs = inputs
+        self.mode = mode
+
+        lock, counter = None, itertools.count()
+        if not callable(generator):
+            generator = iter(generator)
+            if mode == 'thread':
+                lock = threading.Lock()
+            else:
+                # Each process would have its own copy of iterator
+                lock, n_workers = _NullLock(), 1
+
+        if mode == 'thread':
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._stop_event = threading.Event()
+            worker_class = threading.Thread
+        else:
+            self._queue = multiprocessing.Queue(maxsize=queue_size)
+            self._stop_event = multiprocessing.Event()
+            worker_class = multiprocessing.Process
+
+        self._workers = []
+        for _ in range(n_workers):
+            worker = worker_class(
+                target=_produce,
+                args=(generator, lock, counter, self._queue,
+                      self._stop_event, mode == 'process'),
+            )
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._n_running = n_workers
+        self._pending, self._index = {}, 0
+
+    def _format(self, values):
+        if self.inputs is None:
+            return values
+        return dict(zip(self.inputs, values))
+
+    def get(self, timeout=None):
+        """Get input values for the next step
+
+        Parameters
+        ----------
+        timeout : float or None
+            Seconds to wait for each value from workers. If None, wait until
+            values are ready.
+
+        Returns
+        -------
+        dict or list
+            If ``inputs`` was given, dict of Input and value pairs.
+            Otherwise, the values returned by ``generator``.
+
+        Raises
+        ------
+        StopIteration
+            When ``generator`` is exhausted in all the workers.
+        RuntimeError
+            When ``generator`` raised exception in worker.
+        queue.Empty
+            When values are not ready within ``timeout``. Values which
+            arrive later are returned by subsequent calls.
+        """
+        while True:
+            if self._index in self._pending:
+                values = self._pending.pop(self._index)
+                self._index += 1
+                return self._format(values)
+            if not self._n_running:
+                raise StopIteration()
+            item = self._queue.get(timeout=timeout)
+            if isinstance(item, _Done):
+                self._n_running -= 1
+                continue
+            if isinstance(item, _Error):
+                raise RuntimeError(
+                    'Input pipeline worker failed: {}'.format(item.message))
+            index, values = item
+            if index is None:
+                return self._format(values)
+            # Values fetched later by other workers may arrive first
+            self._pending[index] = values
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.get()
+
+    next = __next__
+
+    def close(self):
+        """Stop workers and discard the queued values"""
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(timeout=1)
+            if self.mode == 'process' and worker.is_alive():
+                worker.terminate()
+        self._workers = []
+        self._n_running = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
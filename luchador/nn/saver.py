@@ -3,28 +3,74 @@ from __future__ import division
 from __future__ import absolute_import
 
 import os
+import glob
+import json
 import time
 import errno
+import hashlib
+import tempfile
 import logging
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import h5py
 import numpy as np
 
 import luchador
+from luchador.util import BackgroundWorker
 
 _LG = logging.getLogger(__name__)
 
 __all__ = ['Saver']
 
 
-def _write_data_to_file(file_, data):
+def _get_digest(value):
+    value = np.ascontiguousarray(value)
+    hasher = hashlib.sha1()
+    hasher.update('{}{}'.format(value.dtype.str, value.shape).encode('utf-8'))
+    hasher.update(value.view(np.uint8))
+    return hasher.hexdigest()
+
+
+class _CompressionPolicy(object):
+    """Dataset policy which applies the same filters to arrays
+
+    Defined as class, so that it can be passed to shard writer processes.
+    """
+    def __init__(self, compression=None, compression_opts=None,
+                 shuffle=False):
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.shuffle = shuffle
+
+    def __call__(self, _, value):
+        # Filters cannot be applied to scalar. Without filters, contiguous
+        # layout is used, which allows memory-mapped loading.
+        if not value.ndim or not (self.compression or self.shuffle):
+            return {}
+        return {
+            'compression': self.compression,
+            'compression_opts': self.compression_opts,
+            'shuffle': self.shuffle,
+        }
+
+
+def _write_data_to_file(file_, data, links=None, policy=None):
     for key, value in data.items():
         _LG.debug('  Saving: %10s %24s %s', value.dtype, value.shape, key)
         if key in file_:
             del file_[key]
 
-        chunks = None if value.size == 1 else True
-        file_.create_dataset(key, data=value, chunks=chunks)
+        options = policy(key, value) if policy else {}
+        file_.create_dataset(key, data=value, **options)
+
+    for key, filepath in (links or {}).items():
+        _LG.debug('  Linking: %s -> %s', key, filepath)
+        if key in file_:
+            del file_[key]
+        # Files are in the same directory, and HDF5 resolves relative path
+        # from the directory of the linking file.
+        file_[key] = h5py.ExternalLink(os.path.basename(filepath), key)
 
     if 'LUCHADOR_NN_BACKEND' not in file_:
         data = np.string_(luchador.get_nn_backend())
@@ -41,6 +87,50 @@ def _write_data_to_file(file_, data):
     file_.flush()
 
 
+def _write_shard(args):
+    filepath, data, policy = args
+    file_ = h5py.File(filepath, 'a')
+    try:
+        _write_data_to_file(file_, data, policy=policy)
+    finally:
+        file_.close()
+
+
+def _split_by_size(data, n_shards):
+    """Distribute arrays to shards so that shards have similar sizes"""
+    shards = [OrderedDict() for _ in range(n_shards)]
+    sizes = [0] * n_shards
+    for key in sorted(data, key=lambda k: data[k].nbytes, reverse=True):
+        index = sizes.index(min(sizes))
+        shards[index][key] = data[key]
+        sizes[index] += data[key].nbytes
+    return [shard for shard in shards if shard]
+
+
+def _get_shard_path(filepath, index, n_shards):
+    return '{}-shard-{:03d}-of-{:03d}.h5'.format(
+        os.path.splitext(filepath)[0], index, n_shards)
+
+
+def _list_shards(filepath):
+    return glob.glob('{}-shard-*.h5'.format(os.path.splitext(filepath)[0]))
+
+
+def _write_json(filepath, obj):
+    """Write JSON to temporary file then rename, so that readers never see
+    partially written file"""
+    fd_, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(filepath) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd_, 'w') as file_:
+            json.dump(obj, file_, indent=2, sort_keys=True)
+        os.rename(tmp_path, filepath)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class Saver(object):
     """Save set of NumPy arrays into HDF5 format
 
@@ -59,9 +149,69 @@ class Saver(object):
 
     prefix : str
         file name prefix
+
+    background : bool
+        When True, :any:`save` copies the given arrays and returns
+        immediately. Writing files and removing old files are performed in
+        background thread. Call :any:`wait` to ensure the files are written.
+
+    max_pending : int
+        Background mode only. The maximum number of snapshots waiting to be
+        written. When exceeded, :any:`save` blocks until a write completes,
+        so that memory used by snapshots is bounded.
+
+    incremental : bool
+        When True, arrays identical to the ones saved previously are not
+        written again. Instead, the new file contains HDF5 external links to
+        the file where the array was written, which are resolved when the
+        file is read. Files referenced by other files are not removed until
+        the referencing files are removed.
+
+    compression : str or None
+        Compression filter applied to non-scalar arrays, such as ``gzip``
+        and ``lzf``. Compressed arrays are stored in chunked layout and
+        cannot be memory-mapped at loading.
+
+    compression_opts : int or None
+        Option for compression filter, such as compression level of
+        ``gzip``.
+
+    shuffle : bool
+        Apply shuffle filter before compression, which often improves
+        compression ratio of floating point arrays.
+
+    dataset_policy : callable or None
+        Function which takes name and value of array and returns dict of
+        keyword arguments for ``h5py.Group.create_dataset``, such as
+        ``chunks``, ``compression`` and ``shuffle``. Use this to switch layout
+        per array, for example, to compress only optimizer slots. When given,
+        ``compression``, ``compression_opts`` and ``shuffle`` are ignored.
+
+    n_shards : int
+        When larger than 1, arrays are distributed to this number of shard
+        files by size, and shards are written concurrently by thread pool.
+        The file returned by :any:`save` becomes an index, which contains
+        HDF5 external links to the shards, so it can be loaded in the same
+        way as non-sharded file. Use ``n_workers`` argument of
+        ``Session.load_from_file`` to read the shards in parallel.
+        Cannot be combined with ``incremental``.
+
+    manifest : bool
+        When True, the list of saved files with global step, time, size and
+        variable names, as well as the retention state, is recorded in JSON
+        file ``{prefix}_manifest.json`` in ``output_dir``. The manifest is
+        updated atomically at each save, and is read when Saver is created
+        on the same directory, so that the retention schedule survives
+        restarts and the latest file is found without opening HDF5 files.
     """
     def __init__(self, output_dir, max_to_keep=5,
-                 keep_every_n_hours=1.0, prefix='save'):
+                 keep_every_n_hours=1.0, prefix='save',
+                 background=False, max_pending=1, incremental=False,
+                 compression=None, compression_opts=None, shuffle=False,
+                 dataset_policy=None, n_shards=1, manifest=False):
+        if incremental and n_shards > 1:
+            raise ValueError(
+                '`incremental` cannot be used with `n_shards` larger than 1.')
         try:
             os.makedirs(output_dir)
         except OSError as exception:
@@ -77,6 +227,33 @@ class Saver(object):
         self.to_be_deleted = []
         self.last_back_up = None
 
+        self.dataset_policy = dataset_policy or _CompressionPolicy(
+            compression, compression_opts, shuffle)
+        self.n_shards = n_shards
+        # Threads do not copy arrays to workers and are safe to use from the
+        # background worker, unlike forked processes.
+        self._pool = ThreadPool(n_shards) if n_shards > 1 else None
+
+        self.incremental = incremental
+        # Variable name -> (digest of value, file which contains the value)
+        self._digests = {}
+        # File -> set of files it links to
+        self._links = {}
+        # Files which were due to be removed but still referenced
+        self._referenced = set()
+
+        # Records of the saved files in order of save
+        self._checkpoints = []
+        self.manifest_path = (
+            os.path.join(output_dir, '{}_manifest.json'.format(prefix))
+            if manifest else None)
+        if self.manifest_path and os.path.exists(self.manifest_path):
+            self._load_manifest()
+
+        self._worker = (
+            BackgroundWorker(max_pending=max_pending, name='Saver')
+            if background else None)
+
     def save(self, data, global_step, now=None):
         """Save data to HDF5 file
 
@@ -91,22 +268,172 @@ class Saver(object):
 
         now : int
             unix time. only used for test
+
+        Returns
+        -------
+        str
+            Path to the file. In background mode, the file might not be
+            written yet when this method returns.
         """
         filename = '{}_{}.h5'.format(self.prefix, int(global_step))
         filepath = os.path.join(self.output_dir, filename)
+        now = now if now else time.time()
+
+        if self._worker is None:
+            self._save(data, filepath, now, global_step)
+        else:
+            # Take snapshot so that the caller can keep updating the arrays
+            data = {key: np.array(value) for key, value in data.items()}
+            self._worker.submit(self._save, data, filepath, now, global_step)
+        return filepath
+
+    @property
+    def checkpoints(self):
+        """List of records of the existing files, the oldest first
+
+        Each record is a dict with ``path``, ``global_step``, ``time``,
+        ``size`` and ``variables`` keys. In background mode, files not yet
+        written are not included.
+        """
+        return [
+            dict(record, path=os.path.join(self.output_dir, record['path']))
+            for record in self._checkpoints
+        ]
+
+    @property
+    def latest_checkpoint(self):
+        """Path to the most recently saved file. None if nothing is saved"""
+        if not self._checkpoints:
+            return None
+        return os.path.join(self.output_dir, self._checkpoints[-1]['path'])
+
+    def wait(self):
+        """Block until all the pending saves are completed
+
+        No-op in foreground mode. Exception raised in background thread is
+        re-raised here.
+        """
+        if self._worker is not None:
+            self._worker.wait()
 
+    def close(self):
+        """Complete the pending saves and stop the background workers"""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _save(self, data, filepath, now, global_step):
         _LG.info('Saving data to %s', filepath)
+        variables = sorted(data.keys())
+        links = None
+        if self.incremental:
+            data, links = self._split_unchanged(data, filepath)
+            if links:
+                _LG.info('  Linking %d unchanged arrays.', len(links))
+                self._links.setdefault(filepath, set()).update(links.values())
+        elif self.n_shards > 1:
+            links = self._write_shards(data, filepath)
+            data = {}
         file_ = h5py.File(filepath, 'a')
         try:
-            _write_data_to_file(file_, data)
+            _write_data_to_file(file_, data, links, self.dataset_policy)
         except Exception:
             raise
         finally:
             file_.close()
 
+        self._add_checkpoint(filepath, now, global_step, variables)
         self._add_new_record(filepath, now=now)
         self._remove_old_data()
-        return filepath
+        if self.manifest_path:
+            self._save_manifest()
+
+    ###########################################################################
+    def _add_checkpoint(self, filepath, now, global_step, variables):
+        name = os.path.basename(filepath)
+        self._checkpoints = [
+            record for record in self._checkpoints if record['path'] != name]
+        self._checkpoints.append({
+            'path': name,
+            'global_step': int(global_step),
+            'time': now,
+            'size': sum(
+                os.path.getsize(path)
+                for path in [filepath] + _list_shards(filepath)),
+            'variables': variables,
+        })
+
+    def _save_manifest(self):
+        name = os.path.basename
+        _write_json(self.manifest_path, {
+            'checkpoints': self._checkpoints,
+            'last_back_up': self.last_back_up,
+            'to_be_deleted': [[then, name(path)]
+                              for then, path in self.to_be_deleted],
+            'digests': {key: [digest, name(path)]
+                        for key, (digest, path) in self._digests.items()},
+            'links': {name(path): sorted(name(target) for target in targets)
+                      for path, targets in self._links.items()},
+            'referenced': sorted(name(path) for path in self._referenced),
+        })
+
+    def _load_manifest(self):
+        _LG.info('Loading manifest: %s', self.manifest_path)
+        with open(self.manifest_path, 'r') as file_:
+            manifest = json.load(file_)
+
+        def _path(name):
+            return os.path.join(self.output_dir, name)
+
+        self._checkpoints = [
+            record for record in manifest['checkpoints']
+            if os.path.exists(_path(record['path']))]
+        self.last_back_up = manifest['last_back_up']
+        self.to_be_deleted = [
+            (then, _path(name)) for then, name in manifest['to_be_deleted']]
+        self._digests = {
+            key: (digest, _path(name))
+            for key, (digest, name) in manifest['digests'].items()}
+        self._links = {
+            _path(name): set(_path(target) for target in targets)
+            for name, targets in manifest['links'].items()}
+        self._referenced = set(_path(name) for name in manifest['referenced'])
+
+    def _write_shards(self, data, filepath):
+        """Write arrays to shard files and return links to them"""
+        shards = _split_by_size(data, self.n_shards)
+        tasks = [
+            (_get_shard_path(filepath, i, len(shards)), shard,
+             self.dataset_policy)
+            for i, shard in enumerate(shards)
+        ]
+        self._pool.map(_write_shard, tasks)
+
+        links = OrderedDict()
+        for shard_path, shard, _ in tasks:
+            for key in shard:
+                links[key] = shard_path
+        return links
+
+    def _split_unchanged(self, data, filepath):
+        """Separate arrays identical to the ones in the existing files"""
+        changed, links = OrderedDict(), OrderedDict()
+        for key, value in data.items():
+            digest = _get_digest(value)
+            record = self._digests.get(key)
+            if (
+                    record and record[0] == digest and
+                    not record[1] == filepath and os.path.exists(record[1])
+            ):
+                links[key] = record[1]
+            else:
+                changed[key] = value
+                self._digests[key] = (digest, filepath)
+        return changed, links
 
     def _add_new_record(self, filepath, now=None):
         # `now` should be used only for testing
@@ -145,8 +472,28 @@ class Saver(object):
             to_be_deleted.append(filepath)
 
         for filepath in to_be_deleted:
+            self._remove_file(filepath)
+
+    def _remove_file(self, filepath):
+        if any(filepath in targets for targets in self._links.values()):
+            _LG.info('Keeping %s as it is referenced.', filepath)
+            self._referenced.add(filepath)
+            return
+
+        for path in [filepath] + _list_shards(filepath):
             try:
-                _LG.info('Removing: %s', filepath)
-                os.remove(filepath)
+                _LG.info('Removing: %s', path)
+                os.remove(path)
             except OSError:
-                _LG.exception('Failed to delete %s', filepath)
+                _LG.exception('Failed to delete %s', path)
+
+        name = os.path.basename(filepath)
+        self._checkpoints = [
+            record for record in self._checkpoints if record['path'] != name]
+        for key, record in list(self._digests.items()):
+            if record[1] == filepath:
+                del self._digests[key]
+        for target in self._links.pop(filepath, set()):
+            if target in self._referenced:
+                self._referenced.discard(target)
+                self._remove_file(target)
@@ -1,11 +1,15 @@
 """Implement SummaryWriter"""
 from __future__ import absolute_import
 
+import time
 import logging
 import collections
 
 import numpy as np
-import tensorflow as tf
+
+import luchador
+from luchador.util import BackgroundWorker, StreamingStats
+from . import event
 
 _LG = logging.getLogger(__name__)
 
@@ -16,10 +20,85 @@ __all__ = ['SummaryWriter']
 SummaryOperation = collections.namedtuple('SummaryOperation', ('pf', 'op'))
 
 
-def _create_summary_op(type_, name, **kwargs):
-    pf = tf.placeholder('float32')
-    op = getattr(tf.summary, type_)(name, pf, **kwargs)
-    return SummaryOperation(pf, op)
+class _TFSerializer(object):
+    """Create serialized summaries with Tensorflow summary operations"""
+    def __init__(self):
+        import tensorflow as tf
+        self._tf = tf
+        self.summary_ops = collections.defaultdict(dict)
+        self.graph = tf.Graph()
+        self.session = tf.Session(graph=self.graph)
+
+    def create_writer(self, output_dir):
+        """Create tf.summary.FileWriter"""
+        return self._tf.summary.FileWriter(output_dir)
+
+    def _get_summary_op(self, summary_type, name, **kwargs):
+        """Fetch or create summary operation and placeholder"""
+        if name in self.summary_ops[summary_type]:
+            return self.summary_ops[summary_type][name]
+
+        with self.graph.as_default():
+            with self.graph.device('/cpu:0'):
+                pf = self._tf.placeholder('float32')
+                op = getattr(self._tf.summary, summary_type)(
+                    name, pf, **kwargs)
+                op = SummaryOperation(pf, op)
+                self.summary_ops[summary_type][name] = op
+        return op
+
+    def serialize(self, summary_type, dataset, **kwargs):
+        """Create list of serialized Summary protocol buffers"""
+        if summary_type == 'histogram_stats':
+            # Tensorflow has no summary op which takes bucket counts.
+            # FileWriter accepts Summary serialized by hand as well.
+            return _EventSerializer().serialize(
+                summary_type, dataset, **kwargs)
+
+        ops, feed_dict = [], {}
+        for name, value in dataset.items():
+            summary_op = self._get_summary_op(summary_type, name, **kwargs)
+            ops.append(summary_op.op)
+            feed_dict[summary_op.pf] = value
+        return self.session.run(ops, feed_dict=feed_dict)
+
+
+def _encode_scalar(name, value, **_):
+    return [event.encode_scalar(name, value)]
+
+
+def _encode_histogram(name, value, **_):
+    return [event.encode_histogram(name, value)]
+
+
+def _encode_histogram_stats(name, value, **_):
+    return [event.encode_histogram_stats(name, value)]
+
+
+class _EventSerializer(object):
+    """Create serialized summaries without Tensorflow"""
+    _ENCODERS = {
+        'scalar': _encode_scalar,
+        'histogram': _encode_histogram,
+        'histogram_stats': _encode_histogram_stats,
+        'image': event.encode_image,
+        'audio': event.encode_audio,
+    }
+
+    @staticmethod
+    def create_writer(output_dir):
+        """Create EventFileWriter"""
+        return event.EventFileWriter(output_dir)
+
+    def serialize(self, summary_type, dataset, **kwargs):
+        """Create list of serialized Summary protocol buffers"""
+        if summary_type not in self._ENCODERS:
+            raise ValueError(
+                'Unexpected summary type: {}'.format(summary_type))
+        encoder, values = self._ENCODERS[summary_type], []
+        for name, value in dataset.items():
+            values.extend(encoder(name, value, **kwargs))
+        return [event.encode_summary(values)]
 
 
 class SummaryWriter(object):
@@ -29,32 +108,71 @@ class SummaryWriter(object):
     NumPy Arrays for summarization. Generation of summary protocol buffer
     is handled internally.
 
+    In Theano backend, event files are written by :any:`EventFileWriter`,
+    so that Tensorflow is not imported.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory to write event files
+
+    background : bool
+        When True, :any:`summarize` copies the given values into queue and
+        returns immediately. Summaries are serialized and written by
+        background thread. Call :any:`close` to write the queued summaries.
+
+    max_queue : int
+        Background mode only. The maximum number of :any:`summarize` calls
+        waiting to be written.
+
+    drop : bool
+        Background mode only. When True, summaries are dropped if queue is
+        full, so that the caller is never blocked. The number of dropped
+        calls is counted in ``n_dropped``. Otherwise, the caller waits until
+        queue has room.
+
+    flush_every : int
+        Flush event file after this number of :any:`summarize` calls.
+
+    flush_secs : float or None
+        Flush event file also when this seconds have passed since the last
+        flush. Unlike Tensorflow's periodic flush, this is checked only
+        when summaries are written, so summaries written before an idle
+        period stay buffered until the next write or :any:`flush`.
+
+    use_tensorflow : bool or None
+        Use Tensorflow to create summaries. Graph summary is available only
+        in this mode. If None, Tensorflow is used only in Tensorflow backend.
     """
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, background=False, max_queue=64,
+                 drop=False, flush_every=1, flush_secs=None,
+                 use_tensorflow=None):
         self.output_dir = output_dir
-        self.summary_ops = collections.defaultdict(dict)
 
-        self.writer = tf.summary.FileWriter(self.output_dir)
-        self.graph = tf.Graph()
-        self.session = tf.Session(graph=self.graph)
+        if use_tensorflow is None:
+            use_tensorflow = luchador.get_nn_backend() == 'tensorflow'
+        self._serializer = (
+            _TFSerializer() if use_tensorflow else _EventSerializer())
+        self.writer = self._serializer.create_writer(self.output_dir)
+
+        self.drop = drop
+        self.flush_every = flush_every
+        self.flush_secs = flush_secs
+        self.n_dropped = 0
+        self._n_unflushed = 0
+        self._last_flush = time.time()
+        self._worker = (
+            BackgroundWorker(max_pending=max_queue, name='SummaryWriter')
+            if background else None)
+
+        self._stats = collections.OrderedDict()
 
     ###########################################################################
     # Basic functionalitites
     def add_graph(self, graph=None, global_step=None):
-        """Add graph summary. Affective only in tensorflow backend"""
+        """Add graph summary. Affective only when Tensorflow is used"""
         self.writer.add_graph(graph, global_step=global_step)
 
-    def _get_summary_op(self, summary_type, name, **kwargs):
-        """Fetch or create summary operation and placeholder"""
-        if name in self.summary_ops[summary_type]:
-            return self.summary_ops[summary_type][name]
-
-        with self.graph.as_default():
-            with self.graph.device('/cpu:0'):
-                op = _create_summary_op(summary_type, name, **kwargs)
-                self.summary_ops[summary_type][name] = op
-        return op
-
     def summarize(self, summary_type, global_step, dataset, **kwargs):
         """Summarize the dataset
 
@@ -62,7 +180,9 @@ class SummaryWriter(object):
         ----------
         summary_type : str
             Type of summary to create. ``scalar``, ``histogram``, ``image``
-            and ``audio`` are supported.
+            and ``audio`` are supported. ``histogram_stats`` takes the
+            output of :func:`luchador.nn.ops.histogram` in place of raw
+            values.
 
         global_step : int
             Global step value to record with the summary.
@@ -82,16 +202,51 @@ class SummaryWriter(object):
 
             See tf.summary.image or tf.summary.audio for the detail.
         """
-        ops, feed_dict = [], {}
-        for name, value in dataset.items():
-            summary_op = self._get_summary_op(summary_type, name, **kwargs)
-            ops.append(summary_op.op)
-            feed_dict[summary_op.pf] = value
+        if self._worker is None:
+            self._summarize(summary_type, global_step, dataset, kwargs)
+            return
+
+        # Take snapshot so that the caller can keep updating the arrays
+        dataset = {key: np.array(value) for key, value in dataset.items()}
+        queued = self._worker.submit(
+            self._summarize, summary_type, global_step, dataset, kwargs,
+            block=not self.drop)
+        if not queued:
+            self.n_dropped += 1
+            _LG.debug('Summary queue is full. Dropped %s', list(dataset))
 
-        summaries = self.session.run(ops, feed_dict=feed_dict)
+    def _summarize(self, summary_type, global_step, dataset, kwargs):
+        summaries = self._serializer.serialize(
+            summary_type, dataset, **kwargs)
         for summary in summaries:
             self.writer.add_summary(summary, global_step)
+
+        self._n_unflushed += 1
+        if (
+                self._n_unflushed >= self.flush_every or (
+                    self.flush_secs is not None and
+                    time.time() - self._last_flush >= self.flush_secs)
+        ):
+            self._flush()
+
+    def _flush(self):
         self.writer.flush()
+        self._n_unflushed = 0
+        self._last_flush = time.time()
+
+    def flush(self):
+        """Write all the queued summaries to event file"""
+        if self._worker is not None:
+            self._worker.wait()
+        self._flush()
+
+    def close(self):
+        """Write all the queued summaries and close event file"""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+        self._flush()
+        self.writer.close()
 
     ###########################################################################
     def summarize_stats(self, global_step, dataset):
@@ -104,7 +259,7 @@ class SummaryWriter(object):
 
         dataset : dict
             Key : str
-                Names used in :any:`register_stats`
+                Summary names
             Value : list of floats, or NumPy Array
                 Values to summarize stats
         """
@@ -115,3 +270,67 @@ class SummaryWriter(object):
             _dataset['{}/Max'.format(name)] = np.max(values)
         self.summarize(
             summary_type='scalar', global_step=global_step, dataset=_dataset)
+
+    def register_stats(self, names, quantiles=(0.5,)):
+        """Create accumulators of statistics
+
+        Unlike :any:`summarize_stats`, values are accumulated at each step
+        with :any:`update_stats` without being stored, and summarized with
+        :any:`summarize_registered_stats`.
+
+        Parameters
+        ----------
+        names : list of str
+            Summary names
+
+        quantiles : list of float
+            Quantiles to estimate, each in range (0, 1).
+        """
+        for name in names:
+            self._stats[name] = StreamingStats(quantiles=quantiles)
+
+    def update_stats(self, dataset):
+        """Add values to the registered accumulators
+
+        Parameters
+        ----------
+        dataset : dict
+            Key : str
+                Names used in :any:`register_stats`
+            Value : float, list of floats, or NumPy Array
+                Values to accumulate
+        """
+        for name, values in dataset.items():
+            if name not in self._stats:
+                raise KeyError(
+                    'Stats `{}` is not registered. '
+                    'Use `register_stats` first.'.format(name))
+            self._stats[name].update(values)
+
+    def summarize_registered_stats(self, global_step, reset=True):
+        """Summarize the accumulated statistics as scalars
+
+        ``Average``, ``Min``, ``Max``, ``StdDev`` and percentiles such as
+        ``P50`` are written under the registered names. Accumulators without
+        value are skipped.
+
+        Parameters
+        ----------
+        global_step : int
+            Global step value to record with the summary.
+
+        reset : bool
+            Reset the accumulators after summarization.
+        """
+        _dataset = {}
+        for name, stats in self._stats.items():
+            if not stats.count:
+                continue
+            for key, value in stats.summary().items():
+                _dataset['{}/{}'.format(name, key)] = value
+            if reset:
+                stats.reset()
+        if _dataset:
+            self.summarize(
+                summary_type='scalar', global_step=global_step,
+                dataset=_dataset)
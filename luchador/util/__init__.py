@@ -9,3 +9,6 @@ from .misc import *  # noqa: F401, F403
 from .mixin import *  # noqa: F401, F403
 from .logging import *  # noqa: F401, F403
 from .yaml_util import *  # noqa: F401, F403
+from .lazy import *  # noqa: F401, F403
+from .stats import *  # noqa: F401, F403
+from .worker import *  # noqa: F401, F403
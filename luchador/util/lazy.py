@@ -0,0 +1,59 @@
+"""Define module type which imports its attributes on first access"""
+from __future__ import absolute_import
+
+import types
+import importlib
+
+__all__ = ['LazyModule']
+
+
+class LazyModule(types.ModuleType):
+    """Module which defers importing attributes until they are accessed
+
+    Used to replace a package in ``sys.modules``, so that importing the
+    package does not import heavy submodules and their dependencies.
+
+    Parameters
+    ----------
+    module : module
+        The original module object. Its attributes are copied.
+
+    attributes : dict
+        Key : str
+            Name of attribute
+        Value : tuple of str
+            Pair of module name and attribute name in the module. Module
+            name can be relative to ``module``. If attribute name is None,
+            the module itself is the value.
+
+    Examples
+    --------
+    >>> # At the end of package ``__init__.py``
+    >>> sys.modules[__name__] = LazyModule(sys.modules[__name__], {
+    >>>     'Saver': ('.saver', 'Saver'),
+    >>>     'saver': ('.saver', None),
+    >>> })
+    """
+    def __init__(self, module, attributes):
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__['_lazy_attributes'] = dict(attributes)
+        # Python 2 clears globals of module on deallocation, which would
+        # break the functions defined in the original module.
+        self.__dict__['_lazy_original_module'] = module
+
+    def __getattr__(self, name):
+        # Called only when the attribute is not found in __dict__
+        attributes = self.__dict__['_lazy_attributes']
+        if name not in attributes:
+            raise AttributeError(
+                'module `{}` has no attribute `{}`'.format(
+                    self.__name__, name))
+        module_name, attr_name = attributes[name]
+        module = importlib.import_module(module_name, self.__name__)
+        value = module if attr_name is None else getattr(module, attr_name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_attributes))
@@ -1,9 +1,12 @@
 """Defines mixins used acroos the submodules in Luchador"""
 from __future__ import absolute_import
 
+import abc
+
+from .misc import fetch_subclasses
 from .yaml_util import pprint_dict
 
-__all__ = ['StoreMixin']
+__all__ = ['StoreMixin', 'RegistryMixin']
 
 # pylint: disable=too-few-public-methods
 
@@ -62,3 +65,74 @@ class StoreMixin(object):
 
     def __str__(self):
         return pprint_dict({self.__class__.__name__: self.args})
+
+
+###############################################################################
+# Index of subclasses. Key is class, value is dict of name-subclass pairs.
+_INDICES = {}
+
+
+def _invalidate_indices(class_):
+    """Discard indices of ancestors so that the new class is found"""
+    for ancestor in class_.__mro__[1:]:
+        _INDICES.pop(ancestor, None)
+
+
+class _RegistryMeta(abc.ABCMeta):
+    """Invalidate indices on class definition in Python 2
+
+    Derived from ``ABCMeta`` so as to be compatible with base classes which
+    use ``ABCMeta``.
+    """
+    def __init__(cls, name, bases, namespace):
+        super(_RegistryMeta, cls).__init__(name, bases, namespace)
+        _invalidate_indices(cls)
+
+
+class RegistryMixin(object):
+    """Provide constant time lookup of subclass by name
+
+    Subclasses are indexed by name on the first lookup. The index is
+    discarded when a new subclass is defined, using ``__init_subclass__``
+    in Python 3 and metaclass in Python 2.
+
+    When multiple subclasses have the same name, the one found first by
+    :func:`fetch_subclasses` is returned, that is, descendant classes are
+    preferred to their ancestors.
+
+    Examples
+    --------
+    >>> class Base(RegistryMixin):
+    >>>     pass
+    >>> class Foo(Base):
+    >>>     pass
+    >>> Base.fetch_subclass('Foo') is Foo
+    True
+    """
+    __metaclass__ = _RegistryMeta
+
+    def __init_subclass__(cls, **kwargs):
+        super(RegistryMixin, cls).__init_subclass__(**kwargs)
+        _invalidate_indices(cls)
+
+    @classmethod
+    def fetch_subclass(cls, name):
+        """Get subclass by name
+
+        Parameters
+        ----------
+        name : str
+            Name of subclass
+
+        Returns
+        -------
+        type or None
+            Subclass found. None if there is no subclass with the name.
+        """
+        index = _INDICES.get(cls)
+        if index is None:
+            index = {}
+            for subclass in fetch_subclasses(cls):
+                index.setdefault(subclass.__name__, subclass)
+            _INDICES[cls] = index
+        return index.get(name)
@@ -0,0 +1,168 @@
+"""Define accumulator of statistics over stream of values"""
+from __future__ import division
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+import numpy as np
+
+__all__ = ['StreamingStats']
+
+
+class _P2Quantile(object):
+    """Estimate quantile with P-square algorithm in constant memory
+
+    Jain, R. and Chlamtac, I. The P2 Algorithm for Dynamic Calculation of
+    Quantiles and Histograms Without Storing Observations. 1985.
+    """
+    def __init__(self, p):
+        self.p = p
+        self._initial = []
+        self._heights = None
+        self._positions = None
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        """Add one observation"""
+        if self._heights is None:
+            self._initial.append(value)
+            if len(self._initial) == 5:
+                self._heights = sorted(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+            return
+
+        heights, positions = self._heights, self._positions
+        if value < heights[0]:
+            heights[0], cell = value, 0
+        elif value >= heights[4]:
+            heights[4], cell = value, 3
+        else:
+            cell = 0
+            while not heights[cell] <= value < heights[cell + 1]:
+                cell += 1
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            diff = self._desired[i] - positions[i]
+            if (
+                    (diff >= 1 and positions[i + 1] - positions[i] > 1) or
+                    (diff <= -1 and positions[i - 1] - positions[i] < -1)
+            ):
+                step = 1 if diff > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) *
+            (heights[i + 1] - heights[i]) /
+            (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - step) *
+            (heights[i] - heights[i - 1]) /
+            (positions[i] - positions[i - 1])
+        )
+
+    def _linear(self, i, step):
+        heights, positions = self._heights, self._positions
+        return heights[i] + step * (heights[i + step] - heights[i]) / (
+            positions[i + step] - positions[i])
+
+    @property
+    def value(self):
+        """Estimated quantile. Exact when less than 5 values are added"""
+        if self._heights is not None:
+            return self._heights[2]
+        if not self._initial:
+            return np.nan
+        return np.percentile(self._initial, 100 * self.p)
+
+
+class StreamingStats(object):
+    """Accumulate statistics of values without storing them
+
+    Count, mean and variance are updated with Welford's algorithm, and
+    quantiles are estimated with P-square algorithm, so that memory usage
+    does not depend on the number of values.
+
+    Parameters
+    ----------
+    quantiles : list of float
+        Quantiles to estimate, each in range (0, 1).
+
+    Examples
+    --------
+    >>> stats = StreamingStats(quantiles=[0.5, 0.9])
+    >>> for episode in range(n_episodes):
+    >>>     stats.update(run_episode())
+    >>> stats.mean, stats.quantile(0.9)
+    """
+    def __init__(self, quantiles=(0.5,)):
+        self.quantiles = list(quantiles)
+        self.reset()
+
+    def reset(self):
+        """Discard the accumulated statistics"""
+        self.count = 0
+        self.mean = 0.
+        self._m2 = 0.
+        self.min = np.inf
+        self.max = -np.inf
+        self._estimators = [_P2Quantile(p) for p in self.quantiles]
+
+    def update(self, values):
+        """Add value or array of values"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not values.size:
+            return
+        # Combine moments of the batch with the accumulated ones
+        count, mean = values.size, values.mean()
+        m2 = np.sum((values - mean) ** 2)
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        for estimator in self._estimators:
+            for value in values:
+                estimator.add(value)
+
+    @property
+    def variance(self):
+        """Sample variance. NaN when less than 2 values are added"""
+        return self._m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        """Sample standard deviation"""
+        return np.sqrt(self.variance)
+
+    def quantile(self, p):
+        """Get estimated quantile. ``p`` must be one of ``quantiles``"""
+        return self._estimators[self.quantiles.index(p)].value
+
+    def summary(self):
+        """Get statistics as dict
+
+        Returns
+        -------
+        OrderedDict
+            ``Average``, ``Min``, ``Max``, ``StdDev`` and ``P<percentile>``
+            for each quantile.
+        """
+        ret = OrderedDict([
+            ('Average', self.mean), ('Min', self.min), ('Max', self.max),
+            ('StdDev', self.std),
+        ])
+        for p, estimator in zip(self.quantiles, self._estimators):
+            ret['P{:g}'.format(100 * p)] = estimator.value
+        return ret
@@ -0,0 +1,101 @@
+"""Define worker which runs tasks in background thread"""
+from __future__ import absolute_import
+
+import logging
+import threading
+
+from six.moves import queue
+
+__all__ = ['BackgroundWorker']
+_LG = logging.getLogger(__name__)
+
+
+class BackgroundWorker(object):
+    """Run tasks one by one in a background thread
+
+    Tasks are executed in the order they are submitted. The number of tasks
+    waiting for execution is bounded, so that the caller is blocked (or the
+    task is dropped) when tasks are submitted faster than they are processed.
+
+    When a task raises an exception, it is re-raised in the caller thread at
+    the next call of :any:`submit` or :any:`wait`.
+
+    Parameters
+    ----------
+    max_pending : int
+        The maximum number of tasks waiting for execution.
+
+    name : str
+        Name of the thread
+    """
+    def __init__(self, max_pending=2, name=None):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._work, name=name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _work(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                func, args, kwargs = task
+                func(*args, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                _LG.exception('Background task failed.')
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, func, *args, **kwargs):
+        """Add task to queue
+
+        Parameters
+        ----------
+        func : callable
+            Function to run in background. ``args`` and ``kwargs`` are passed
+            to this function.
+
+        block : bool
+            Keyword only. If True (default), wait until queue has room.
+            Otherwise, the task is dropped when queue is full.
+
+        Returns
+        -------
+        bool
+            True if the task was added to queue.
+        """
+        block = kwargs.pop('block', True)
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError('Worker is already closed.')
+        try:
+            self._queue.put((func, args, kwargs), block=block)
+        except queue.Full:
+            return False
+        return True
+
+    @property
+    def n_pending(self):
+        """The number of tasks not yet completed"""
+        return self._queue.unfinished_tasks
+
+    def wait(self):
+        """Block until all the submitted tasks are completed"""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Complete the submitted tasks and stop the thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
@@ -1,12 +1,26 @@
 """Utility functions related to YAML, used throughout luchador"""
 from __future__ import absolute_import
 
+import os
+import re
+import copy
+import math
+import string
+import logging
+from collections import OrderedDict
+
+import six
 from six import StringIO
+from six.moves import cPickle as pickle
 import ruamel.yaml as yaml
 
 from .misc import is_iteratable
 
-__all__ = ['load_config', 'pprint_dict']
+__all__ = [
+    'load_config', 'clear_config_cache',
+    'precompile_configs', 'load_precompiled_configs', 'pprint_dict',
+]
+_LG = logging.getLogger(__name__)
 
 
 def _convert_to_str(value):
@@ -30,6 +44,178 @@ def _convert_to_str(value):
     return str(value)
 
 
+###############################################################################
+# Parsing YAML with ruamel is slow, so parsed files are cached as templates,
+# keyed by path and modification stamp. ``str.format`` fields are replaced
+# with tokens before parsing, and parameters are substituted on the parsed
+# tree, so that loading the same file with different parameters does not
+# parse the whole file again.
+_TOKEN = '__luchador_param_{}__'
+_TOKEN_PATTERN = re.compile(r'__luchador_param_(\d+)__')
+_WHOLE_TOKEN_PATTERN = re.compile(r'^__luchador_param_(\d+)__\Z')
+# Text which does not change parsing when embedded in longer plain scalar
+_PLAIN_TEXT_PATTERN = re.compile(r'^[\w.+\-/()=]*$')
+
+_PICKLE_VERSION = 2
+_CACHE_SIZE = 128
+_TEMPLATES = {}
+_CONFIGS = OrderedDict()
+
+
+def _parse_yaml(text):
+    return yaml.safe_load(StringIO(text))
+
+
+class _Template(object):
+    """Parsed YAML text and the tree in which fields are tokenized"""
+    def __init__(self, text):
+        self.text = text
+        self._raw = self._tokenized = None
+
+    @property
+    def raw(self):
+        """Tree parsed from the text as it is"""
+        if self._raw is None:
+            self._raw = _parse_yaml(self.text)
+        return self._raw
+
+    @property
+    def tokenized(self):
+        """Tuple of tree, field names and indices of the fields which are
+        part of longer string, or None if not supported"""
+        if self._tokenized is None:
+            self._tokenized = _tokenize(self.text) or False
+        return self._tokenized or None
+
+
+def _tokenize(text):
+    """Replace fields with tokens and parse the text
+
+    Returns None when the text must be formatted before parsing. That is,
+    when field is not a plain name or it appears after a quote in the same
+    line, as the parameter in quoted scalar is not parsed as YAML.
+    """
+    names, chunks, line = [], [], ''
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        chunks.append(literal)
+        line = (line + literal).rsplit('\n', 1)[-1]
+        if field is None:
+            continue
+        if not re.match(r'^[A-Za-z_]\w*$', field) or spec or conversion:
+            return None
+        if '"' in line or "'" in line:
+            return None
+        if field not in names:
+            names.append(field)
+        chunks.append(_TOKEN.format(names.index(field)))
+    try:
+        tree = _parse_yaml(''.join(chunks))
+    except yaml.YAMLError:
+        return None
+    return tree, names, _find_partial_tokens(tree)
+
+
+def _find_partial_tokens(obj, found=None):
+    """Find indices of tokens which are part of longer string"""
+    found = set() if found is None else found
+    if isinstance(obj, six.string_types):
+        if not _WHOLE_TOKEN_PATTERN.match(obj):
+            found.update(int(i) for i in _TOKEN_PATTERN.findall(obj))
+    elif isinstance(obj, list):
+        for val in obj:
+            _find_partial_tokens(val, found)
+    elif isinstance(obj, dict):
+        for key, val in obj.items():
+            _find_partial_tokens(key, found)
+            _find_partial_tokens(val, found)
+    return sorted(found)
+
+
+def _parse_value(value):
+    """Convert parameter into the object which text substitution gives
+
+    Values other than numbers and plain strings are converted with
+    :py:func:`_convert_to_str` and parsed, as they are in text substitution.
+    """
+    if value is None:
+        # ``_convert_to_str`` gives ``null``
+        return None
+    if isinstance(value, six.integer_types):
+        return value
+    if isinstance(value, float) and not (
+            math.isinf(value) or math.isnan(value)):
+        return value
+    if isinstance(value, str) and _is_plain_string(value):
+        return value
+    if isinstance(value, dict):
+        return {
+            _parse_value(key): _parse_value(val)
+            for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_parse_value(val) for val in value]
+    return _parse_yaml(_convert_to_str(value))
+
+
+def _is_plain_string(value):
+    """Check if the string is parsed as the same string in YAML"""
+    return (
+        re.match(r'^[A-Za-z_][\w./-]*$', value) is not None and
+        value.lower() not in ['null', 'true', 'false']
+    )
+
+
+def _substitute(obj, values, texts):
+    if isinstance(obj, six.string_types):
+        match = _WHOLE_TOKEN_PATTERN.match(obj)
+        if match:
+            return copy.deepcopy(values[int(match.group(1))])
+        return _TOKEN_PATTERN.sub(lambda m: texts[int(m.group(1))], obj)
+    if isinstance(obj, list):
+        return [_substitute(val, values, texts) for val in obj]
+    if isinstance(obj, dict):
+        return obj.__class__(
+            (_substitute(key, values, texts), _substitute(val, values, texts))
+            for key, val in obj.items())
+    return obj
+
+
+def _get_stamp(filepath):
+    stat = os.stat(filepath)
+    return stat.st_mtime, stat.st_size
+
+
+def _get_template(filepath, stamp):
+    if filepath in _TEMPLATES and _TEMPLATES[filepath][0] == stamp:
+        return _TEMPLATES[filepath][1]
+    with open(filepath, 'r') as file_:
+        template = _Template(file_.read())
+    _TEMPLATES[filepath] = (stamp, template)
+    return template
+
+
+def _load(template, parameters):
+    if not parameters:
+        return template.raw
+
+    texts = {
+        key: _convert_to_str(val) for key, val in parameters.items()}
+    if template.tokenized is None:
+        return _parse_yaml(template.text.format(**texts))
+
+    tree, names, partial = template.tokenized
+    for name in names:
+        if name not in parameters:
+            raise KeyError(name)
+    # Text such as ``a #b`` is parsed differently when it is embedded in
+    # longer scalar, so the text is formatted and parsed as a whole.
+    if any(not _PLAIN_TEXT_PATTERN.match(texts[names[i]]) for i in partial):
+        return _parse_yaml(template.text.format(**texts))
+    return _substitute(
+        tree,
+        values=[_parse_value(parameters[name]) for name in names],
+        texts=[texts[name] for name in names])
+
+
 def load_config(filepath, **parameters):
     """Load YAML file and dynamically update values.
 
@@ -55,18 +241,97 @@ def load_config(filepath, **parameters):
 
     by loading the file as ``load_config('test.yml', n_actions=5)``,
     ``{n_actions}`` is overwritten with ``5``.
+
+    Notes
+    -----
+    Parsed files are cached by path, modification time and size, and the
+    results are cached by parameters, so loading the same file again does
+    not parse YAML. The returned object is a copy, which can be modified.
+
+    Parameters are substituted on the parsed file, and the result is the
+    same as formatting the text then parsing it. A field which forms an
+    entire value is replaced with the parameter parsed as YAML, and a field
+    in longer string is replaced with the string expression of parameter.
+    When the string expression contains characters other than word
+    characters and ``.+-/()=``, or a field is in quoted scalar, the text is
+    formatted and parsed instead.
     """
-    with open(filepath, 'r') as file_:
-        model_text = file_.read()
+    filepath = os.path.abspath(filepath)
+    stamp = _get_stamp(filepath)
+    key = (filepath, stamp, tuple(sorted(
+        (name, _convert_to_str(val)) for name, val in parameters.items())))
+    if key in _CONFIGS:
+        config = _CONFIGS.pop(key)
+    else:
+        config = _load(_get_template(filepath, stamp), parameters)
+        if len(_CONFIGS) >= _CACHE_SIZE:
+            _CONFIGS.popitem(last=False)
+    _CONFIGS[key] = config
+    return copy.deepcopy(config)
+
 
-    if parameters:
-        model_text = model_text.format(**{
-            key: _convert_to_str(val)
-            for key, val in parameters.items()
-        })
+def clear_config_cache():
+    """Discard files and configurations cached by :any:`load_config`"""
+    _TEMPLATES.clear()
+    _CONFIGS.clear()
 
-    model_text = StringIO(model_text)
-    return yaml.safe_load(model_text)
+
+###############################################################################
+def precompile_configs(filepaths, output):
+    """Parse YAML files and save them in pickle for fast loading
+
+    Parameters
+    ----------
+    filepaths : list of str
+        YAML files to precompile
+
+    output : str
+        Output file path. Load this file with
+        :any:`load_precompiled_configs` to skip parsing YAML in
+        subsequent :any:`load_config`.
+    """
+    templates = {}
+    for filepath in filepaths:
+        filepath = os.path.abspath(filepath)
+        stamp = _get_stamp(filepath)
+        template = _get_template(filepath, stamp)
+        # Evaluate lazy attributes so that they are pickled
+        _, _ = template.raw, template.tokenized
+        templates[filepath] = (stamp, template)
+    with open(output, 'wb') as file_:
+        pickle.dump(
+            {'version': _PICKLE_VERSION, 'templates': templates},
+            file_, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_precompiled_configs(filepath):
+    """Load files precompiled with :any:`precompile_configs` into cache
+
+    Files modified after precompilation are parsed again when loaded.
+
+    .. warning::
+        Loading pickle can execute arbitrary code. Only load the files you
+        created.
+
+    Parameters
+    ----------
+    filepath : str
+        File written by :any:`precompile_configs`
+
+    Returns
+    -------
+    int
+        The number of files loaded
+    """
+    with open(filepath, 'rb') as file_:
+        data = pickle.load(file_)
+    if data.get('version') != _PICKLE_VERSION:
+        raise ValueError(
+            'Unsupported precompiled config version: {}'.format(
+                data.get('version')))
+    _TEMPLATES.update(data['templates'])
+    _LG.info('Loaded %d precompiled config(s)', len(data['templates']))
+    return len(data['templates'])
 
 
 def pprint_dict(dictionary):
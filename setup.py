@@ -15,9 +15,13 @@ def _setup():
         test_suite='tests.unit',
         install_requires=[
             'six',
+            'numpy',
             'h5py',
             'ruamel.yaml',
         ],
+        extras_require={
+            'crc32c': ['google-crc32c'],
+        },
         package_data={
             'luchador': [
                 'nn/data/*.yml',
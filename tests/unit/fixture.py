@@ -82,6 +82,8 @@ def create_ones_tensor(shape, dtype, name='ones_tensor'):
     """Create ones Tensor for test in current scope"""
     if luchador.get_nn_backend() == 'theano':
         import theano.tensor as be
+    elif luchador.get_nn_backend() == 'numpy':
+        be = np
     else:
         import tensorflow as be
     tensor = be.ones(shape, dtype=dtype)
@@ -0,0 +1,57 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from luchador import nn
+from tests.unit import fixture
+
+
+class ResidentDatasetTest(fixture.TestCase):
+    def test_gather_batch(self):
+        """Mini batch is gathered with fed indices"""
+        data = np.random.rand(10, 3).astype('float32')
+        label = np.arange(10, dtype='int64')
+        dataset = nn.ResidentDataset(
+            {'data': data, 'label': label}, batch_size=4,
+            name=self.get_scope())
+
+        session = nn.Session()
+        session.initialize()
+        dataset.upload(session)
+
+        index = dataset.next_index()
+        data_batch, label_batch = session.run(
+            outputs=[dataset.batch['data'], dataset.batch['label']],
+            inputs={dataset.index: index},
+        )
+        np.testing.assert_almost_equal(data_batch, data[index])
+        np.testing.assert_equal(label_batch, label[index])
+
+    def test_next_index(self):
+        """Indices do not overlap in one epoch"""
+        dataset = nn.ResidentDataset(
+            {'data': np.zeros((10, 2))}, batch_size=3, name=self.get_scope())
+        indices = np.concatenate([dataset.next_index() for _ in range(3)])
+        self.assertEqual(len(set(indices)), 9)
+
+    def test_next_index_copy(self):
+        """Indices returned are not changed by shuffle at the next epoch"""
+        dataset = nn.ResidentDataset(
+            {'data': np.zeros((10, 2))}, batch_size=5, name=self.get_scope())
+        indices = [dataset.next_index() for _ in range(2)]
+        expected = [index.copy() for index in indices]
+        for _ in range(10):
+            dataset.next_index()
+        for index, expected_ in zip(indices, expected):
+            np.testing.assert_equal(index, expected_)
+
+    def test_large_batch_size(self):
+        """Batch size larger than dataset is rejected"""
+        dataset = nn.ResidentDataset(
+            {'data': np.zeros((3, 2))}, batch_size=4, name=self.get_scope())
+        session = nn.Session()
+        session.initialize()
+        with self.assertRaises(ValueError):
+            dataset.upload(session)
+        with self.assertRaises(ValueError):
+            dataset.next_index()
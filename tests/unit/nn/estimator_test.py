@@ -0,0 +1,223 @@
+from __future__ import absolute_import
+
+import os
+import unittest
+
+import numpy as np
+
+import luchador
+import luchador.nn as nn
+from luchador.nn.estimator import estimate_model
+from tests.unit import fixture
+
+_EXAMPLE_DIR = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'example')
+
+
+def _get_conv_format():
+    if luchador.get_nn_backend() in ('theano', 'numpy'):
+        return 'NCHW'
+    return luchador.get_nn_conv_format()
+
+
+def _make_input(shape, name='input'):
+    return {'typename': 'Input', 'args': {'shape': shape, 'name': name}}
+
+
+def _make_sequential(layer_configs, input_config=None, name='model'):
+    args = {'name': name, 'layer_configs': layer_configs}
+    if input_config:
+        args['input_config'] = input_config
+    return {'typename': 'Sequential', 'args': args}
+
+
+def _make_layer(typename, **args):
+    return {'typename': typename, 'args': args}
+
+
+def _make_conv2d(scope, n_filters, padding='valid', strides=2):
+    return _make_layer(
+        'Conv2D', scope=scope, n_filters=n_filters, filter_height=5,
+        filter_width=5, strides=strides, padding=padding)
+
+
+class EstimatorTest(unittest.TestCase):
+    def test_dense(self):
+        """Shape, parameters and FLOPs of Dense layers are estimated"""
+        config = _make_sequential(
+            input_config=_make_input([None, 100]),
+            layer_configs=[
+                _make_layer('Dense', n_nodes=10, scope='layer1'),
+                _make_layer('ReLU', scope='layer2'),
+                _make_layer('Dense', n_nodes=5, scope='layer3',
+                            with_bias=False),
+            ])
+        estimate = estimate_model(config, batch_size=8, dtype='float32')
+
+        shapes = [layer.output_shape for layer in estimate.layers]
+        self.assertEqual(shapes, [(8, 10), (8, 10), (8, 5)])
+        self.assertEqual(estimate.n_params, 100 * 10 + 10 + 10 * 5)
+        self.assertEqual(estimate.layers[0].forward_flops, 2 * 8 * 1000 + 80)
+        self.assertEqual(estimate.layers[0].backward_flops, 2 * 16080)
+        self.assertEqual(estimate.layers[1].backward_flops, 80)
+        self.assertEqual(estimate.parameter_bytes, 4 * 1060)
+        self.assertEqual(estimate.activation_bytes, 4 * (80 + 80 + 40))
+        self.assertEqual(estimate.peak_activation_bytes, 4 * (800 + 80))
+
+    def test_conv2d(self):
+        """Output shape of convolution follows padding and format"""
+        layers = [
+            _make_conv2d('conv1', 32),
+            _make_conv2d('conv2', 64, padding='same'),
+            _make_layer('BatchNormalization', scope='bn'),
+            _make_layer('Flatten', scope='flatten'),
+        ]
+        for conv_format, input_shape, expected in [
+                ('NCHW', [None, 1, 28, 28], (4, 64, 6, 6)),
+                ('NHWC', [None, 28, 28, 1], (4, 6, 6, 64)),
+        ]:
+            config = _make_sequential(
+                layer_configs=layers, input_config=_make_input(input_shape))
+            estimate = estimate_model(
+                config, batch_size=4, conv_format=conv_format)
+            self.assertEqual(estimate.layers[1].output_shape, expected)
+            self.assertEqual(estimate.layers[-1].output_shape, (4, 2304))
+            self.assertEqual(
+                [layer.n_params for layer in estimate.layers],
+                [25 * 32 + 32, 25 * 32 * 64 + 64, 4 * 64, 0])
+            self.assertEqual(estimate.layers[2].n_trainable_params, 2 * 64)
+
+    def test_container(self):
+        """Shapes are propagated between models"""
+        encoder = _make_sequential(
+            name='encoder',
+            input_config=_make_input([None, 1, 28, 28], name='image'),
+            layer_configs=[_make_conv2d('conv', 32)])
+        decoder = _make_sequential(
+            name='decoder',
+            input_config={
+                'typename': 'Model', 'name': 'encoder', 'fetch': 'output'},
+            layer_configs=[{
+                'typename': 'Conv2DTranspose',
+                'args': {
+                    'scope': 'deconv', 'n_filters': 32, 'filter_height': 5,
+                    'filter_width': 5, 'strides': 2, 'padding': 'valid'},
+                'parameters': {
+                    'original_filter': {
+                        'typename': 'Variable', 'name': 'conv/filter'},
+                    'original_input': {
+                        'typename': 'Input', 'reuse': True, 'name': 'image'},
+                },
+            }])
+        error = {
+            'typename': 'Graph',
+            'args': {
+                'name': 'error',
+                'node_configs': [{
+                    'typename': 'SSE',
+                    'args': {'scope': 'sse'},
+                    'input_config': {
+                        'target': {
+                            'typename': 'Input', 'reuse': True,
+                            'name': 'image'},
+                        'prediction': {
+                            'typename': 'Tensor', 'name': 'deconv/output'},
+                    },
+                }],
+            },
+        }
+        config = {
+            'typename': 'Container',
+            'args': {'model_configs': [encoder, decoder, error]},
+        }
+        estimate = estimate_model(config, batch_size=2, conv_format='NCHW')
+
+        layers = {layer.scope: layer for layer in estimate.layers}
+        self.assertEqual(layers['conv'].output_shape, (2, 32, 12, 12))
+        self.assertEqual(layers['deconv'].output_shape, (2, 1, 28, 28))
+        self.assertEqual(layers['deconv'].n_params, 25 * 32 + 1)
+        self.assertEqual(layers['sse'].output_shape, ())
+
+    def test_input_shapes(self):
+        """Input shape of Sequential model can be given by name"""
+        config = _make_sequential(
+            layer_configs=[_make_layer('Dense', n_nodes=3, scope='dense')])
+        estimate = estimate_model(
+            config, batch_size=2, input_shapes={'model': [4]})
+        self.assertEqual(estimate.layers[0].output_shape, (2, 3))
+
+        estimate = estimate_model(config)
+        self.assertIsNone(estimate.layers[0].output_shape)
+        self.assertIsNone(estimate.layers[0].forward_flops)
+
+    def test_fixed_reshape(self):
+        """Layers after Reshape with fixed shape are estimated"""
+        config = _make_sequential(
+            layer_configs=[
+                _make_layer('Dense', n_nodes=64, scope='dense'),
+                _make_layer('Reshape', shape=[2, 4, 4, 4], scope='reshape'),
+                _make_conv2d('conv', 8, padding='same', strides=1),
+            ])
+        estimate = estimate_model(config, conv_format='NCHW')
+        self.assertIsNone(estimate.layers[0].output_shape)
+        self.assertEqual(estimate.layers[1].output_shape, (2, 4, 4, 4))
+        self.assertEqual(estimate.layers[2].output_shape, (2, 8, 4, 4))
+        self.assertEqual(estimate.n_params, 25 * 4 * 8 + 8)
+
+    def test_anonymous(self):
+        """Element-wise Anonymous layer keeps shape, others are unknown"""
+        config = _make_sequential(
+            input_config=_make_input([None, 3]),
+            layer_configs=[
+                _make_layer('Anonymous', exp='x + NormalRandom()', scope='a'),
+                _make_layer('Anonymous', exp='one_hot(x, 3)', scope='b'),
+            ])
+        estimate = estimate_model(config, batch_size=2)
+        self.assertEqual(estimate.layers[0].output_shape, (2, 3))
+        self.assertIsNone(estimate.layers[1].output_shape)
+
+
+class BuiltModelTest(fixture.TestCase):
+    """Compare estimate with the parameters of models built from examples"""
+    def _get_n_params(self, model_config, build):
+        with nn.variable_scope(self.get_scope()):
+            model = nn.make_model(model_config)
+            build(model)
+        return sum(
+            int(np.prod(param.shape))
+            for param in model.get_parameters_to_serialize())
+
+    def _test_autoencoder(self, filename):
+        conv_format = _get_conv_format()
+        input_shape = (
+            [None, 1, 28, 28] if conv_format == 'NCHW' else [None, 28, 28, 1])
+        config = nn.get_model_config(
+            os.path.join(_EXAMPLE_DIR, 'autoencoder', filename),
+            input_shape=input_shape)
+        n_params = self._get_n_params(config, lambda _: None)
+        estimate = estimate_model(config, conv_format=conv_format)
+        self.assertEqual(estimate.n_params, n_params)
+
+    def test_autoencoder(self):
+        """Estimated #parameters of autoencoder matches built model"""
+        self._test_autoencoder('autoencoder.yml')
+
+    def test_variational_autoencoder(self):
+        """Estimated #parameters of VAE matches built model"""
+        self._test_autoencoder('variational_autoencoder.yml')
+
+    def test_dcgan(self):
+        """Estimated #parameters of nested Sequential models matches"""
+        conv_format = _get_conv_format()
+        image_shape = [3, 64, 64] if conv_format == 'NCHW' else [64, 64, 3]
+        config = nn.get_model_config(
+            os.path.join(_EXAMPLE_DIR, 'gan', 'dcgan.yml'))
+
+        def _build(model):
+            generated = model.models['generator'](nn.Input(shape=[32, 100]))
+            model.models['discriminator'](generated)
+        n_params = self._get_n_params(config, _build)
+        estimate = estimate_model(
+            config, conv_format=conv_format,
+            input_shapes={'generator': [100], 'discriminator': image_shape})
+        self.assertEqual(estimate.n_params, n_params)
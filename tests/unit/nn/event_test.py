@@ -0,0 +1,119 @@
+from __future__ import absolute_import
+
+import os
+import struct
+import unittest
+
+import numpy as np
+
+from luchador.nn import event
+
+OUTPUT_DIR = os.path.join('tmp', 'event_test')
+
+# pylint: disable=protected-access
+
+
+def _read_records(filepath):
+    records = []
+    with open(filepath, 'rb') as file_:
+        while True:
+            header = file_.read(12)
+            if not header:
+                return records
+            length = struct.unpack('<Q', header[:8])[0]
+            data = file_.read(length)
+            crc = struct.unpack('<I', file_.read(4))[0]
+            records.append((header, data, crc))
+
+
+class EventTest(unittest.TestCase):
+    def test_crc32c(self):
+        """CRC32C matches the standard check value"""
+        self.assertEqual(event._crc32c(b'123456789'), 0xE3069283)
+
+    def test_crc32c_chunkwise(self):
+        """CRC32C computed over chunks matches bytewise computation"""
+        rng = np.random.RandomState(0)
+        for size in [4, 255, 256, 257, 1000, 4096]:
+            data = rng.randint(256, size=size).astype('uint8').tobytes()
+            self.assertEqual(
+                event._crc32c_chunkwise(data), event._crc32c_bytewise(data))
+
+    def test_varint(self):
+        """Integers are encoded in base 128 varint"""
+        self.assertEqual(event._varint(1), b'\x01')
+        self.assertEqual(event._varint(300), b'\xac\x02')
+        self.assertEqual(len(event._varint(-1)), 10)
+
+    def test_histogram_buckets(self):
+        """All values are counted in buckets"""
+        values = np.random.randn(1000)
+        limits, buckets = event._histogram_buckets(values)
+        self.assertEqual(sum(buckets), 1000)
+        self.assertEqual(limits, sorted(limits))
+
+    def test_histogram_bucket_edges(self):
+        """Bucket includes its left edge as in Tensorflow"""
+        limit = event._BUCKET_LIMITS[300]
+        limits, buckets = event._histogram_buckets(np.array([limit]))
+        self.assertEqual(limits[-1], event._BUCKET_LIMITS[301])
+        self.assertEqual(buckets[-1], 1)
+
+    def test_image_tags(self):
+        """Image tags depend on max_outputs as in Tensorflow"""
+        images = np.random.rand(5, 4, 4, 3)
+        values = event.encode_image('img', images, max_outputs=1)
+        self.assertEqual(len(values), 1)
+        self.assertIn(b'img/image', values[0])
+        self.assertNotIn(b'img/image/', values[0])
+        values = event.encode_image('img', images[:1], max_outputs=3)
+        self.assertEqual(len(values), 1)
+        self.assertIn(b'img/image/0', values[0])
+        values = event.encode_image('img', images, max_outputs=3)
+        self.assertEqual(len(values), 3)
+
+    def test_image_scale(self):
+        """Each image is scaled independently"""
+        images = np.stack([np.ones((2, 2, 1)), 4 * np.ones((2, 2, 1))])
+        images[:, 0, 0, 0] = 0
+        scaled = event._to_uint8(images)
+        np.testing.assert_equal(scaled[:, 1, 1, 0], [255, 255])
+        np.testing.assert_equal(scaled[:, 0, 0, 0], [0, 0])
+        scaled = event._to_uint8(np.array([[[[-2.], [1.]]]]))
+        np.testing.assert_equal(scaled.ravel(), [1, 191])
+
+    def test_histogram_stats(self):
+        """Buckets of equal width span from minimum to maximum"""
+        values = np.random.randn(100)
+        counts, edges = np.histogram(values, bins=10)
+        stats = np.concatenate([[
+            values.min(), values.max(), values.size,
+            values.sum(), np.dot(values, values)], counts])
+        expected = event._encode_histo(
+            'histogram', values.min(), values.max(), values.size,
+            values.sum(), np.dot(values, values), edges[1:], counts)
+        found = event.encode_histogram_stats('histogram', stats)
+        self.assertEqual(len(found), len(expected))
+        # Packed bucket counts, preceded by key, length and bucket limits
+        self.assertEqual(found[-80:], expected[-80:])
+        np.testing.assert_almost_equal(
+            np.frombuffer(found[-162:-82], dtype='<f8'), edges[1:])
+
+    def test_event_file(self):
+        """Records are framed with masked CRC"""
+        writer = event.EventFileWriter(OUTPUT_DIR)
+        values = [
+            event.encode_scalar('scalar', 1.0),
+            event.encode_histogram('histogram', np.random.randn(32)),
+        ]
+        values.extend(event.encode_image('image', np.random.rand(2, 4, 4, 3)))
+        writer.add_summary(event.encode_summary(values), global_step=1)
+        writer.close()
+
+        records = _read_records(writer.filepath)
+        self.assertEqual(len(records), 2)
+        for header, data, crc in records:
+            self.assertEqual(
+                struct.unpack('<I', header[8:])[0],
+                event._masked_crc32c(header[:8]))
+            self.assertEqual(crc, event._masked_crc32c(data))
@@ -0,0 +1,106 @@
+"""Test NumPy-specific computation"""
+from __future__ import division
+from __future__ import absolute_import
+
+import unittest
+
+import numpy as np
+
+import luchador
+from luchador import nn
+from tests.unit.fixture import TestCase
+
+_BE = luchador.get_nn_backend()
+# pylint: disable=invalid-name
+
+
+def _conv2d_naive(x, w, pad, stride):
+    """Compute convolution with flipped filter pixel by pixel"""
+    x = np.pad(x, ((0, 0), (0, 0), (pad, pad), (pad, pad)), mode='constant')
+    w = w[:, :, ::-1, ::-1]
+    f_row, f_col = w.shape[2:4]
+    n_row = (x.shape[2] - f_row) // stride + 1
+    n_col = (x.shape[3] - f_col) // stride + 1
+    y = np.zeros((x.shape[0], w.shape[0], n_row, n_col))
+    for n in range(x.shape[0]):
+        for k in range(w.shape[0]):
+            for i in range(n_row):
+                for j in range(n_col):
+                    patch = x[
+                        n, :,
+                        i * stride:i * stride + f_row,
+                        j * stride:j * stride + f_col]
+                    y[n, k, i, j] = np.sum(patch * w[k])
+    return y
+
+
+@unittest.skipUnless(_BE == 'numpy', 'NumPy backend')
+class ConvolutionTest(TestCase):
+    """Test convolution kernels of NumPy backend"""
+    def _build(self, padding, strides, suffix):
+        conv2d = nn.layer.Conv2D(
+            filter_height=3, filter_width=4, n_filters=5,
+            strides=strides, padding=padding, with_bias=False)
+        conv2d_t = nn.layer.Conv2DTranspose(
+            filter_height=3, filter_width=4, n_filters=5,
+            strides=strides, padding=padding, with_bias=False)
+        with nn.variable_scope(self.get_scope(suffix)):
+            x = nn.Input(shape=(2, 3, 11, 12), name='x', dtype='float64')
+            y = conv2d(x)
+            conv2d_t.set_parameter_variables(
+                filter=conv2d.get_parameter_variable('filter'),
+                original_input=x)
+            z = nn.Input(shape=y.shape, name='z', dtype='float64')
+            x_t = conv2d_t(z)
+        return x, y, z, x_t, conv2d.get_parameter_variable('filter')
+
+    def test_conv2d(self):
+        """Conv2D computes convolution with flipped filter"""
+        for i, (padding, pad) in enumerate([('valid', 0), (1, 1)]):
+            x, y, _, _, w = self._build(padding, 2, suffix=str(i))
+            session = nn.Session()
+            x_val = np.random.randn(*x.shape)
+            y_val = session.run(outputs=y, inputs={x: x_val})
+            w_val = session.run(outputs=w)
+            self.assertEqual(y.shape, y_val.shape)
+            np.testing.assert_almost_equal(
+                y_val, _conv2d_naive(x_val, w_val, pad, 2))
+
+    def test_conv2d_transpose(self):
+        """Conv2DTranspose computes adjoint of Conv2D"""
+        for i, padding in enumerate(['valid', 'full', 'same', (1, 2)]):
+            x, y, z, x_t, _ = self._build(padding, (2, 3), suffix=str(i))
+            session = nn.Session()
+            x_val = np.random.randn(*x.shape)
+            z_val = np.random.randn(*z.shape)
+            y_val, x_t_val = session.run(
+                outputs=[y, x_t], inputs={x: x_val, z: z_val})
+            self.assertEqual(x_t_val.shape, x.shape)
+            np.testing.assert_almost_equal(
+                np.sum(y_val * z_val), np.sum(x_val * x_t_val))
+
+
+@unittest.skipUnless(_BE == 'numpy', 'NumPy backend')
+class SessionTest(TestCase):
+    """Test computation of NumPy Session"""
+    def test_update(self):
+        """Outputs are computed before Variables are updated"""
+        with nn.variable_scope(self.get_scope()):
+            x = nn.Input(shape=(), name='x')
+            w = nn.make_variable(
+                name='w', shape=(),
+                initializer=nn.initializer.ConstantInitializer(3))
+            update = nn.ops.build_sync_op([x], [w], name='update')
+        session = nn.Session()
+        for val in [1, 2]:
+            w_val = session.run(
+                outputs=w, inputs={x: val}, updates=update, name='update')
+            self.assertEqual(w_val, 3 if val == 1 else 1)
+        self.assertEqual(session.run(outputs=w), 2)
+
+    def test_compute_gradient(self):
+        """Gradient computation is not supported"""
+        with nn.variable_scope(self.get_scope()):
+            w = nn.make_variable(name='w', shape=())
+            with self.assertRaises(NotImplementedError):
+                nn.ops.compute_gradient(loss=w * w, wrt=w)
@@ -1,6 +1,8 @@
 """Unit test for luchador.nn.ops module"""
 from __future__ import absolute_import
 
+import unittest
+
 import numpy as np
 
 import luchador
@@ -13,6 +15,7 @@ _BACKEND = luchador.get_nn_backend()
 
 ###############################################################################
 # Test gradients
+@unittest.skipIf(_BACKEND == 'numpy', 'NumPy backend computes no gradient')
 class TestComputeGradiens(fixture.TestCase):
     """Test gradient computation"""
     def test_compute_gradients(self):
@@ -667,6 +670,34 @@ class TestTensorOpsOneHot(fixture.TestCase):
         self._test_one_hot(shape=[10], n_classes=4, out_dtype='float64')
 
 
+class TestTensorOpsHistogram(fixture.TestCase):
+    """Test wrapper histogram"""
+    def _test_histogram(self, in_val, n_bins):
+        with nn.variable_scope(self.get_scope()):
+            input_ = nn.Input(shape=in_val.shape, dtype='float64')
+            tensor = nn.ops.histogram(input_, n_bins=n_bins)
+
+        session = nn.Session()
+        out_val = session.run(outputs=tensor, givens={input_: in_val})
+        self.assertEqual(out_val.shape, (n_bins + 5,))
+        np.testing.assert_almost_equal(out_val[:5], [
+            in_val.min(), in_val.max(), in_val.size,
+            in_val.sum(), np.square(in_val).sum()])
+        return out_val[5:]
+
+    def test_histogram(self):
+        """Buckets match NumPy histogram"""
+        in_val = np.random.randn(32, 8)
+        counts = self._test_histogram(in_val, n_bins=10)
+        expected, _ = np.histogram(in_val, bins=10)
+        np.testing.assert_equal(counts, expected)
+
+    def test_histogram_constant(self):
+        """Identical values are counted in the first bucket"""
+        counts = self._test_histogram(3 * np.ones((4, 5)), n_bins=3)
+        np.testing.assert_equal(counts, [20, 0, 0])
+
+
 ###############################################################################
 # Test Transform
 class TestTensorOpsReshape(fixture.TestCase):
@@ -5,6 +5,8 @@ from __future__ import absolute_import
 # theano.config.optimizer = 'None'
 # theano.config.exception_verbosity = 'high'
 
+import unittest
+
 import numpy as np
 
 import luchador
@@ -25,6 +27,7 @@ def _get_y_equals_x_squared(scope, x_init):
     return x, y
 
 
+@unittest.skipIf(BE == 'numpy', 'NumPy backend does not compute gradient')
 class OptimizerGradientTest(fixture.TestCase):
     """Test gradient computation interface IO"""
     def test_clip_gradients(self):
@@ -56,6 +59,7 @@ class OptimizerGradientTest(fixture.TestCase):
         np.testing.assert_almost_equal(val_1_be, val_1_np)
 
 
+@unittest.skipIf(BE == 'numpy', 'NumPy backend does not compute gradient')
 class AdamTest(fixture.TestCase):
     """Test Adam Optimizer"""
     def test_beta_power_update(self):
@@ -135,6 +139,7 @@ class AdamTest(fixture.TestCase):
             v_val_prev = v_val
 
 
+@unittest.skipIf(BE == 'numpy', 'NumPy backend does not compute gradient')
 class AdamaxTest(fixture.TestCase):
     def test_beta_power_update(self):
         """Beta parameter is updated every time update is evaluated"""
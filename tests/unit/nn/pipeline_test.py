@@ -0,0 +1,34 @@
+from __future__ import absolute_import
+
+import unittest
+
+from luchador import nn
+
+
+class InputPipelineTest(unittest.TestCase):
+    def test_iterator(self):
+        """Values of iterator are fetched in order"""
+        with nn.InputPipeline(iter(range(5)), n_workers=2) as pipeline:
+            self.assertEqual(list(pipeline), list(range(5)))
+
+    def test_iterator_order(self):
+        """Values of iterator are returned in order with many workers"""
+        for _ in range(10):
+            with nn.InputPipeline(
+                    iter(range(50)), n_workers=4, queue_size=2) as pipeline:
+                self.assertEqual(list(pipeline), list(range(50)))
+
+    def test_inputs(self):
+        """Values are paired with inputs"""
+        inputs = ['x', 'y']
+        with nn.InputPipeline(lambda: [1, 2], inputs=inputs) as pipeline:
+            self.assertEqual(pipeline.get(), {'x': 1, 'y': 2})
+
+    def test_error(self):
+        """Exception in worker is re-raised in consumer"""
+        def _fail():
+            raise ValueError('test')
+
+        with nn.InputPipeline(_fail) as pipeline:
+            with self.assertRaises(RuntimeError):
+                pipeline.get()
@@ -170,3 +170,136 @@ class SaverTest(unittest.TestCase):
             self.assertTrue(
                 filepath in files,
                 'File is not found in output dir. {}'.format(filepath))
+
+    def test_background(self):
+        """Saver writes snapshot of data in background"""
+        prefix, max_to_keep = 'test_background', 3
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, max_to_keep=max_to_keep,
+                      background=True)
+
+        key, value = 'foo', _gen_random_value()
+        expected = value.copy()
+        filepath = saver.save({key: value}, global_step=0)
+        value += 1  # Modification after save must not be reflected
+        for step in range(1, 2 * max_to_keep):
+            saver.save({key: value}, global_step=step)
+        saver.close()
+
+        file_ = h5py.File(filepath)
+        self.assertTrue(np.all(expected == file_[key]))
+        files_kept = len(_list_files(prefix, output_dir))
+        self.assertLessEqual(files_kept, max_to_keep + 1)
+
+    def test_incremental(self):
+        """Unchanged arrays are linked to the file where they were written"""
+        prefix = 'test_incremental'
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, incremental=True)
+
+        frozen, value = _gen_random_value(), _gen_random_value()
+        filepath1 = saver.save({'frozen': frozen, 'foo': value}, 0)
+        filepath2 = saver.save({'frozen': frozen, 'foo': value + 1}, 1)
+
+        file_ = h5py.File(filepath2, 'r')
+        link = file_.get('frozen', getlink=True)
+        self.assertIsInstance(link, h5py.ExternalLink)
+        self.assertEqual(link.filename, os.path.basename(filepath1))
+        self.assertTrue(np.all(frozen == file_['frozen']))
+        self.assertTrue(np.all(value + 1 == file_['foo']))
+        file_.close()
+
+    def test_incremental_keep_referenced(self):
+        """File referenced by other file is not removed"""
+        prefix, max_to_keep = 'test_incremental_keep_referenced', 2
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, max_to_keep=max_to_keep,
+                      incremental=True)
+
+        frozen = _gen_random_value()
+        for step in range(4 * max_to_keep):
+            filepath = saver.save(
+                {'frozen': frozen, 'foo': _gen_random_value()}, step)
+
+        file_ = h5py.File(filepath, 'r')
+        self.assertTrue(np.all(frozen == file_['frozen']))
+        file_.close()
+
+    def test_compression(self):
+        """Arrays are compressed with the given filter"""
+        prefix = 'test_compression'
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix,
+                      compression='gzip', compression_opts=4, shuffle=True)
+
+        value = _gen_random_value()
+        filepath = saver.save({'foo': value, 'bar': np.float32(1)}, 0)
+
+        file_ = h5py.File(filepath, 'r')
+        self.assertEqual(file_['foo'].compression, 'gzip')
+        self.assertTrue(file_['foo'].shuffle)
+        self.assertIsNone(file_['bar'].compression)
+        self.assertTrue(np.all(value == file_['foo']))
+        file_.close()
+
+    def test_dataset_policy(self):
+        """Layout is chosen per array by policy"""
+        prefix = 'test_dataset_policy'
+
+        def _policy(key, _):
+            return {'compression': 'lzf'} if key == 'slot' else {}
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, dataset_policy=_policy)
+
+        filepath = saver.save(
+            {'slot': _gen_random_value(), 'weight': _gen_random_value()}, 0)
+
+        file_ = h5py.File(filepath, 'r')
+        self.assertEqual(file_['slot'].compression, 'lzf')
+        self.assertIsNone(file_['weight'].chunks)
+        file_.close()
+
+    def test_shards(self):
+        """Arrays are split into shards and linked from index file"""
+        prefix, n_shards = 'test_shards', 3
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, n_shards=n_shards)
+
+        data = {'foo{}'.format(i): _gen_random_value() for i in range(5)}
+        filepath = saver.save(data, 0)
+        saver.close()
+
+        self.assertEqual(len(_list_files(prefix, output_dir)), n_shards + 1)
+        file_ = h5py.File(filepath, 'r')
+        for key, value in data.items():
+            link = file_.get(key, getlink=True)
+            self.assertIsInstance(link, h5py.ExternalLink)
+            self.assertTrue(np.all(value == file_[key]))
+        file_.close()
+
+    def test_manifest(self):
+        """Retention state and records are restored from manifest"""
+        prefix, max_to_keep = 'test_manifest', 3
+
+        output_dir = self._get_empty_dir()
+        saver = Saver(output_dir, prefix=prefix, max_to_keep=max_to_keep,
+                      manifest=True)
+        for step in range(2 * max_to_keep):
+            filepath = saver.save({'foo': _gen_random_value()}, step)
+
+        saver2 = Saver(output_dir, prefix=prefix, max_to_keep=max_to_keep,
+                       manifest=True)
+        self.assertEqual(saver2.latest_checkpoint, filepath)
+        self.assertEqual(saver2.to_be_deleted, saver.to_be_deleted)
+        self.assertEqual(saver2.last_back_up, saver.last_back_up)
+        self.assertEqual(
+            [record['path'] for record in saver2.checkpoints],
+            [record['path'] for record in saver.checkpoints])
+        self.assertEqual(saver2.checkpoints[-1]['variables'], ['foo'])
+        self.assertEqual(saver2.checkpoints[-1]['global_step'], step)
@@ -1,13 +1,17 @@
 """Test Wapper methods"""
 from __future__ import absolute_import
 
+import gc
+
 from luchador import nn
 
 from tests.unit import fixture
 
 # pylint: disable=invalid-name,protected-access
 
-_VARIABLES = nn.core.base.wrapper.store._VARIABLES
+
+def _get_variables():
+    return nn.core.base.wrapper.store._get_objects('variable', 'retrieve')
 
 
 class TestVariableStore(fixture.TestCase):
@@ -17,16 +21,16 @@ class TestVariableStore(fixture.TestCase):
         scope, var_name = self.get_scope(), 'foo'
         full_name = '/'.join([scope, var_name])
 
-        self.assertTrue(full_name not in _VARIABLES)
+        self.assertTrue(full_name not in _get_variables())
         with nn.variable_scope(scope, reuse=True):
             with self.assertRaises(ValueError):
                 nn.get_variable(var_name)
 
         with nn.variable_scope(scope, reuse=False):
             variable = nn.make_variable(var_name, shape=[3, 1])
-        self.assertTrue(full_name in _VARIABLES)
+        self.assertTrue(full_name in _get_variables())
 
-        self.assertIs(variable, _VARIABLES[full_name])
+        self.assertIs(variable, _get_variables()[full_name])
         with nn.variable_scope(scope, reuse=True):
             self.assertIs(variable, nn.get_variable(var_name))
 
@@ -65,3 +69,48 @@ class TestVariableStore(fixture.TestCase):
 
         with self.assertRaises(ValueError):
             nn.get_operation(name)
+
+    def test_namespace(self):
+        """Objects in different namespaces do not conflict"""
+        scope, name = self.get_scope(), 'foo'
+        with nn.variable_scope(scope):
+            with nn.namespace(scope):
+                input1 = nn.Input(shape=[], name=name)
+                self.assertEqual(nn.get_namespace(), scope)
+            self.assertEqual(nn.get_namespace(), '')
+            with self.assertRaises(ValueError):
+                nn.get_input(name)
+            input2 = nn.Input(shape=[], name=name)
+            self.assertIs(input2, nn.get_input(name))
+            with nn.namespace(scope):
+                self.assertIs(input1, nn.get_input(name))
+
+    def test_reset_namespace(self):
+        """Objects are removed from namespace"""
+        scope, name = self.get_scope(), 'foo'
+        with nn.variable_scope(scope):
+            with nn.namespace(scope):
+                nn.Input(shape=[], name=name)
+                nn.reset_namespace()
+                with self.assertRaises(ValueError):
+                    nn.get_input(name)
+                nn.Input(shape=[], name=name)
+                nn.release('input', '{}/{}'.format(scope, name))
+                with self.assertRaises(ValueError):
+                    nn.get_input(name)
+
+    def test_named_tensor_reference(self):
+        """Named Tensor is retrievable until it is released"""
+        scope, name = self.get_scope(), 'foo'
+
+        def _build():
+            fixture.create_ones_tensor([3, 1], 'float32', name=name)
+
+        with nn.variable_scope(scope):
+            _build()
+            gc.collect()
+            tensor = nn.get_tensor(name)
+            self.assertEqual(tensor.name, '{}/{}'.format(scope, name))
+            nn.release('tensor', tensor.name)
+            with self.assertRaises(ValueError):
+                nn.get_tensor(name)
@@ -1,10 +1,16 @@
 from __future__ import absolute_import
 
+import os
+import unittest
+
 import numpy as np
 
+import luchador
 from luchador import nn
 from tests.unit import fixture
 
+_BE = luchador.get_nn_backend()
+
 
 class SessionTest(fixture.TestCase):
     def _test_load_dataset(self, dtype1, dtype2):
@@ -37,6 +43,62 @@ class SessionTest(fixture.TestCase):
         """Variable value is set when data is downcasted"""
         self._test_load_dataset('float64', 'float32')
 
+    def test_load_from_file_prefix(self):
+        """Only variables under the given prefix are loaded from file"""
+        scope = self.get_scope()
+        with nn.variable_scope(scope):
+            with nn.variable_scope('a'):
+                var1 = nn.make_variable(name='w', shape=(3, 4))
+            with nn.variable_scope('b'):
+                var2 = nn.make_variable(name='w', shape=(3, 4))
+        value1 = np.ones((3, 4), dtype=var1.dtype)
+        value2 = 2 * np.ones((3, 4), dtype=var2.dtype)
+
+        output_dir = os.path.join('tmp', 'session_test')
+        saver = nn.Saver(output_dir, prefix='prefix')
+        filepath = saver.save({var1.name: value1, var2.name: value2}, 0)
+
+        session = nn.Session()
+        session.initialize()
+        session.load_from_file(filepath, prefix='{}/a'.format(scope))
+        val1, val2 = session.run(outputs=[var1, var2])
+        np.testing.assert_almost_equal(val1, value1)
+        self.assertFalse(np.allclose(val2, value2))
+
+    def test_load_from_file_sharded(self):
+        """Values are loaded from shards in parallel"""
+        with nn.variable_scope(self.get_scope()):
+            variables = [
+                nn.make_variable(name='w{}'.format(i), shape=(3, 4))
+                for i in range(3)]
+        values = [
+            i * np.ones((3, 4), dtype=var.dtype)
+            for i, var in enumerate(variables)]
+
+        output_dir = os.path.join('tmp', 'session_test')
+        saver = nn.Saver(output_dir, prefix='sharded', n_shards=2)
+        filepath = saver.save(
+            {var.name: val for var, val in zip(variables, values)}, 0)
+        saver.close()
+
+        session = nn.Session()
+        session.initialize()
+        session.load_from_file(filepath, n_workers=2)
+        for var, value in zip(variables, values):
+            np.testing.assert_almost_equal(session.run(outputs=var), value)
+
+    def test_load_dataset_same_backend(self):
+        """Filter layout is not converted when backend matches"""
+        with nn.variable_scope(self.get_scope()):
+            var = nn.make_variable(name='w', shape=(2, 3, 4, 5))
+        value = np.ones((4, 5, 3, 2), dtype=var.dtype)
+
+        session = nn.Session()
+        with self.assertRaises(ValueError):
+            session.load_dataset(
+                {var.name: value}, backend=luchador.get_nn_backend())
+
+    @unittest.skipIf(_BE == 'numpy', 'NumPy backend does not compute gradient')
     def test_apply_gradient_directory(self):
         """Variables can be updated by appyling gradient directly"""
         w_0 = 6
@@ -61,6 +123,7 @@ class SessionTest(fixture.TestCase):
 
             np.testing.assert_almost_equal(val_w, w_0 - val0)
 
+    @unittest.skipIf(_BE == 'numpy', 'NumPy backend does not compute gradient')
     def test_check_optimizer_slot(self):
         """Slot variables are updated when applying gradient directly"""
         name, b1_0, b2_0 = 'Adam', 0.5, 0.4
@@ -83,3 +146,46 @@ class SessionTest(fixture.TestCase):
             np.testing.assert_almost_equal(b1_val, b1_0 ** (i + 1))
             np.testing.assert_almost_equal(b2_val, b2_0 ** (i + 1))
             session.run(updates=update_op, givens={dw: 1.0})
+
+    def test_make_callable(self):
+        """Callable computes the same values as run"""
+        with nn.variable_scope(self.get_scope()):
+            x1 = nn.Input(shape=(), name='x1')
+            x2 = nn.Input(shape=(), name='x2')
+            w = nn.make_variable(
+                name='w', shape=(),
+                initializer=nn.initializer.ConstantInitializer(3))
+            y = w * x1 - x2
+            update_op = nn.ops.build_sync_op([y], [w])
+
+        session = nn.Session()
+        session.initialize()
+
+        func = session.make_callable(outputs=y, inputs=[x1, x2])
+        np.testing.assert_almost_equal(func(2, 1), 5)
+
+        func = session.make_callable(outputs=[y], inputs=[x1, x2])
+        np.testing.assert_almost_equal(func(2, 1)[0], 5)
+
+        func = session.make_callable(inputs=[x1, x2], updates=update_op)
+        func(2, 1)
+        np.testing.assert_almost_equal(session.run(outputs=w), 5)
+
+    def test_run_steps(self):
+        """run_steps returns per-step outputs and applies updates each step"""
+        with nn.variable_scope(self.get_scope()):
+            x = nn.Input(shape=(), name='x')
+            w = nn.make_variable(
+                name='w', shape=(),
+                initializer=nn.initializer.ConstantInitializer(1))
+            y = 2 * x
+            update_op = nn.ops.build_sync_op([w + x], [w])
+
+        session = nn.Session()
+        session.initialize()
+
+        values = np.asarray([1, 2, 3], dtype=x.dtype)
+        outputs = session.run_steps(
+            3, outputs=y, inputs={x: values}, updates=update_op)
+        np.testing.assert_almost_equal(outputs, 2 * values)
+        np.testing.assert_almost_equal(session.run(outputs=w), 7)
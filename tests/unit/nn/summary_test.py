@@ -3,7 +3,9 @@ from __future__ import absolute_import
 import os
 import numpy as np
 
+from luchador import nn
 from luchador.nn import SummaryWriter
+from tests.unit import fixture
 from tests.unit.fixture import TestCase
 
 OUTPUT_DIR = os.path.join('tmp', 'summary_writer_test')
@@ -96,3 +98,69 @@ class SummaryWriterTest(TestCase):
                 'test_stats_3': np.random.randn(100) + i,
             }
             writer.summarize_stats(global_step=i, dataset=dataset)
+
+    def test_background_summary(self):
+        """Summaries are written by background thread"""
+        output_dir = self._get_empty_dir()
+        writer = SummaryWriter(
+            output_dir, background=True, max_queue=4, flush_every=5)
+
+        for i in range(10):
+            writer.summarize(
+                summary_type='scalar', global_step=i,
+                dataset={'test_background': np.random.rand()})
+        writer.close()
+        self.assertEqual(writer.n_dropped, 0)
+        self.assertTrue(_list_files('', output_dir))
+
+    def test_registered_stats(self):
+        """Stats are accumulated and summarized"""
+        output_dir = self._get_empty_dir()
+        writer = SummaryWriter(output_dir)
+
+        writer.register_stats(['test_stats'], quantiles=[0.5, 0.9])
+        for i in range(10):
+            for _ in range(10):
+                writer.update_stats({'test_stats': np.random.randn() + i})
+            writer.summarize_registered_stats(global_step=i)
+        with self.assertRaises(KeyError):
+            writer.update_stats({'not_registered': 0})
+
+    def test_histogram_stats_summary(self):
+        """`summarize` function summarize histogram computed in graph"""
+        output_dir = self._get_empty_dir()
+        writer = SummaryWriter(output_dir)
+
+        for i in range(10):
+            values = i + np.random.randn(100)
+            counts, _ = np.histogram(values, bins=10)
+            stats = np.concatenate([[
+                values.min(), values.max(), values.size,
+                values.sum(), np.square(values).sum()], counts])
+            writer.summarize(
+                summary_type='histogram_stats', global_step=i,
+                dataset={'test_histogram_stats': stats})
+
+    def test_histogram_monitor(self):
+        """Histograms are fetched only at sampling steps"""
+        output_dir = self._get_empty_dir()
+        writer = SummaryWriter(output_dir)
+
+        with nn.variable_scope(self.get_scope()):
+            variable = fixture.create_random_variable(
+                shape=(8, 4), dtype='float32')
+            monitor = nn.HistogramMonitor(writer, interval=3, n_bins=5)
+            monitor.add({'test_monitor': variable})
+            tensor = nn.ops.reduce_sum(variable)
+
+        session = nn.Session()
+        session.initialize()
+        expected = session.run(outputs=variable).sum()
+        for i in range(10):
+            self.assertEqual(monitor.is_sampling_step(i), i % 3 == 0)
+            found = monitor.run(session, i, outputs=tensor)
+            np.testing.assert_almost_equal(found, expected, decimal=5)
+            found = monitor.run(session, i, outputs=[tensor])
+            self.assertEqual(len(found), 1)
+        writer.close()
+        self.assertTrue(_list_files('', output_dir))
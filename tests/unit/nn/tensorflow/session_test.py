@@ -0,0 +1,30 @@
+"""Test Tensorflow-specific Session features"""
+from __future__ import absolute_import
+
+import unittest
+
+import numpy as np
+
+import luchador
+from luchador import nn
+from tests.unit.fixture import TestCase
+
+_BE = luchador.get_nn_backend()
+
+
+@unittest.skipUnless(_BE == 'tensorflow', 'Tensorflow backend')
+class LoadDatasetTest(TestCase):
+    """Test loading values into Variables"""
+    def test_graph_does_not_grow(self):
+        """Repeated load_dataset does not add ops to graph"""
+        with nn.variable_scope(self.get_scope()):
+            var = nn.make_variable(name='w', shape=(3,), dtype='float32')
+
+        session = nn.Session()
+        session.load_dataset({var.name: np.zeros((3,), dtype='float32')})
+        n_ops = len(session.graph.get_operations())
+        for i in range(3):
+            value = i * np.ones((3,), dtype='float32')
+            session.load_dataset({var.name: value})
+            np.testing.assert_almost_equal(session.run(outputs=var), value)
+        self.assertEqual(len(session.graph.get_operations()), n_ops)
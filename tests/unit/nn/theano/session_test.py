@@ -0,0 +1,130 @@
+"""Test Theano-specific Session features"""
+from __future__ import absolute_import
+
+import os
+import unittest
+
+import numpy as np
+
+import luchador
+from luchador import nn
+from tests.unit.fixture import TestCase
+
+OUTPUT_DIR = os.path.join('tmp', 'theano_session_test')
+
+# pylint: disable=invalid-name
+
+
+def _remove_files(dir_name):
+    if not os.path.exists(dir_name):
+        return
+    for file_ in os.listdir(dir_name):
+        os.remove(os.path.join(dir_name, file_))
+
+
+@unittest.skipUnless(luchador.get_nn_backend() == 'theano', 'Theano backend')
+class FunctionCacheTest(TestCase):
+    """Test persistent function cache"""
+    def _get_empty_dir(self):
+        output_dir = os.path.join(OUTPUT_DIR, self.id().split('.')[-1])
+        _remove_files(output_dir)
+        return output_dir
+
+    def test_persistent_cache(self):
+        """Compiled function is stored and reused by another Session"""
+        cache_dir = self._get_empty_dir()
+        with nn.variable_scope(self.get_scope()):
+            x = nn.Input(shape=(), name='x')
+            w = nn.make_variable(
+                name='w', shape=(),
+                initializer=nn.initializer.ConstantInitializer(3))
+            y = w * x
+
+        session1 = nn.Session(function_cache_dir=cache_dir)
+        val1 = session1.run(outputs=y, inputs={x: 2}, name='mul')
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        session1.load_dataset({w.name: np.asarray(5, dtype=w.dtype)})
+        n_files = len(os.listdir(cache_dir))
+        session2 = nn.Session(function_cache_dir=cache_dir)
+        val2 = session2.run(outputs=y, inputs={x: 2}, name='mul')
+        self.assertEqual(len(os.listdir(cache_dir)), n_files)
+
+        np.testing.assert_almost_equal(val1, 6)
+        np.testing.assert_almost_equal(val2, 10)
+
+    def test_anonymous_cache(self):
+        """Un-named run is cached by identities of the given objects"""
+        with nn.variable_scope(self.get_scope()):
+            x = nn.Input(shape=(), name='x')
+            y1, y2 = 2 * x, 3 * x
+
+        session = nn.Session(function_cache_size=1)
+        for i in range(3):
+            val = session.run(outputs=y1, inputs={x: i})
+            np.testing.assert_almost_equal(val, 2 * i)
+        stats = session.function_cache_stats
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 2)
+
+        val = session.run(outputs=y2, inputs={x: 1})
+        np.testing.assert_almost_equal(val, 3)
+        stats = session.function_cache_stats
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_anonymous_cache_givens(self):
+        """Raw value in givens is keyed by content"""
+        with nn.variable_scope(self.get_scope()):
+            x = nn.Input(shape=(), name='x')
+            y = 2 * x
+
+        session = nn.Session()
+        value = np.asarray(1, dtype=x.dtype)
+        val = session.run(outputs=y, givens={x: value})
+        np.testing.assert_almost_equal(val, 2)
+
+        value[...] = 3
+        val = session.run(outputs=y, givens={x: value})
+        np.testing.assert_almost_equal(val, 6)
+        self.assertEqual(session.function_cache_stats['misses'], 2)
+
+        val = session.run(outputs=y, givens={x: value.copy()})
+        np.testing.assert_almost_equal(val, 6)
+        self.assertEqual(session.function_cache_stats['hits'], 1)
+
+
+@unittest.skipUnless(luchador.get_nn_backend() == 'theano', 'Theano backend')
+class LoadDatasetTest(TestCase):
+    """Test loading values into SharedVariables"""
+    def test_borrow(self):
+        """Variable shares memory with the given array when borrowed"""
+        with nn.variable_scope(self.get_scope()):
+            w1 = nn.make_variable(name='w1', shape=(3,), dtype='float32')
+            w2 = nn.make_variable(name='w2', shape=(3,), dtype='float32')
+        value = np.arange(3, dtype='float32')
+
+        session = nn.Session()
+        session.load_dataset({w1.name: value}, borrow=True)
+        session.load_dataset({w2.name: value}, borrow=False)
+
+        val1 = w1.unwrap().get_value(borrow=True)
+        val2 = w2.unwrap().get_value(borrow=True)
+        self.assertTrue(np.may_share_memory(val1, value))
+        self.assertFalse(np.may_share_memory(val2, value))
+        np.testing.assert_almost_equal(val2, value)
+
+    def test_read_only(self):
+        """Read-only array is copied even when borrowed"""
+        with nn.variable_scope(self.get_scope()):
+            w = nn.make_variable(name='w', shape=(3,), dtype='float32')
+        value = np.arange(3, dtype='float32')
+        value.flags.writeable = False
+
+        session = nn.Session()
+        session.load_dataset({w.name: value}, borrow=True)
+
+        val = w.unwrap().get_value(borrow=True)
+        self.assertTrue(val.flags.writeable)
+        self.assertFalse(np.may_share_memory(val, value))
+        np.testing.assert_almost_equal(val, value)
@@ -1,10 +1,15 @@
 """Test nn.util module"""
 from __future__ import absolute_import
 
+import unittest
+
+import luchador
 from luchador import nn
 from tests.unit import fixture
 
 
+@unittest.skipIf(luchador.get_nn_backend() == 'numpy',
+                 'NumPy backend does not compute gradient')
 class UtilTest(fixture.TestCase):
     """Test utility functions"""
     def test_apply_gradient_directory(self):
@@ -0,0 +1,48 @@
+"""Test luchador.util.lazy module"""
+from __future__ import absolute_import
+
+import sys
+import types
+import unittest
+
+from luchador.util import LazyModule
+
+
+class LazyModuleTest(unittest.TestCase):
+    def setUp(self):
+        self.original = types.ModuleType('lazy_test_module', 'Test module')
+        self.original.value = 1
+        self.module = LazyModule(self.original, {
+            'dumps': ('json', 'dumps'),
+            'json': ('json', None),
+            'missing': ('lazy_test_missing_module', None),
+        })
+
+    def test_attributes(self):
+        """Original attributes are retained"""
+        self.assertEqual(self.module.__name__, 'lazy_test_module')
+        self.assertEqual(self.module.__doc__, 'Test module')
+        self.assertEqual(self.module.value, 1)
+
+    def test_lazy_import(self):
+        """Attributes are imported on access and cached"""
+        self.assertNotIn('dumps', vars(self.module))
+        self.assertIs(self.module.dumps, sys.modules['json'].dumps)
+        self.assertIn('dumps', vars(self.module))
+        self.assertIs(self.module.json, sys.modules['json'])
+
+    def test_unknown_attribute(self):
+        """AttributeError is raised for unknown attribute"""
+        with self.assertRaises(AttributeError):
+            _ = self.module.unknown
+        self.assertFalse(hasattr(self.module, 'unknown'))
+
+    def test_import_error(self):
+        """ImportError from lazy import is not masked"""
+        with self.assertRaises(ImportError):
+            _ = self.module.missing
+
+    def test_dir(self):
+        """Lazy attributes are listed without importing"""
+        self.assertIn('dumps', dir(self.module))
+        self.assertNotIn('dumps', vars(self.module))
@@ -0,0 +1,43 @@
+"""Test luchador.util.mixin module"""
+from __future__ import absolute_import
+
+import abc
+import unittest
+
+from luchador.util import RegistryMixin
+
+# pylint: disable=too-few-public-methods
+
+
+class _Base(RegistryMixin):
+    pass
+
+
+class _Foo(_Base):
+    pass
+
+
+class RegistryMixinTest(unittest.TestCase):
+    def test_fetch_subclass(self):
+        """Subclasses are found by name"""
+        self.assertIs(_Base.fetch_subclass('_Foo'), _Foo)
+        self.assertIsNone(_Base.fetch_subclass('_Base'))
+        self.assertIsNone(_Foo.fetch_subclass('_Foo'))
+        self.assertIsNone(_Base.fetch_subclass('_Unknown'))
+
+    def test_new_subclass(self):
+        """Subclass defined after lookup is found"""
+        self.assertIsNone(_Base.fetch_subclass('_Bar'))
+
+        class _Bar(_Foo):
+            pass
+
+        self.assertIs(_Base.fetch_subclass('_Bar'), _Bar)
+        self.assertIs(_Foo.fetch_subclass('_Bar'), _Bar)
+
+    def test_descendant_preferred(self):
+        """Descendant is returned when names conflict"""
+        base = abc.ABCMeta('_Conflict', (_Base, ), {})
+        self.assertIs(_Base.fetch_subclass('_Conflict'), base)
+        derived = type('_Conflict', (base, ), {})
+        self.assertIs(_Base.fetch_subclass('_Conflict'), derived)
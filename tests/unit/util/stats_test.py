@@ -0,0 +1,41 @@
+"""Test luchador.util.stats module"""
+from __future__ import absolute_import
+
+import unittest
+
+import numpy as np
+
+from luchador.util import StreamingStats
+
+
+class StreamingStatsTest(unittest.TestCase):
+    def test_moments(self):
+        """Mean, variance, min and max match those of the whole values"""
+        values = 3 * np.random.randn(1000) + 1
+        stats = StreamingStats()
+        for chunk in np.array_split(values, 7):
+            stats.update(chunk)
+
+        self.assertEqual(stats.count, values.size)
+        np.testing.assert_almost_equal(stats.mean, values.mean())
+        np.testing.assert_almost_equal(stats.variance, values.var(ddof=1))
+        self.assertEqual(stats.min, values.min())
+        self.assertEqual(stats.max, values.max())
+
+    def test_quantile(self):
+        """Quantile estimates are close to the exact values"""
+        values = np.random.rand(10000)
+        stats = StreamingStats(quantiles=[0.1, 0.5, 0.9])
+        stats.update(values)
+        for p in [0.1, 0.5, 0.9]:
+            self.assertAlmostEqual(
+                stats.quantile(p), np.percentile(values, 100 * p), places=1)
+
+    def test_reset(self):
+        """Reset discards values"""
+        stats = StreamingStats()
+        stats.update([1, 2, 3])
+        stats.reset()
+        stats.update([5])
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(stats.summary()['P50'], 5)
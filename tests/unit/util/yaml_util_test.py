@@ -0,0 +1,149 @@
+"""Test luchador.util.yaml_util module"""
+from __future__ import absolute_import
+
+import os
+import unittest
+
+from luchador.util import yaml_util
+from luchador.util import (
+    load_config, clear_config_cache,
+    precompile_configs, load_precompiled_configs,
+)
+
+OUTPUT_DIR = os.path.join('tmp', 'yaml_util_test')
+if not os.path.exists(OUTPUT_DIR):
+    os.makedirs(OUTPUT_DIR)
+
+TEMPLATE = '''
+typename: Sequential
+args:
+  name: {name}
+  input_config:
+    typename: Input
+    args:
+      shape: {input_shape}
+      name: input_{name}
+  layer_configs:
+    - typename: Anonymous
+      args:
+        exp: one_hot(x, {n_classes})
+    - typename: Dense
+      args:
+        n_nodes: {n_classes}
+        initializers: {initializers}
+        with_bias: {with_bias}
+        scope: '{{literal}}'
+'''
+
+PARAMETERS = {
+    'name': 'model',
+    'input_shape': [None, 1, 28, 28],
+    'n_classes': 10,
+    'initializers': {'weight': {'typename': 'Xavier'}},
+    'with_bias': False,
+}
+
+# pylint: disable=protected-access
+
+
+def _write(filename, text):
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    with open(filepath, 'w') as file_:
+        file_.write(text)
+    return filepath
+
+
+def _load_by_text(text, **parameters):
+    """Load YAML by formatting text, as it was done without cache"""
+    return yaml_util._parse_yaml(text.format(**{
+        key: yaml_util._convert_to_str(val)
+        for key, val in parameters.items()
+    }))
+
+
+class LoadConfigTest(unittest.TestCase):
+    def setUp(self):
+        clear_config_cache()
+
+    def test_substitution(self):
+        """Parameters substituted on parsed tree equal to formatted text"""
+        filepath = _write('substitution.yml', TEMPLATE)
+        expected = _load_by_text(TEMPLATE, **PARAMETERS)
+        self.assertEqual(load_config(filepath, **PARAMETERS), expected)
+        self.assertEqual(
+            expected['args']['layer_configs'][0]['args']['exp'],
+            'one_hot(x, 10)')
+
+        parameters = dict(PARAMETERS, n_classes=3, input_shape='[null, 3]')
+        self.assertEqual(
+            load_config(filepath, **parameters),
+            _load_by_text(TEMPLATE, **parameters))
+
+    def test_quoted(self):
+        """Parameters in quoted and block scalars are not parsed"""
+        text = (
+            'a: "{x}"\n'
+            "b: 'foo_{x}'\n"
+            'c: {x}\n'
+            'd: |\n'
+            '  {x}\n'
+        )
+        filepath = _write('quoted.yml', text)
+        for value in ['5', None, 'null', 1.5, [1, 2]]:
+            expected = _load_by_text(text, x=value)
+            self.assertEqual(load_config(filepath, x=value), expected)
+        self.assertEqual(load_config(filepath, x='5')['a'], '5')
+
+    def test_none(self):
+        """None parameter is substituted as null on parsed tree"""
+        text = 'a: {x}\nb: [{x}]\nc: {{{x}: 1}}\nd: foo_{x}\ne: |\n  {x}\n'
+        filepath = _write('none.yml', text)
+        self.assertIsNotNone(yaml_util._tokenize(text))
+        self.assertEqual(
+            load_config(filepath, x=None), _load_by_text(text, x=None))
+
+    def test_partial(self):
+        """Parameter in longer string is parsed in the same way as text"""
+        text = 'name: pre_{n}\nexp: f(x, {n})\n'
+        filepath = _write('partial.yml', text)
+        for value in ['a #c', 'a, b', 3, 'a_b', '1e-05']:
+            self.assertEqual(
+                load_config(filepath, n=value), _load_by_text(text, n=value))
+        self.assertEqual(load_config(filepath, n='a #c')['name'], 'pre_a')
+
+    def test_missing_parameter(self):
+        """KeyError is raised when parameter is missing"""
+        filepath = _write('missing.yml', TEMPLATE)
+        with self.assertRaises(KeyError):
+            load_config(filepath, name='model')
+
+    def test_copy(self):
+        """Modifying the returned config does not affect cache"""
+        filepath = _write('copy.yml', TEMPLATE)
+        config = load_config(filepath, **PARAMETERS)
+        config['args']['layer_configs'].pop()
+        config = load_config(filepath, **PARAMETERS)
+        self.assertEqual(len(config['args']['layer_configs']), 2)
+
+    def test_modified_file(self):
+        """File is parsed again when modified"""
+        filepath = _write('modified.yml', 'value: {value}\n')
+        self.assertEqual(load_config(filepath, value=1), {'value': 1})
+        _write('modified.yml', 'values: [{value}]\n')
+        self.assertEqual(load_config(filepath, value=1), {'values': [1]})
+
+    def test_precompile(self):
+        """Precompiled configs are loaded without parsing YAML"""
+        filepath = _write('precompile.yml', TEMPLATE)
+        output = os.path.join(OUTPUT_DIR, 'configs.pkl')
+        expected = load_config(filepath, **PARAMETERS)
+        precompile_configs([filepath], output)
+        clear_config_cache()
+
+        self.assertEqual(load_precompiled_configs(output), 1)
+        parse_yaml = yaml_util._parse_yaml
+        try:
+            yaml_util._parse_yaml = None
+            self.assertEqual(load_config(filepath, **PARAMETERS), expected)
+        finally:
+            yaml_util._parse_yaml = parse_yaml
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Measure the time to load model configuration with and without cache
+
+For example,
+
+    python tool/benchmark/config_cache.py example/classification/model.yml \\
+        --param input_shape='[null, 1, 28, 28]' --n-loads 50
+
+loads the configuration with different values of ``--vary`` parameter,
+by formatting and parsing the whole text each time (the behavior before
+cache), with ``load_config`` and after loading precompiled configuration.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import os
+import time
+import argparse
+import tempfile
+
+from luchador.util import yaml_util
+
+# pylint: disable=protected-access
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('config', help='Model configuration YAML file.')
+    parser.add_argument(
+        '--param', action='append', default=[], metavar='KEY=VALUE',
+        help='Parameter to fill model configuration. Value is parsed as YAML.')
+    parser.add_argument(
+        '--vary', default='n_classes',
+        help='Parameter to which different integer is given in each load.')
+    parser.add_argument('--n-loads', type=int, default=50)
+    return parser.parse_args()
+
+
+def _load_by_text(filepath, **parameters):
+    with open(filepath, 'r') as file_:
+        text = file_.read()
+    return yaml_util._parse_yaml(text.format(**{
+        key: yaml_util._convert_to_str(val)
+        for key, val in parameters.items()
+    }))
+
+
+def _time(func, filepath, parameters, vary, n_loads):
+    t0 = time.time()
+    for i in range(n_loads):
+        parameters[vary] = i + 1
+        func(filepath, **parameters)
+    return time.time() - t0
+
+
+def _main():
+    args = _parse_args()
+    parameters = {}
+    for item in args.param:
+        key, value = item.split('=', 1)
+        parameters[key] = yaml_util._parse_yaml(value)
+
+    results = [('text', _time(
+        _load_by_text, args.config, parameters, args.vary, args.n_loads))]
+
+    yaml_util.clear_config_cache()
+    results.append(('load_config', _time(
+        yaml_util.load_config, args.config, parameters, args.vary,
+        args.n_loads)))
+
+    output = os.path.join(tempfile.mkdtemp(), 'configs.pkl')
+    yaml_util.precompile_configs([args.config], output)
+    yaml_util.clear_config_cache()
+    t0 = time.time()
+    yaml_util.load_precompiled_configs(output)
+    yaml_util.load_config(args.config, **parameters)
+    results.append(('precompiled (first load)', time.time() - t0))
+
+    for label, elapsed in results:
+        print('{:26s}: {:8.3f} [ms]'.format(label, 1e3 * elapsed))
+
+
+if __name__ == '__main__':
+    _main()
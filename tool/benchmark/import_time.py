@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Measure the time to import luchador modules and backends
+
+For example,
+
+    python tool/benchmark/import_time.py --repeat 5 --output import.json
+
+imports each target in fresh interpreter and reports the wall-clock time
+and, on Python 3.7+, the cumulative time reported by ``python -X importtime``
+with the slowest modules. Modules imported at interpreter startup, such as
+``site``, are excluded. Give the result of previous run with ``--baseline``
+to fail when import time regresses more than ``--tolerance``.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from collections import OrderedDict
+
+# Name: (statement, backend)
+TARGETS = OrderedDict([
+    ('luchador', ('import luchador', None)),
+    ('luchador.nn', ('import luchador.nn', None)),
+    ('luchador.nn/theano', (
+        'import luchador.nn; luchador.nn.Session', 'theano')),
+    ('luchador.nn/tensorflow', (
+        'import luchador.nn; luchador.nn.Session', 'tensorflow')),
+    ('luchador.nn/numpy', (
+        'import luchador.nn; luchador.nn.Session', 'numpy')),
+])
+
+_TIMER = (
+    'import time; _t0 = time.time(); {}; '
+    'import sys; sys.stdout.write(repr(time.time() - _t0))'
+)
+
+_IMPORTTIME = sys.version_info >= (3, 7)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--targets', nargs='+', choices=list(TARGETS),
+        default=list(TARGETS), help='Targets to measure.')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='Import each target this number of times and take the minimum.')
+    parser.add_argument(
+        '--top', type=int, default=5,
+        help='Number of the slowest modules to report for each target.')
+    parser.add_argument('--output', help='Write the result to JSON file.')
+    parser.add_argument(
+        '--baseline', help='JSON file written by previous run to compare.')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.2,
+        help='Allowed relative increase from baseline.')
+    return parser.parse_args()
+
+
+def _parse_importtime(stderr):
+    """Parse the output of ``-X importtime``
+
+    Returns
+    -------
+    list of tuple
+        Module name, cumulative time in second and whether the module is
+        imported at top level, that is, not by other module.
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((
+            name.strip(), int(cumulative) / 1e6, not name.startswith('  ')))
+    return modules
+
+
+def _measure(statement, backend):
+    env = dict(os.environ)
+    if backend:
+        env['LUCHADOR_NN_BACKEND'] = backend
+    command = [sys.executable]
+    if _IMPORTTIME:
+        command += ['-X', 'importtime']
+    command += ['-c', _TIMER.format(statement)]
+    process = subprocess.Popen(
+        command, env=env, universal_newlines=True,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError(stderr.strip().splitlines()[-1])
+    result = {'wall': float(stdout)}
+    if _IMPORTTIME:
+        result['modules'] = _parse_importtime(stderr)
+    return result
+
+
+def _run(name, repeat, top, startup):
+    statement, backend = TARGETS[name]
+    try:
+        results = [_measure(statement, backend) for _ in range(repeat)]
+    except RuntimeError as error:
+        print('{:24s} failed: {}'.format(name, error))
+        return None
+    best = min(results, key=lambda result: result['wall'])
+    line = '{:24s} wall: {:8.3f} [s]'.format(name, best['wall'])
+    if 'modules' in best:
+        excluded = set(item[0] for item in startup['modules'])
+        modules = [
+            item for item in best.pop('modules') if item[0] not in excluded]
+        best['cumulative'] = sum(
+            cumulative for _, cumulative, top_level in modules if top_level)
+        line += '  importtime: {:8.3f} [s]'.format(best['cumulative'])
+    else:
+        modules = []
+    print(line)
+    modules.sort(key=lambda item: item[1], reverse=True)
+    for module, cumulative, _ in modules[:top]:
+        print('    {:8.3f} [s]  {}'.format(cumulative, module))
+    return best
+
+
+def _compare(results, baseline, tolerance):
+    regressed = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['wall'] / baseline[name]['wall']
+        print('{:24s} {:+7.1%} from baseline'.format(name, ratio - 1))
+        if ratio > 1 + tolerance:
+            regressed.append(name)
+    return regressed
+
+
+def _main():
+    args = _parse_args()
+    startup = _measure('pass', None)
+    results = OrderedDict()
+    for name in args.targets:
+        result = _run(name, args.repeat, args.top, startup)
+        if result is not None:
+            results[name] = result
+
+    if args.output:
+        with open(args.output, 'w') as file_:
+            json.dump(results, file_, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file_:
+            baseline = json.load(file_)
+        regressed = _compare(results, baseline, args.tolerance)
+        if regressed:
+            print('Import time regressed: {}'.format(', '.join(regressed)))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    _main()
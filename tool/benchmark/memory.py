@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Measure memory usage while building models repeatedly in one process
+
+For example,
+
+    python tool/benchmark/memory.py --n-builds 50
+
+builds the same model in its own namespace again and again, discards the
+namespace with ``reset_namespace`` and reports resident set size (RSS) after
+each build. With ``--no-reset``, the namespaces are kept, which shows the
+growth caused by the objects retained in the store.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import gc
+import os
+import argparse
+import resource
+
+import luchador
+from luchador import nn
+
+MODEL = {
+    'typename': 'Sequential',
+    'args': {
+        'name': 'model',
+        'input_config': {
+            'typename': 'Input',
+            'args': {'shape': [None, 256], 'name': 'input'},
+        },
+        'layer_configs': [
+            {'typename': 'Dense', 'args': {
+                'n_nodes': 256, 'scope': 'layer{}/dense'.format(i)}}
+            for i in range(8)
+        ] + [{'typename': 'ReLU', 'args': {'scope': 'output'}}],
+    },
+}
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--n-builds', type=int, default=50)
+    parser.add_argument('--no-reset', action='store_true')
+    return parser.parse_args()
+
+
+def _get_rss():
+    """Get the current RSS in MB. Fall back to peak RSS off Linux"""
+    try:
+        with open('/proc/self/statm', 'r') as file_:
+            pages = int(file_.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (IOError, OSError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def _build(namespace):
+    with nn.namespace(namespace):
+        model = nn.make_model(MODEL)
+        session = nn.Session()
+        session.initialize()
+    return model
+
+
+def _reset_backend():
+    # Store does not own Tensorflow graph
+    if luchador.get_nn_backend() == 'tensorflow':
+        import tensorflow as tf
+        tf.reset_default_graph()
+
+
+def _main():
+    args = _parse_args()
+    rss = []
+    for i in range(args.n_builds):
+        namespace = 'build_{}'.format(i)
+        _build(namespace)
+        if not args.no_reset:
+            nn.reset_namespace(namespace)
+        _reset_backend()
+        gc.collect()
+        rss.append(_get_rss())
+        print('{:4d}: {:8.1f} [MB]'.format(i, rss[-1]))
+
+    half = len(rss) // 2
+    print('Growth over the last {} builds: {:.1f} [MB]'.format(
+        len(rss) - half, rss[-1] - rss[half]))
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Measure the time to look up Node classes when making model from config
+
+For example,
+
+    python tool/benchmark/registry.py --n-layers 300 --repeat 5
+
+makes Sequential model (without building graph) from configuration with
+the given number of layers, and compares the time spent on ``fetch_node``
+with the time of the recursive subclass scan which it replaced.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import time
+import argparse
+
+from luchador import nn
+from luchador.util import fetch_subclasses
+
+LAYERS = [
+    {'typename': 'Dense', 'args': {'n_nodes': 16}},
+    {'typename': 'ReLU', 'args': {}},
+    {'typename': 'BatchNormalization', 'args': {}},
+    {'typename': 'Conv2D', 'args': {
+        'n_filters': 16, 'filter_width': 3, 'filter_height': 3,
+        'strides': 1, 'padding': 'same'}},
+    {'typename': 'Flatten', 'args': {}},
+]
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--n-layers', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    return parser.parse_args()
+
+
+def _make_config(n_layers):
+    layer_configs = []
+    for i in range(n_layers):
+        config = dict(LAYERS[i % len(LAYERS)])
+        config['args'] = dict(config['args'], scope='layer{}'.format(i))
+        layer_configs.append(config)
+    return {
+        'typename': 'Sequential',
+        'args': {'layer_configs': layer_configs},
+    }
+
+
+def _scan(name):
+    for class_ in fetch_subclasses(nn.core.base.Node):
+        if class_.__name__ == name:
+            return class_
+    raise ValueError('Unknown Node: {}'.format(name))
+
+
+def _time(func, names, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.time()
+        for name in names:
+            func(name)
+        elapsed.append(time.time() - t0)
+    return min(elapsed)
+
+
+def _main():
+    args = _parse_args()
+    config = _make_config(args.n_layers)
+    names = [cfg['typename'] for cfg in config['args']['layer_configs']]
+
+    n_classes = len(fetch_subclasses(nn.core.base.Node))
+    print('{} lookups among {} Node classes'.format(len(names), n_classes))
+    for label, func in [('scan', _scan), ('registry', nn.fetch_node)]:
+        elapsed = _time(func, names, args.repeat)
+        print('  {:10s}: {:8.3f} [ms] ({:6.2f} [us] / lookup)'.format(
+            label, 1e3 * elapsed, 1e6 * elapsed / len(names)))
+
+    elapsed = []
+    for _ in range(args.repeat):
+        t0 = time.time()
+        nn.make_model(config)
+        elapsed.append(time.time() - t0)
+    print('make_model: {:8.3f} [ms]'.format(1e3 * min(elapsed)))
+
+
+if __name__ == '__main__':
+    _main()
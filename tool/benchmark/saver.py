@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Measure save/load throughput and file size of Saver for each policy
+
+For example,
+
+    python tool/benchmark/saver.py --model dqn --repeat 5
+
+reports the time to save and load parameters of DQN (with RMSProp slot
+variables) and the resulting file size, for layout and compression
+configurations listed in ``POLICIES``.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+from collections import OrderedDict
+
+import h5py
+import numpy as np
+
+from luchador.nn.saver import Saver
+# pylint: disable=protected-access
+from luchador.nn.core.base.session import _parse_dataset, _read_dataset
+
+MODELS = {
+    # Nature DQN with 18 actions
+    'dqn': OrderedDict([
+        ('conv1/weight', (32, 4, 8, 8)), ('conv1/bias', (32,)),
+        ('conv2/weight', (64, 32, 4, 4)), ('conv2/bias', (64,)),
+        ('conv3/weight', (64, 64, 3, 3)), ('conv3/bias', (64,)),
+        ('dense1/weight', (3136, 512)), ('dense1/bias', (512,)),
+        ('dense2/weight', (512, 18)), ('dense2/bias', (18,)),
+    ]),
+    # Multi layer perceptron with large hidden layers
+    'mlp': OrderedDict([
+        ('dense1/weight', (784, 4096)), ('dense1/bias', (4096,)),
+        ('dense2/weight', (4096, 4096)), ('dense2/bias', (4096,)),
+        ('dense3/weight', (4096, 10)), ('dense3/bias', (10,)),
+    ]),
+}
+
+
+def _compress_slots(key, _):
+    return {'compression': 'lzf'} if key.startswith('slot') else {}
+
+
+POLICIES = OrderedDict([
+    ('contiguous', {}),
+    ('lzf', {'compression': 'lzf'}),
+    ('lzf+shuffle', {'compression': 'lzf', 'shuffle': True}),
+    ('gzip-1', {'compression': 'gzip', 'compression_opts': 1}),
+    ('gzip-4+shuffle', {
+        'compression': 'gzip', 'compression_opts': 4, 'shuffle': True}),
+    ('lzf-slots-only', {'dataset_policy': _compress_slots}),
+])
+
+
+def _create_data(model, dtype, n_slots):
+    data = OrderedDict()
+    for key, shape in MODELS[model].items():
+        data[key] = np.random.randn(*shape).astype(dtype)
+        # Slot variables of adaptive optimizers are mostly small values
+        for i in range(n_slots):
+            slot = 1e-3 * np.random.randn(*shape) ** 2
+            data['slot{}/{}'.format(i, key)] = slot.astype(dtype)
+    return data
+
+
+def _load(filepath):
+    file_ = h5py.File(filepath, 'r')
+    try:
+        return {
+            key: np.array(_read_dataset(value))
+            for key, value in _parse_dataset(file_).items()
+        }
+    finally:
+        file_.close()
+
+
+def _benchmark(data, options, repeat):
+    output_dir = tempfile.mkdtemp()
+    try:
+        saver = Saver(output_dir, max_to_keep=repeat, **options)
+        t_save, t_load = 0, 0
+        for step in range(repeat):
+            t_start = time.time()
+            filepath = saver.save(data, global_step=step)
+            t_save += time.time() - t_start
+
+            t_start = time.time()
+            _load(filepath)
+            t_load += time.time() - t_start
+        return t_save / repeat, t_load / repeat, os.path.getsize(filepath)
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def _parse_command_line_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--model', choices=sorted(MODELS), default='dqn')
+    parser.add_argument('--dtype', default='float32')
+    parser.add_argument(
+        '--slots', type=int, default=2,
+        help='The number of optimizer slot variables per parameter.')
+    parser.add_argument('--repeat', type=int, default=3)
+    return parser.parse_args()
+
+
+def _main():
+    args = _parse_command_line_args()
+    data = _create_data(args.model, args.dtype, args.slots)
+    n_bytes = sum(value.nbytes for value in data.values())
+    print('Model: {}, {} arrays, {:.1f} MB'.format(
+        args.model, len(data), n_bytes / 2 ** 20))
+    print('{:<16} {:>10} {:>10} {:>10} {:>10}'.format(
+        'policy', 'save [s]', 'load [s]', 'size [MB]', 'ratio'))
+    for name, options in POLICIES.items():
+        t_save, t_load, size = _benchmark(data, options, args.repeat)
+        print('{:<16} {:>10.3f} {:>10.3f} {:>10.1f} {:>10.2f}'.format(
+            name, t_save, t_load, size / 2 ** 20, size / n_bytes))
+
+
+if __name__ == '__main__':
+    _main()
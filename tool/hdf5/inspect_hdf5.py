@@ -5,7 +5,7 @@ from __future__ import absolute_import
 
 import argparse
 
-from util import modify, visualize
+from util import convert, modify, visualize
 
 
 def _add_inspect_command(subparsers):
@@ -76,6 +76,43 @@ def _add_view_command(subparsers):
     parser.set_defaults(func=visualize.visualize_dataset)
 
 
+def _add_convert_command(subparsers):
+    parser = subparsers.add_parser(
+        'convert',
+        description=(
+            'Rewrite parameter file to the layout of another backend, '
+            'so that loading does not need to transform filters.'),
+    )
+    parser.add_argument('input_file', help='Input H5 file.')
+    parser.add_argument('output_file', help='Output H5 file.')
+    parser.add_argument(
+        '--backend', required=True, choices=['theano', 'tensorflow', 'numpy'],
+        help='Target backend.'
+    )
+    parser.add_argument(
+        '--conv-format', choices=['NCHW', 'NHWC'],
+        help=(
+            'Convolution format recorded in the output file. '
+            'Default: NHWC for tensorflow, NCHW otherwise.')
+    )
+    parser.add_argument(
+        '--filters', default=r'(^|/)filter$',
+        help=(
+            'Regular expression to select convolution filters to convert. '
+            'Other datasets are copied as they are. Default: names ending '
+            'with "filter"')
+    )
+    parser.add_argument(
+        '--source-backend', choices=['theano', 'tensorflow', 'numpy'],
+        help='Backend of input file. Required if not recorded in the file.'
+    )
+    parser.add_argument(
+        '--dry-run', '--dryrun', action='store_true',
+        help='Do not write the output file.'
+    )
+    parser.set_defaults(func=convert.convert)
+
+
 def _main():
     parser = argparse.ArgumentParser(
         description='Inspect HDF5 Data'
@@ -85,6 +122,7 @@ def _main():
     _add_delete_command(subparsers)
     _add_rename_command(subparsers)
     _add_view_command(subparsers)
+    _add_convert_command(subparsers)
     args = parser.parse_args()
     args.func(args)
 
@@ -0,0 +1,107 @@
+"""Convert parameter file to the layout of another backend"""
+from __future__ import print_function
+from __future__ import absolute_import
+
+import re
+
+import h5py
+import numpy as np
+
+from .common import load_hdf5
+
+# NumPy backend uses the filter layout of Theano backend
+_LAYOUTS = {'numpy': 'theano'}
+
+_META_DATA = [
+    'LUCHADOR_VERSION', 'LUCHADOR_NN_BACKEND',
+    'LUCHADOR_NN_CONV_FORMAT', 'LUCHADOR_NN_DTYPE',
+]
+
+
+def _get_meta(file_, key, default=None):
+    if key not in file_:
+        return default
+    value = np.asarray(file_[key]).tolist()
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _convert_filter(value, src_backend, tgt_backend):
+    """Convert 4D convolution filter between backends
+
+    Theano, NumPy: [#out-channel, #in-channel, height, width]
+    Tensorflow: [height, width, #in-channel, #out-channel]
+    Theano flips filters as it performs convolution, rather than correlation.
+    """
+    src_backend = _LAYOUTS.get(src_backend, src_backend)
+    tgt_backend = _LAYOUTS.get(tgt_backend, tgt_backend)
+    if src_backend == tgt_backend or not value.ndim == 4:
+        return value
+    if tgt_backend == 'tensorflow':
+        value = value.transpose((2, 3, 1, 0))[::-1, ::-1, :, :]
+    else:
+        value = value.transpose((3, 2, 0, 1))[:, :, ::-1, ::-1]
+    return np.ascontiguousarray(value)
+
+
+def _get_conv_format(backend):
+    return 'NHWC' if backend == 'tensorflow' else 'NCHW'
+
+
+def _walk(group, prefix=''):
+    for key, value in group.items():
+        path = '{}/{}'.format(prefix, key) if prefix else key
+        if isinstance(value, h5py.Group):
+            for item in _walk(value, path):
+                yield item
+        elif path not in _META_DATA:
+            yield path, value
+
+
+def convert(args):
+    """Rewrite parameters in HDF5 file to the layout of target backend
+
+    Datasets are read, converted and written one by one, so that memory
+    usage is bounded by the largest dataset. External links, such as the
+    ones created by incremental or sharded save, are resolved and the
+    resulting file contains plain datasets.
+
+    Only 4D datasets of which names match ``--filters`` are converted as
+    convolution filters.
+    """
+    conv_format = args.conv_format or _get_conv_format(args.backend)
+    pattern = re.compile(args.filters)
+    src_file = load_hdf5(args.input_file, 'r')
+    src_backend = args.source_backend or _get_meta(
+        src_file, 'LUCHADOR_NN_BACKEND')
+    if src_backend is None:
+        raise ValueError(
+            'Backend is not recorded in the input file. '
+            'Specify it with --source-backend.')
+
+    print('{}Converting {} ({}) -> {} ({}, {})'.format(
+        '(dryrun) ' if args.dry_run else '', args.input_file, src_backend,
+        args.output_file, args.backend, conv_format))
+    tgt_file = None if args.dry_run else load_hdf5(args.output_file, 'w')
+    for key, dataset in _walk(src_file):
+        value = dataset[()]
+        converted = value
+        if pattern.search(key):
+            converted = _convert_filter(value, src_backend, args.backend)
+        elif value.ndim == 4:
+            print('  {}: Skipped as it does not match --filters'.format(key))
+        if converted is not value:
+            print('  {}: {} -> {}'.format(key, value.shape, converted.shape))
+        if tgt_file is not None:
+            tgt_file.create_dataset(key, data=converted)
+
+    if tgt_file is not None:
+        tgt_file.create_dataset(
+            'LUCHADOR_NN_BACKEND', data=np.string_(args.backend), dtype='S10')
+        tgt_file.create_dataset(
+            'LUCHADOR_NN_CONV_FORMAT', data=np.string_(conv_format),
+            dtype='S4')
+        for key in ['LUCHADOR_NN_DTYPE', 'LUCHADOR_VERSION']:
+            if key in src_file:
+                tgt_file.create_dataset(key, data=src_file[key][()])
+        tgt_file.close()
+    src_file.close()